@@ -0,0 +1,263 @@
+"""Micro-benchmarks for hot player, enemy, asset, UI and save paths.
+
+Usage::
+
+    python -m benchmarks.bench_micro [--quick] [--only NAME ...]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import tempfile
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pygame
+
+from .common import Result, enter_overworld, make_game, measure
+
+DT = 1.0 / 60
+
+
+@contextlib.contextmanager
+def _save_dir(path: str) -> Iterator[None]:
+    """Point ``rpg.save`` at ``path`` so benchmarks never touch the real slots."""
+
+    from rpg import save
+
+    saved = save.SAVE_DIR, save.INDEX_PATH, save.LEGACY_SAVE_PATHS
+    save.SAVE_DIR = path
+    save.INDEX_PATH = os.path.join(path, "index.json")
+    save.LEGACY_SAVE_PATHS = ()
+    try:
+        yield
+    finally:
+        save.SAVE_DIR, save.INDEX_PATH, save.LEGACY_SAVE_PATHS = saved
+
+
+def _crowd(scene, count: int, spread: float = 40.0) -> List:
+    """Put ``count`` unkillable enemies in a ring just around the player."""
+
+    from rpg.enemy import Enemy
+
+    centre = scene.player.pos
+    enemies = []
+    for i in range(count):
+        offset = pygame.Vector2(spread, 0).rotate(360.0 * i / max(1, count))
+        enemy = Enemy(centre + offset, hp=10**9)
+        scene.enemies.add(enemy)
+        enemies.append(enemy)
+    scene.enemy_index.rebuild(scene.enemies)
+    return enemies
+
+
+# ----------------------------------------------------------------------
+def bench_player_move_axis(game, scale: int) -> Result:
+    scene = enter_overworld(game, enemies=0)
+    player, solids = scene.player, scene.solids
+    start = pygame.Vector2(player.pos)
+    player.vel = pygame.Vector2(170.0, 120.0)
+
+    def step() -> None:
+        player.pos.update(start)
+        player._move_axis(DT, solids, axis="x")
+        player._move_axis(DT, solids, axis="y")
+
+    return measure(step, number=200 * scale)
+
+
+def bench_player_update_hitboxes(game, scale: int) -> Result:
+    scene = enter_overworld(game, enemies=0)
+    _crowd(scene, 24)
+    player = scene.player
+
+    def swing() -> None:
+        player._hitboxes.clear()
+        player._spawn_attack_hitbox()
+        player._update_hitboxes(DT * 1000.0, scene.enemy_index)
+
+    return measure(swing, number=50 * scale)
+
+
+def bench_player_animation(game, scale: int) -> Result:
+    """Animation step while hurt and mid-swing: flash tint plus sword overlay."""
+
+    scene = enter_overworld(game, enemies=0)
+    player = scene.player
+    player.state = "attack"
+
+    def step() -> None:
+        player._hurt_timer = 1.0
+        player._update_animation(DT)
+
+    return measure(step, number=500 * scale)
+
+
+def bench_enemy_update(game, scale: int) -> Result:
+    """One tick of 100 enemies chasing the player; milliseconds per tick."""
+
+    scene = enter_overworld(game, enemies=100)
+    enemies = list(scene.enemies)
+    for enemy in enemies:
+        enemy.detection_radius = 10**6
+    player, solids, bounds = scene.player, scene.solids, scene.world.bounds
+
+    def tick() -> None:
+        for enemy in enemies:
+            enemy.update(DT, player, solids, bounds)
+
+    return measure(tick, number=5 * scale)
+
+
+def bench_load_sheet_cold(game, scale: int) -> Result:
+    """PNG decode and slicing, with the baked asset cache switched off."""
+
+    from rpg import bake, utils
+
+    path = os.path.join("assets", "desert-shooter", "PNG", "Players", "Tilemap", "tilemap_packed.png")
+
+    def load() -> None:
+        utils._frame_atlas.clear()
+        utils.load_sheet(path, (24, 24), scale=2.0)
+
+    bake.enabled = False
+    try:
+        return measure(load, number=2 * scale)
+    finally:
+        bake.enabled = True
+        utils._frame_atlas.clear()
+
+
+def bench_load_sheet_baked(game, scale: int) -> Result:
+    """The same sheet served from a freshly baked cache, whatever is in ``assets/``."""
+
+    import tempfile
+
+    from rpg import bake, utils
+
+    path = os.path.join("assets", "desert-shooter", "PNG", "Players", "Tilemap", "tilemap_packed.png")
+
+    def load() -> None:
+        utils._frame_atlas.clear()
+        utils.load_sheet(path, (24, 24), scale=2.0)
+
+    saved = bake.CACHE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        bake.CACHE_PATH = os.path.join(tmp, "baked.bin")
+        try:
+            bake.bake(bake.CACHE_PATH)
+            return measure(load, number=2 * scale)
+        finally:
+            bake.CACHE_PATH = saved
+            bake.reset()
+            utils._frame_atlas.clear()
+
+
+def bench_load_sheet_warm(game, scale: int) -> Result:
+    from rpg import utils
+
+    path = os.path.join("assets", "desert-shooter", "PNG", "Players", "Tilemap", "tilemap_packed.png")
+    return measure(lambda: utils.load_sheet(path, (24, 24), scale=2.0), number=500 * scale)
+
+
+def bench_hud_draw(game, scale: int) -> Result:
+    """Steady state: nothing on the panel changes between frames."""
+
+    from rpg.ui import HudRenderer
+
+    scene = enter_overworld(game, enemies=0)
+    hud = HudRenderer()
+    return measure(lambda: hud.draw(game.screen, scene.player, 0.0), number=100 * scale)
+
+
+def bench_hud_draw_changing(game, scale: int) -> Result:
+    """The player's HP changes every frame, so the panel is recomposed each call."""
+
+    from rpg.ui import HudRenderer
+
+    scene = enter_overworld(game, enemies=0)
+    hud = HudRenderer()
+    player = scene.player
+
+    def draw() -> None:
+        player.hp = player.max_hp - (player.hp % 50 + 1)
+        hud.draw(game.screen, player, 0.0)
+
+    return measure(draw, number=50 * scale)
+
+
+def bench_inventory_draw(game, scale: int) -> Result:
+    from rpg.ui import InventoryOverlay
+
+    scene = enter_overworld(game, enemies=0)
+    overlay = InventoryOverlay()
+    player = scene.player
+    return measure(lambda: overlay.draw(game.screen, player.inventory, player.gold), number=50 * scale)
+
+
+def bench_save_game(game, scale: int) -> Result:
+    from rpg.save import save_game
+
+    enter_overworld(game, enemies=0)
+    with tempfile.TemporaryDirectory() as tmp, _save_dir(tmp):
+        return measure(lambda: save_game(game.state), number=5 * scale)
+
+
+def bench_load_game(game, scale: int) -> Result:
+    from rpg.player import Player
+    from rpg.save import load_game, save_game
+
+    enter_overworld(game, enemies=0)
+    with tempfile.TemporaryDirectory() as tmp, _save_dir(tmp):
+        save_game(game.state)
+        factory = lambda who: Player((0, 0), who=who)  # noqa: E731
+        return measure(lambda: load_game(game.state, factory), number=50 * scale)
+
+
+BENCHMARKS: Dict[str, Callable[[object, int], Result]] = {
+    "player_move_axis": bench_player_move_axis,
+    "player_update_hitboxes": bench_player_update_hitboxes,
+    "player_animation": bench_player_animation,
+    "enemy_update_x100": bench_enemy_update,
+    "load_sheet_cold": bench_load_sheet_cold,
+    "load_sheet_baked": bench_load_sheet_baked,
+    "load_sheet_warm": bench_load_sheet_warm,
+    "hud_draw": bench_hud_draw,
+    "hud_draw_changing": bench_hud_draw_changing,
+    "inventory_draw": bench_inventory_draw,
+    "save_game": bench_save_game,
+    "load_game": bench_load_game,
+}
+
+
+def run(quick: bool = False, only: Optional[List[str]] = None) -> Dict[str, Result]:
+    game = make_game()
+    scale = 1 if quick else 5
+    results = {}
+    for name, bench in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        results[f"micro.{name}"] = bench(game, scale)
+    game.saver.close()
+    return results
+
+
+def report(results: Dict[str, Result]) -> None:
+    print(f"{'benchmark':<40} {'median ms':>10} {'min ms':>10} {'stdev':>8}")
+    for name, row in results.items():
+        print(f"{name:<40} {row['median_ms']:>10.4f} {row['min_ms']:>10.4f} {row['stdev_ms']:>8.4f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_micro", description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer calls per sample")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run just these benchmarks")
+    args = parser.parse_args(argv)
+
+    report(run(args.quick, args.only))
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+"""Save encode/decode and write/read throughput: legacy JSON versus the binary format.
+
+Usage::
+
+    python -m benchmarks.bench_save [--iterations 2000] [--owned 10]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from rpg import savefmt
+from rpg.inventory import ITEM_LIBRARY
+from rpg.save import write_atomic
+
+
+def sample_save(owned: int) -> dict:
+    """A representative current-version save dict."""
+
+    items = sorted(ITEM_LIBRARY)[:owned]
+    return {
+        "map": "overworld",
+        "pos": [2660.874838503127, 769.4418336447544],
+        "hp": 100,
+        "stamina": 105.0,
+        "who": "CHA",
+        "level": 12,
+        "xp": 311,
+        "xp_to_next": 1455,
+        "stat_points": 5,
+        "skill_points": 1,
+        "gold": 48210,
+        "inventory": {"owned": items, "equipped": {"weapon": items[0]} if items else {}},
+        "unlocked": {f"gate_{i}": True for i in range(8)},
+    }
+
+
+def _rate(fn: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed else float("inf")
+
+
+def run(iterations: int, owned: int) -> Dict[str, Dict[str, float]]:
+    data = sample_save(owned)
+    codecs = {
+        "json": (
+            lambda d: json.dumps(d, indent=2).encode("utf-8"),
+            savefmt.loads,
+        ),
+        "binary": (lambda d: savefmt.dumps(d, compress=False), savefmt.loads),
+        "binary+zlib": (lambda d: savefmt.dumps(d, compress=True), savefmt.loads),
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (encode, decode) in codecs.items():
+            blob = encode(data)
+            assert decode(blob) == data, name
+            path = os.path.join(tmp, f"{name}.sav")
+            write_atomic(path, blob)
+
+            def read_back(path: str = path) -> dict:
+                with open(path, "rb") as f:
+                    return decode(f.read())
+
+            # Disk round trips are fsync-bound; run fewer of them.
+            disk_iterations = max(1, iterations // 20)
+            results[name] = {
+                "bytes": len(blob),
+                "encode_per_sec": _rate(lambda: encode(data), iterations),
+                "decode_per_sec": _rate(lambda: decode(blob), iterations),
+                "save_per_sec": _rate(lambda: write_atomic(path, encode(data)), disk_iterations),
+                "load_per_sec": _rate(read_back, iterations),
+            }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_save", description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--owned", type=int, default=len(ITEM_LIBRARY), help="inventory items in the sample save")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations, args.owned)
+    print(f"{'format':<12} {'bytes':>6} {'encode/s':>10} {'decode/s':>10} {'save/s':>8} {'load/s':>8}")
+    for name, row in results.items():
+        print(
+            f"{name:<12} {row['bytes']:>6} {row['encode_per_sec']:>10.0f} {row['decode_per_sec']:>10.0f} "
+            f"{row['save_per_sec']:>8.0f} {row['load_per_sec']:>8.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Macro scenarios: whole overworld ticks at increasing enemy counts.
+
+Each tick is ``game.step`` followed by ``scene.draw`` and ``game.present``,
+driven by the headless patrol script. Update and draw are reported separately.
+
+Usage::
+
+    python -m benchmarks.bench_scenes [--quick] [--counts 10 100 1000 10000] [--swarm]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence
+
+import pygame
+
+from .common import Result, enter_overworld, make_game, summarize
+
+COUNTS = (10, 100, 1000, 10000)
+DT = 1.0 / 60
+
+
+def run_overworld(game, enemies: int, ticks: int, swarm: bool = False, warmup: int = 10) -> Dict[str, Result]:
+    from rpg.headless import ScriptedInput
+
+    enter_overworld(game, enemies=enemies, swarm=swarm)
+    script = ScriptedInput.patrol(warmup + ticks)
+    update, draw = [], []
+    for tick in range(warmup + ticks):
+        t0 = time.perf_counter()
+        game.step(DT, script.events(tick), script.keys(tick))
+        t1 = time.perf_counter()
+        game.present(game.scene.draw(game.screen))
+        t2 = time.perf_counter()
+        if tick >= warmup:
+            update.append((t1 - t0) * 1000.0)
+            draw.append((t2 - t1) * 1000.0)
+    return {
+        "update": summarize(update),
+        "draw": summarize(draw),
+        "frame": summarize([u + d for u, d in zip(update, draw)]),
+    }
+
+
+def run(quick: bool = False, counts: Sequence[int] = COUNTS, swarm: bool = False) -> Dict[str, Result]:
+    game = make_game()
+    results = {}
+    kinds = ("sprites", "swarm") if swarm else ("sprites",)
+    for count in counts:
+        # Keep the big hordes to a bounded wall-clock time.
+        ticks = max(10, (60 if quick else 300) // max(1, count // 1000))
+        for kind in kinds:
+            phases = run_overworld(game, count, ticks, swarm=kind == "swarm")
+            for phase, result in phases.items():
+                results[f"macro.overworld_{kind}_{count}.{phase}"] = result
+    game.saver.close()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .bench_micro import report
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_scenes", description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer ticks per scenario")
+    parser.add_argument("--counts", type=int, nargs="+", default=list(COUNTS), help="enemy counts to run")
+    parser.add_argument("--swarm", action="store_true", help="also run each count as a NumPy EnemySwarm")
+    args = parser.parse_args(argv)
+
+    report(run(args.quick, args.counts, args.swarm))
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""Cold start: per-import cost and time to the menu's first frame.
+
+Every sample is a fresh interpreter run with ``-X importtime`` that imports
+``rpg.game``, builds the ``Game`` and presents the menu once. The overworld
+is then entered, to show what the deferred imports cost on first use.
+
+Usage::
+
+    python -m benchmarks.bench_startup [--quick] [--imports 15]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .common import Result, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the menu should not need; reported if they show up before the first frame.
+DEFERRED = ("rpg.scenes.overworld", "rpg.player", "rpg.enemy", "rpg.ui", "rpg.inventory", "PIL")
+
+_CHILD = """
+import sys, time
+spawned = float(sys.argv[1])
+t0 = time.perf_counter()
+import rpg.game
+t1 = time.perf_counter()
+game = rpg.game.Game()
+t2 = time.perf_counter()
+game.present(game.scene.draw(game.screen))
+t3 = time.perf_counter()
+first_frame = time.time() - spawned
+loaded = sorted(sys.modules)
+from rpg.player import Player
+from rpg.scenes.overworld import SceneOverworld
+game.state.player = Player((game.screen.get_width() // 2, game.screen.get_height() // 2))
+game.change(SceneOverworld(game), name="overworld", autosave=False)
+game.present(game.scene.draw(game.screen))
+t4 = time.perf_counter()
+import json, pygame
+game.saver.close()
+pygame.quit()
+print(json.dumps({
+    "first_frame": first_frame * 1000.0,
+    "import": (t1 - t0) * 1000.0,
+    "game_init": (t2 - t1) * 1000.0,
+    "first_draw": (t3 - t2) * 1000.0,
+    "enter_overworld": (t4 - t3) * 1000.0,
+    "loaded": loaded,
+}))
+"""
+
+# import time: self [us] | cumulative | imported package
+Import = Tuple[str, int, float, float]
+
+
+def _parse_importtime(stderr: str) -> List[Import]:
+    """(module, depth, self ms, cumulative ms) for each line ``-X importtime`` wrote."""
+
+    rows: List[Import] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(own) / 1000.0, int(cumulative) / 1000.0))
+    return rows
+
+
+def sample() -> Tuple[Dict[str, object], List[Import]]:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (ROOT, env.get("PYTHONPATH"))))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, repr(time.time())],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("startup sample failed:\n" + "\n".join(errors[-10:]))
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    return timings, _parse_importtime(proc.stderr)
+
+
+def run(quick: bool = False, samples: Optional[int] = None) -> Dict[str, Result]:
+    return measure_startup(samples or (3 if quick else 10))[0]
+
+
+def measure_startup(samples: int) -> Tuple[Dict[str, Result], List[Import], List[str]]:
+    """Results per phase, the per-import rows and loaded modules of the median-time sample."""
+
+    runs = [sample() for _ in range(samples)]
+    results = {}
+    for phase in ("first_frame", "import", "game_init", "first_draw", "enter_overworld"):
+        results[f"startup.{phase}"] = summarize([timings[phase] for timings, _ in runs])
+    typical = sorted(runs, key=lambda run: run[0]["first_frame"])[len(runs) // 2]
+    return results, typical[1], typical[0]["loaded"]
+
+
+def report_imports(imports: List[Import], loaded: List[str], limit: int) -> None:
+    """Slowest game modules and top-level packages imported before the menu's first frame."""
+
+    menu = set(loaded)
+    print(f"\n{'import (before the first frame)':<40} {'self ms':>10} {'cumul ms':>10}")
+    shown = [row for row in imports if row[0] in menu and (row[0].startswith("rpg") or "." not in row[0])]
+    for name, _, own, cumulative in sorted(shown, key=lambda row: -row[3])[:limit]:
+        print(f"{name:<40} {own:>10.2f} {cumulative:>10.2f}")
+    eager = [name for name in DEFERRED if name in menu]
+    rpg = sum(1 for name in loaded if name == "rpg" or name.startswith("rpg."))
+    print(f"[info] {rpg} rpg modules loaded for the menu; deferred modules loaded early: {', '.join(eager) or 'none'}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .bench_micro import report
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup", description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer interpreter launches")
+    parser.add_argument("--imports", type=int, default=15, help="how many imports to list, slowest first")
+    args = parser.parse_args(argv)
+
+    results, imports, loaded = measure_startup(3 if args.quick else 10)
+    report(results)
+    report_imports(imports, loaded, args.imports)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""Shared fixtures and timing for the benchmark suites."""
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+Result = Dict[str, float]
+
+
+def headless() -> None:
+    """Point SDL at its dummy drivers; call before the first ``pygame.init``."""
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def make_game():
+    from rpg.game import Game
+
+    headless()
+    return Game()
+
+
+def enter_overworld(game, enemies: Optional[int] = None, swarm: bool = False):
+    """A fresh player in a new overworld with ``enemies`` enemies, without autosaving."""
+
+    from rpg.constants import HEIGHT, WIDTH
+    from rpg.player import Player
+    from rpg.scenes.overworld import SceneOverworld
+
+    game.state.player = Player((WIDTH // 2, HEIGHT // 2))
+    scene = SceneOverworld(game, enemy_count=enemies, swarm=swarm)
+    game.change(scene, name="overworld", autosave=False)
+    return scene
+
+
+def summarize(samples_ms: List[float]) -> Result:
+    return {
+        "median_ms": statistics.median(samples_ms),
+        "mean_ms": statistics.fmean(samples_ms),
+        "min_ms": min(samples_ms),
+        "stdev_ms": statistics.stdev(samples_ms) if len(samples_ms) > 1 else 0.0,
+        "samples": len(samples_ms),
+    }
+
+
+def measure(fn: Callable[[], object], *, number: int = 1, repeat: int = 7, warmup: int = 1) -> Result:
+    """Time ``repeat`` samples of ``number`` calls; results are milliseconds per call."""
+
+    for _ in range(warmup * number):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000.0 / number)
+    result = summarize(samples)
+    result["number"] = number
+    return result
+
+
+def environment() -> Dict[str, str]:
+    import platform
+
+    info = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    try:
+        import numpy
+
+        info["numpy"] = numpy.__version__
+    except ImportError:
+        pass
+    return info
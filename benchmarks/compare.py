@@ -0,0 +1,84 @@
+"""Compare a benchmark report against a stored baseline and flag regressions.
+
+Usage::
+
+    python -m benchmarks.compare bench_results.json [--baseline benchmarks/baseline.json] [--threshold 0.15]
+
+Exits with status 1 when any benchmark's median (or ``--metric``) is more
+than ``threshold`` slower than the baseline, so it can gate CI. Baselines are
+machine-local and not committed (timings only compare on the hardware that
+recorded them); with none recorded yet the exit status is 2.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+METRICS = ("median_ms", "min_ms", "mean_ms")
+
+Row = Tuple[str, Optional[float], Optional[float], Optional[float], str]
+
+
+def load(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    return report.get("results", {})
+
+
+def compare(
+    current: Dict[str, dict], baseline: Dict[str, dict], threshold: float, metric: str = "median_ms"
+) -> List[Row]:
+    """One row per benchmark: name, baseline ms, current ms, relative change, verdict."""
+
+    rows: List[Row] = []
+    for name in sorted(set(current) | set(baseline)):
+        if name not in baseline:
+            rows.append((name, None, current[name][metric], None, "new"))
+            continue
+        if name not in current:
+            rows.append((name, baseline[name][metric], None, None, "missing"))
+            continue
+        before, after = baseline[name][metric], current[name][metric]
+        change = (after - before) / before if before else 0.0
+        if change > threshold:
+            verdict = "REGRESSION"
+        elif change < -threshold:
+            verdict = "faster"
+        else:
+            verdict = "ok"
+        rows.append((name, before, after, change, verdict))
+    return rows
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.4f}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description=__doc__.splitlines()[0])
+    parser.add_argument("results", help="report written by python -m benchmarks.run")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--metric", choices=METRICS, default="median_ms", help="statistic to compare")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown as a fraction (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.baseline):
+        print(f"[warn] no baseline at {args.baseline}; record one with python -m benchmarks.run --output {args.baseline}")
+        return 2
+    rows = compare(load(args.results), load(args.baseline), args.threshold, args.metric)
+    print(f"{'benchmark':<40} {'baseline':>10} {'current':>10} {'change':>8}  verdict")
+    for name, before, after, change, verdict in rows:
+        delta = "-" if change is None else f"{change * 100:+.1f}%"
+        print(f"{name:<40} {_ms(before):>10} {_ms(after):>10} {delta:>8}  {verdict}")
+    regressions = sum(1 for row in rows if row[4] == "REGRESSION")
+    if regressions:
+        print(f"[warn] {regressions} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+"""Run the micro and macro suites and write the results as JSON.
+
+Usage::
+
+    python -m benchmarks.run [--suite all|micro|macro|startup] [--quick] [--output results.json]
+    python -m benchmarks.run --output benchmarks/baseline.json   # record a new baseline
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional
+
+import pygame
+
+from . import bench_micro, bench_scenes, bench_startup
+from .common import Result, environment
+
+
+def run(suite: str = "all", quick: bool = False, swarm: bool = False) -> Dict[str, object]:
+    results: Dict[str, Result] = {}
+    if suite in ("all", "micro"):
+        results.update(bench_micro.run(quick))
+    if suite in ("all", "macro"):
+        results.update(bench_scenes.run(quick, swarm=swarm))
+    if suite in ("all", "startup"):
+        results.update(bench_startup.run(quick))
+    return {"version": 1, "meta": dict(environment(), suite=suite, quick=quick), "results": results}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=("all", "micro", "macro", "startup"), default="all")
+    parser.add_argument("--quick", action="store_true", help="fewer samples; for smoke runs, not baselines")
+    parser.add_argument("--swarm", action="store_true", help="also run the macro scenarios as an EnemySwarm")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON report")
+    args = parser.parse_args(argv)
+
+    report = run(args.suite, args.quick, args.swarm)
+    bench_micro.report(report["results"])
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"[info] wrote {len(report['results'])} results to {args.output}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,14 @@
+import sys
+
 from rpg.game import Game
 
+
+def _option(name):
+    args = sys.argv[1:]
+    if name in args and args.index(name) + 1 < len(args):
+        return args[args.index(name) + 1]
+    return None
+
+
 if __name__ == "__main__":
-    Game().run()
+    Game(dirty_rects="--dirty-rects" in sys.argv[1:], record=_option("--record")).run()
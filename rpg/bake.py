@@ -0,0 +1,262 @@
+"""Offline asset bake: pre-sliced, pre-scaled frames in one memory-mapped file.
+
+Usage::
+
+    python -m rpg.bake            # decode every sheet, tile and GIF into assets/baked.bin
+    python -m rpg.bake --check    # list entries whose source files changed since the bake
+
+The file is a small header, a JSON index and raw pixel rows::
+
+    magic "RPGA" | version u32 | index length u64 | index (JSON) | pixels
+
+Each index entry names its source files (with mtime and size), the images
+it stores and the frames cut from them. The loaders in :mod:`rpg.utils` and
+:mod:`rpg.sprites` ask :func:`lookup` first. Images are wrapped straight
+around the mapping with no decode or copy. An entry whose sources changed,
+or a cache from another bake version, is ignored and the asset is decoded
+live as before.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pygame
+
+CACHE_PATH = os.path.join("assets", "baked.bin")
+MAGIC = b"RPGA"
+VERSION = 1
+HEADER = struct.Struct("<4sIQ")
+# Byte order of the stored pixels; matches what convert_alpha() produces here,
+# so blits from mapped images need no conversion.
+PIXEL_FORMAT = "BGRA"
+_ALIGN = 16
+
+# Everything the game loads, at the scales it asks for.
+DESERT_ROOT = Path("assets") / "desert-shooter" / "PNG"
+DESERT_CATEGORIES = ("Players", "Enemies", "Tiles", "Interface")
+DESERT_SCALES = (2.0,)
+GIF_ROOT = Path("assets") / "sprites"
+GIF_SCALES = (1.0,)
+
+
+def _norm(path) -> str:
+    return Path(os.fspath(path)).as_posix()
+
+
+def sheet_key(path, tile_size: Sequence[int], scale: float, spacing: int = 0, margin: int = 0) -> str:
+    return f"sheet:{_norm(path)}:{tile_size[0]}x{tile_size[1]}:{float(scale)}:{spacing}:{margin}"
+
+
+def tile_key(path, scale: float) -> str:
+    return f"tile:{_norm(path)}:{float(scale)}"
+
+
+def gif_key(path, scale: float) -> str:
+    return f"gif:{_norm(path)}:{float(scale)}"
+
+
+def _stamp(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+# ----------------------------------------------------------------------
+# Runtime
+class AssetCache:
+    """A baked cache file mapped into memory (copy-on-write, so frames stay writable)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_len = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError("not a baked asset cache")
+        if version != VERSION:
+            raise ValueError(f"bake version {version}, this build reads {VERSION}")
+        start = HEADER.size
+        index = json.loads(bytes(self._map[start : start + index_len]).decode("utf-8"))
+        self._data = _aligned(start + index_len)
+        self.entries: Dict[str, dict] = index["entries"]
+        self.format = index.get("format", PIXEL_FORMAT)
+        self._view = memoryview(self._map)
+        self.hits = 0
+        self.misses = 0
+
+    def is_fresh(self, key: str) -> bool:
+        entry = self.entries.get(key)
+        return entry is not None and all(_stamp(path) == stamp for path, stamp in entry["sources"].items())
+
+    def frames(self, key: str) -> Optional[List[pygame.Surface]]:
+        if not self.is_fresh(key):
+            self.misses += 1
+            return None
+        entry = self.entries[key]
+        images = []
+        for offset, width, height in entry["images"]:
+            start = self._data + offset
+            buffer = self._view[start : start + width * height * 4]
+            images.append(pygame.image.frombuffer(buffer, (width, height), self.format))
+        frames = []
+        for image_index, x, y, width, height in entry["frames"]:
+            image = images[image_index]
+            if (x, y, width, height) == (0, 0, *image.get_size()):
+                frames.append(image)
+            else:
+                frames.append(image.subsurface((x, y, width, height)))
+        self.hits += 1
+        return frames
+
+    def stale(self) -> List[str]:
+        return [key for key in self.entries if not self.is_fresh(key)]
+
+
+# Set to False to always decode from the source files (benchmarks of the cold path).
+enabled = True
+_cache: Optional[AssetCache] = None
+_opened = False
+_warned_stale = False
+
+
+def lookup(key: str) -> Optional[List[pygame.Surface]]:
+    """Baked frames for ``key``, or ``None`` when there is no fresh entry."""
+
+    global _cache, _opened, _warned_stale
+    if not enabled:
+        return None
+    if not _opened:
+        _opened = True
+        if os.path.isfile(CACHE_PATH):
+            try:
+                _cache = AssetCache(CACHE_PATH)
+            except (OSError, ValueError, KeyError) as exc:
+                print(f"[warn] ignoring baked assets at {CACHE_PATH}: {exc}")
+    if _cache is None:
+        return None
+    frames = _cache.frames(key)
+    if frames is None and key in _cache.entries and not _warned_stale:
+        _warned_stale = True
+        print(f"[warn] baked assets are stale ({key.split(':')[1]} changed); rerun python -m rpg.bake")
+    return frames
+
+
+def reset() -> None:
+    """Forget the open cache so the next :func:`lookup` reopens it (after a bake)."""
+
+    global _cache, _opened, _warned_stale
+    _cache = None
+    _opened = False
+    _warned_stale = False
+
+
+# ----------------------------------------------------------------------
+# Baking
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _jobs() -> Iterator[Tuple[str, str, Callable[[], Sequence[pygame.Surface]]]]:
+    """(key, source path, decoder) for every asset the game loads."""
+
+    from .sprites import _decode_gif
+    from .utils import _decode_sheet, _decode_tile
+
+    for category in DESERT_CATEGORIES:
+        sheet = DESERT_ROOT / category / "Tilemap" / "tilemap_packed.png"
+        for scale in DESERT_SCALES:
+            if sheet.is_file():
+                yield sheet_key(sheet, (24, 24), scale), str(sheet), lambda p=sheet, s=scale: _decode_sheet(p, (24, 24), scale=s)
+            tiles = DESERT_ROOT / category / "Tiles"
+            for tile in sorted(tiles.glob("tile_*.png")) if tiles.is_dir() else ():
+                yield tile_key(tile, scale), str(tile), lambda p=tile, s=scale: [_decode_tile(p, s)]
+    for gif in sorted(GIF_ROOT.rglob("*.gif")) if GIF_ROOT.is_dir() else ():
+        for scale in GIF_SCALES:
+            yield gif_key(gif, scale), str(gif), lambda p=gif, s=scale: _decode_gif(str(p), s)
+
+
+def _pack(frames: Sequence[pygame.Surface], pixels: bytearray) -> Tuple[list, list]:
+    """Append the images behind ``frames`` to ``pixels``; shared atlas sheets go in once."""
+
+    images: list = []
+    placed: Dict[int, int] = {}
+    out_frames: list = []
+    for frame in frames:
+        owner = frame.get_abs_parent()
+        if id(owner) not in placed:
+            placed[id(owner)] = len(images)
+            offset = _aligned(len(pixels))
+            pixels.extend(b"\0" * (offset - len(pixels)))
+            pixels.extend(pygame.image.tobytes(owner, PIXEL_FORMAT))
+            images.append([offset, owner.get_width(), owner.get_height()])
+        x, y = frame.get_abs_offset()
+        out_frames.append([placed[id(owner)], x, y, frame.get_width(), frame.get_height()])
+    return images, out_frames
+
+
+def bake(path: str = CACHE_PATH) -> Dict[str, int]:
+    """Decode every asset and write the cache file atomically; returns counts."""
+
+    from .save import write_atomic
+
+    entries: Dict[str, dict] = {}
+    pixels = bytearray()
+    for key, source, decode in _jobs():
+        stamp = _stamp(source)
+        if stamp is None:
+            continue
+        images, frames = _pack(decode(), pixels)
+        entries[key] = {"sources": {source: stamp}, "images": images, "frames": frames}
+    index = json.dumps({"format": PIXEL_FORMAT, "entries": entries}, separators=(",", ":")).encode("utf-8")
+    header = HEADER.pack(MAGIC, VERSION, len(index))
+    padding = b"\0" * (_aligned(len(header) + len(index)) - len(header) - len(index))
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_atomic(path, header + index + padding + bytes(pixels))
+    reset()
+    return {"entries": len(entries), "bytes": len(header) + len(index) + len(padding) + len(pixels)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m rpg.bake", description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=CACHE_PATH, help="cache file to write")
+    parser.add_argument("--check", action="store_true", help="report stale entries instead of baking")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    # convert_alpha() in the decoders needs a display surface.
+    pygame.display.set_mode((1, 1))
+    if args.check:
+        try:
+            stale = AssetCache(args.output).stale()
+        except (OSError, ValueError, KeyError) as exc:
+            print(f"[warn] no usable cache at {args.output}: {exc}")
+            return 1
+        for key in stale:
+            print(f"stale: {key}")
+        print(f"[info] {len(stale)} stale entries")
+        return 1 if stale else 0
+    start = time.perf_counter()
+    counts = bake(args.output)
+    print(
+        f"[info] baked {counts['entries']} entries ({counts['bytes'] / 1048576:.1f} MiB) "
+        f"to {args.output} in {time.perf_counter() - start:.2f}s"
+    )
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,351 @@
+"""Monte Carlo balance simulator: thousands of abstracted careers of hunts and gate clears.
+
+Usage::
+
+    python -m rpg.balance [--runs 2000] [--minutes 120] [--workers 4] [--seed 1] [--json report.json]
+
+Each run is one career of ``--minutes`` game time. Careers alternate
+overworld hunts with dungeon gates and shop between activities. They use the
+real :class:`Player` (damage, level-ups, regeneration, purchases),
+:class:`Enemy` (HP, damage, attack cooldown), :class:`Leveling`,
+:class:`Inventory` and :class:`Gate` objects, and the same stat rolls as the
+scenes. Movement and targeting are abstracted. Travel is distance over
+``PLAYER_SPEED``. In a fight, swings on both sides connect with a fixed
+probability.
+
+Runs are spread over a ``ProcessPoolExecutor``. Every run seeds its own RNG
+from ``--seed`` and its index, so a report does not depend on ``--workers``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence
+
+import pygame
+
+from .constants import ATTACK_LOCK_MS, CHAR_CHA, CHAR_JINWOO, DEATH_GOLD_PENALTY, GATE_FAIL_GOLD_PENALTY, PLAYER_SPEED
+from .rng import reseed
+
+# Enemies per gate, as placed by SceneDungeon._spawn_enemies.
+DUNGEON_ENEMIES = 4
+REST_STEP = 1.0
+
+
+@dataclass(frozen=True)
+class SimConfig:
+    minutes: float = 120.0
+    who: str = CHAR_JINWOO
+    hunts_per_gate: int = 4
+    accuracy: float = 0.75  # share of the player's swings that connect
+    dodge: float = 0.5  # share of enemy swings the player avoids
+    reaction: float = 0.15  # seconds between swings on top of the attack lock
+    travel: Sequence[float] = (250.0, 900.0)  # pixels walked to the next overworld enemy
+    gate_travel: float = 1200.0  # pixels walked to a gate
+    rest_below: float = 0.5  # rest back to full HP when an activity ends below this share
+    shop: bool = True
+
+
+class Career:
+    """One simulated player, from a fresh character to ``config.minutes`` of play."""
+
+    def __init__(self, config: SimConfig, rng: random.Random) -> None:
+        from .player import Player
+
+        self.config = config
+        self.rng = rng
+        self.player = Player((0, 0), who=config.who)
+        self.clock = 0.0
+        self.xp = 0
+        self.kills = 0
+        self.deaths = 0
+        self.gold_earned = 0
+        self.gold_lost = 0
+        self.gates_cleared = 0
+        self.gates_failed = 0
+        self.level_times: Dict[int, float] = {}
+        self.purchases: Dict[str, float] = {}
+
+    def run(self) -> dict:
+        limit = self.config.minutes * 60.0
+        hunts = 0
+        while self.clock < limit:
+            if hunts >= self.config.hunts_per_gate:
+                self.gate()
+                hunts = 0
+            else:
+                self.hunt()
+                hunts += 1
+            if self.player.hp < self.player.max_hp * self.config.rest_below:
+                self.rest()
+            if self.config.shop:
+                self.shop()
+        return {
+            "level": self.player.leveling.level,
+            "xp": self.xp,
+            "gold_earned": self.gold_earned,
+            "gold_lost": self.gold_lost,
+            "gold_end": self.player.gold,
+            "kills": self.kills,
+            "deaths": self.deaths,
+            "gates_cleared": self.gates_cleared,
+            "gates_failed": self.gates_failed,
+            "minutes": self.clock / 60.0,
+            "level_times": self.level_times,
+            "purchases": self.purchases,
+        }
+
+    # ------------------------------------------------------------------
+    def hunt(self) -> None:
+        from .enemy import Enemy, overworld_enemy_stats
+
+        self.walk(self.rng.uniform(*self.config.travel))
+        if not self.fight([Enemy((0, 0), **overworld_enemy_stats(self.rng))]):
+            self.defeated(DEATH_GOLD_PENALTY)
+
+    def gate(self) -> None:
+        from .enemy import Enemy, dungeon_enemy_stats
+        from .gate import Gate, roll_gate_level
+
+        level = roll_gate_level(self.rng, self.player.leveling.level)
+        gate = Gate((0, 0, 140, 160), req_level=level, allow_under=True)
+        self.walk(self.config.gate_travel)
+        # The whole room aggroes at once, as it does in SceneDungeon.
+        if not self.fight([Enemy((0, 0), **dungeon_enemy_stats(index)) for index in range(DUNGEON_ENEMIES)]):
+            self.defeated(GATE_FAIL_GOLD_PENALTY)
+            self.gates_failed += 1
+            return
+        reward = gate.reward_gold()
+        self.player.earn_gold(reward)
+        self.gold_earned += reward
+        gate.mark_cleared()
+        self.gates_cleared += 1
+
+    def fight(self, enemies: list) -> bool:
+        """Trade blows with ``enemies`` until they or the player drop; True when the player wins.
+
+        The player strikes one enemy at a time while all of them swing on
+        their own cooldowns. Hit and hurt timers only tick in ``update()``,
+        which a fight never runs, so they are cleared here and the player's
+        invulnerability window is tracked against the fight clock instead.
+        """
+
+        player, rng, config = self.player, self.rng, self.config
+        swing = ATTACK_LOCK_MS / 1000.0 + config.reaction
+        player_next = config.reaction
+        enemy_next = [0.0] * len(enemies)
+        invulnerable_until = 0.0
+        alive = list(range(len(enemies)))
+        now = 0.0
+        while alive and player.alive:
+            attacker = min(alive, key=enemy_next.__getitem__)
+            if player_next <= enemy_next[attacker]:
+                now = player_next
+                target = enemies[alive[0]]
+                if rng.random() < config.accuracy:
+                    target._hurt_block = 0.0
+                    target.take_damage(player.attack_damage)
+                    if not target.alive:
+                        alive.pop(0)
+                        self.reward(target, self.clock + now)
+                player_next += swing
+            else:
+                now = enemy_next[attacker]
+                enemy = enemies[attacker]
+                if now >= invulnerable_until and rng.random() >= config.dodge:
+                    player.take_damage(enemy.attack_damage)
+                    invulnerable_until = now + player._invuln_timer
+                    player._invuln_timer = 0.0
+                enemy_next[attacker] += enemy._attack_cooldown
+        self.clock += now
+        if player.alive:
+            player._recover_resources(now)
+        return player.alive
+
+    def reward(self, enemy, at: float) -> None:
+        """Credit a kill made at career time ``at`` (mid-fight, ``clock`` lags behind)."""
+
+        self.kills += 1
+        self.xp += enemy.xp_reward
+        leveling = self.player.leveling
+        before = leveling.level
+        if leveling.gain_xp(enemy.xp_reward):
+            self.player.on_level_up()
+            for level in range(before + 1, leveling.level + 1):
+                self.level_times[level] = at
+
+    def defeated(self, penalty_share: float) -> None:
+        penalty = int(self.player.gold * penalty_share)
+        self.player.gold = max(0, self.player.gold - penalty)
+        self.gold_lost += penalty
+        self.deaths += 1
+        self.player.revive(full_heal=True)
+
+    def walk(self, distance: float) -> None:
+        seconds = distance / PLAYER_SPEED
+        self.clock += seconds
+        self.player._recover_resources(seconds)
+
+    def rest(self) -> None:
+        player = self.player
+        while player.hp < player.max_hp:
+            self.clock += REST_STEP
+            player._recover_resources(REST_STEP)
+
+    def shop(self) -> None:
+        """Buy the cheapest affordable item that beats what is equipped in its slot."""
+
+        player = self.player
+        equipped = player.inventory.equipped()
+        for item in sorted(player.inventory.catalogue(), key=lambda item: item.price):
+            if player.inventory.is_owned(item.id) or item.price > player.gold:
+                continue
+            current = equipped.get(item.slot)
+            if current is not None and current.price >= item.price:
+                continue
+            if player.try_purchase(item.id):
+                player.equip_item(item.id)
+                self.purchases[item.id] = self.clock
+                return
+
+
+# ----------------------------------------------------------------------
+# Workers
+def _init_worker() -> None:
+    # Player and Enemy load their sprites, which needs a (dummy) display.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+def _simulate(config: SimConfig, seed: int, first: int, count: int) -> List[dict]:
+    results = []
+    for index in range(first, first + count):
+        rng = random.Random(f"{seed}:{index}")
+        # Gate rewards come from the shared gameplay streams.
+        reseed(rng.getrandbits(32))
+        results.append(Career(config, rng).run())
+    return results
+
+
+def simulate(config: SimConfig, runs: int, seed: int = 1, workers: Optional[int] = None) -> List[dict]:
+    """Run ``runs`` careers, in parallel unless ``workers`` is 1, in index order."""
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker()
+        return _simulate(config, seed, 0, runs)
+    chunk = max(1, runs // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(_simulate, config, seed, first, min(chunk, runs - first)) for first in range(0, runs, chunk)
+        ]
+        return [career for future in futures for career in future.result()]
+
+
+# ----------------------------------------------------------------------
+# Report
+def _distribution(values: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    if len(ordered) > 1:
+        deciles = statistics.quantiles(ordered, n=10, method="inclusive")
+        p10, p50, p90 = deciles[0], deciles[4], deciles[8]
+    else:
+        p10 = p50 = p90 = ordered[0]
+    return {"mean": statistics.fmean(ordered), "p10": p10, "p50": p50, "p90": p90, "min": ordered[0], "max": ordered[-1]}
+
+
+def aggregate(careers: List[dict]) -> dict:
+    hours = [career["minutes"] / 60.0 for career in careers]
+    scalars = {
+        "level": [career["level"] for career in careers],
+        "xp_per_hour": [career["xp"] / h for career, h in zip(careers, hours)],
+        "gold_per_hour": [career["gold_earned"] / h for career, h in zip(careers, hours)],
+        "gold_lost_per_hour": [career["gold_lost"] / h for career, h in zip(careers, hours)],
+        "gold_end": [career["gold_end"] for career in careers],
+        "deaths_per_hour": [career["deaths"] / h for career, h in zip(careers, hours)],
+        "gate_clear_rate": [
+            career["gates_cleared"] / max(1, career["gates_cleared"] + career["gates_failed"]) for career in careers
+        ],
+    }
+    report = {"runs": len(careers), "distributions": {name: _distribution(values) for name, values in scalars.items()}}
+
+    levels = sorted({level for career in careers for level in career["level_times"]})
+    report["time_to_level"] = {
+        level: dict(
+            reached=sum(1 for career in careers if level in career["level_times"]) / len(careers),
+            **_distribution([career["level_times"][level] / 60.0 for career in careers if level in career["level_times"]]),
+        )
+        for level in levels
+    }
+    items = sorted({item for career in careers for item in career["purchases"]})
+    report["purchases"] = {
+        item: dict(
+            bought=sum(1 for career in careers if item in career["purchases"]) / len(careers),
+            **_distribution([career["purchases"][item] / 60.0 for career in careers if item in career["purchases"]]),
+        )
+        for item in items
+    }
+    return report
+
+
+def print_report(report: dict, config: SimConfig, elapsed: float) -> None:
+    print(f"[info] {report['runs']} careers of {config.minutes:g} min as {config.who} in {elapsed:.1f}s")
+    print(f"\n{'metric':<22} {'mean':>9} {'p10':>9} {'p50':>9} {'p90':>9}")
+    for name, row in report["distributions"].items():
+        print(f"{name:<22} {row['mean']:>9.2f} {row['p10']:>9.2f} {row['p50']:>9.2f} {row['p90']:>9.2f}")
+    print(f"\n{'time to level (min)':<22} {'reached':>9} {'p10':>9} {'p50':>9} {'p90':>9}")
+    for level, row in report["time_to_level"].items():
+        print(f"{'level ' + str(level):<22} {row['reached']:>8.0%} {row['p10']:>9.1f} {row['p50']:>9.1f} {row['p90']:>9.1f}")
+    print(f"\n{'first purchase (min)':<22} {'bought':>9} {'p10':>9} {'p50':>9} {'p90':>9}")
+    for item, row in report["purchases"].items():
+        print(f"{item:<22} {row['bought']:>8.0%} {row['p10']:>9.1f} {row['p50']:>9.1f} {row['p90']:>9.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m rpg.balance", description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000, help="number of careers to simulate")
+    parser.add_argument("--minutes", type=float, default=SimConfig.minutes, help="game time per career")
+    parser.add_argument("--who", choices=(CHAR_JINWOO, CHAR_CHA), default=CHAR_JINWOO)
+    parser.add_argument("--hunts-per-gate", type=int, default=SimConfig.hunts_per_gate)
+    parser.add_argument("--accuracy", type=float, default=SimConfig.accuracy, help="share of player swings that hit")
+    parser.add_argument("--dodge", type=float, default=SimConfig.dodge, help="share of enemy swings avoided")
+    parser.add_argument("--no-shop", action="store_true", help="never buy equipment")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="also write the aggregated report as JSON")
+    args = parser.parse_args(argv)
+    # Either bound would leave one side unable to take damage, so a fight never ends.
+    if not 0.0 < args.accuracy <= 1.0:
+        parser.error("--accuracy must be in (0, 1]")
+    if not 0.0 <= args.dodge < 1.0:
+        parser.error("--dodge must be in [0, 1)")
+
+    config = SimConfig(
+        minutes=args.minutes,
+        who=args.who,
+        hunts_per_gate=args.hunts_per_gate,
+        accuracy=args.accuracy,
+        dodge=args.dodge,
+        shop=not args.no_shop,
+    )
+    start = time.perf_counter()
+    report = aggregate(simulate(config, args.runs, args.seed, args.workers))
+    print_report(report, config, time.perf_counter() - start)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": asdict(config), "seed": args.seed, **report}, f, indent=2)
+        print(f"[info] wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
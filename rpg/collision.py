@@ -0,0 +1,276 @@
+"""Static collision geometry baked into a tile-resolution grid."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import pygame
+
+from .utils import iter_sprites_rects
+
+Cell = Tuple[int, int]
+
+
+class SolidGrid:
+    """Uniform grid of wall rects answering AABB queries in local time.
+
+    Each cell records which walls cover it, so a mover only looks at the walls
+    under its own rect instead of every wall in the scene. Candidates come back
+    in insertion order, which keeps push-out identical to a linear scan.
+    """
+
+    def __init__(self, cell_size: int = 48) -> None:
+        self.cell_size = int(cell_size)
+        self._rects: List[pygame.Rect] = []
+        self._cells: Dict[Cell, List[int]] = {}
+
+    @classmethod
+    def from_rects(cls, rects: Iterable[pygame.Rect], cell_size: int = 48) -> "SolidGrid":
+        grid = cls(cell_size)
+        for rect in rects:
+            grid.add(rect)
+        return grid
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __iter__(self) -> Iterator[pygame.Rect]:
+        return iter(self._rects)
+
+    # ------------------------------------------------------------------
+    def add(self, rect: pygame.Rect) -> None:
+        rect = pygame.Rect(rect)
+        index = len(self._rects)
+        self._rects.append(rect)
+        for cell in self._cells_under(rect):
+            self._cells.setdefault(cell, []).append(index)
+
+    def _cells_under(self, rect: pygame.Rect) -> Iterator[Cell]:
+        size = self.cell_size
+        x0, y0 = rect.left // size, rect.top // size
+        x1, y1 = (rect.right - 1) // size, (rect.bottom - 1) // size
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def candidates(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Walls sharing a cell with ``rect``, in insertion order."""
+
+        cells = self._cells
+        found: set[int] = set()
+        for cell in self._cells_under(rect):
+            indices = cells.get(cell)
+            if indices:
+                found.update(indices)
+        if not found:
+            return []
+        return [self._rects[i] for i in sorted(found)]
+
+    def query(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Walls actually overlapping ``rect``."""
+
+        return [wall for wall in self.candidates(rect) if rect.colliderect(wall)]
+
+    def is_solid(self, x: float, y: float) -> bool:
+        size = self.cell_size
+        indices = self._cells.get((int(x) // size, int(y) // size))
+        if not indices:
+            return False
+        return any(self._rects[i].collidepoint(x, y) for i in indices)
+
+
+def wall_candidates(collision, rect: pygame.Rect, offset: float, axis: str) -> List[pygame.Rect]:
+    """Walls a mover at ``rect`` may be pushed against after moving ``offset``.
+
+    ``collision`` is either a :class:`SolidGrid` or a legacy group of sprites
+    with rects. The grid lookup is widened by the step so walls reached while
+    being pushed back along the axis are still considered.
+    """
+
+    if isinstance(collision, SolidGrid):
+        reach = int(abs(offset)) + 1
+        area = rect.inflate(reach * 2, 0) if axis == "x" else rect.inflate(0, reach * 2)
+        return collision.candidates(area)
+    return list(iter_sprites_rects(collision))
+
+
+class SpatialHash:
+    """Per-frame uniform grid of moving entities keyed by their ``pos``.
+
+    Rebuilt once per frame by the owning scene. Entities are expected to expose
+    ``pos`` and ``rect`` (anchored at the rect's mid-bottom, as Player/Enemy do).
+    Indexes of entities that stay put can instead be kept with :meth:`insert`
+    and :meth:`discard`.
+    """
+
+    def __init__(self, cell_size: int = 96) -> None:
+        self.cell_size = int(cell_size)
+        self._cells: Dict[Cell, list] = {}
+        self._count = 0
+        self._bounds: Tuple[int, int, int, int] = (0, 0, -1, -1)
+        self._half_w = 0
+        self._height = 0
+        self.max_radius = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator:
+        for bucket in self._cells.values():
+            yield from bucket
+
+    # ------------------------------------------------------------------
+    def rebuild(self, entities: Iterable) -> None:
+        size = self.cell_size
+        cells: Dict[Cell, list] = {}
+        count = 0
+        half_w = height = 0
+        max_radius = 0.0
+        min_x = min_y = max_x = max_y = 0
+        for entity in entities:
+            if not getattr(entity, "alive", True):
+                continue
+            pos = entity.pos
+            cell = (int(pos.x) // size, int(pos.y) // size)
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [entity]
+            else:
+                bucket.append(entity)
+            if count == 0:
+                min_x = max_x = cell[0]
+                min_y = max_y = cell[1]
+            else:
+                min_x, max_x = min(min_x, cell[0]), max(max_x, cell[0])
+                min_y, max_y = min(min_y, cell[1]), max(max_y, cell[1])
+            count += 1
+            entity_size = getattr(entity, "size", None)
+            if entity_size is not None:
+                half_w = max(half_w, int(entity_size.x) // 2 + 1)
+                height = max(height, int(entity_size.y) + 1)
+            max_radius = max(max_radius, float(getattr(entity, "radius", 0.0)))
+        self._cells = cells
+        self._count = count
+        self._bounds = (min_x, min_y, max_x, max_y)
+        self._half_w = half_w
+        self._height = height
+        self.max_radius = max_radius
+
+    def insert(self, entity) -> None:
+        """Add one entity; it must not move until it is discarded again."""
+
+        size = self.cell_size
+        pos = entity.pos
+        cell = (int(pos.x) // size, int(pos.y) // size)
+        self._cells.setdefault(cell, []).append(entity)
+        if self._count == 0:
+            self._bounds = (cell[0], cell[1], cell[0], cell[1])
+        else:
+            min_x, min_y, max_x, max_y = self._bounds
+            self._bounds = (min(min_x, cell[0]), min(min_y, cell[1]), max(max_x, cell[0]), max(max_y, cell[1]))
+        self._count += 1
+        entity_size = getattr(entity, "size", None)
+        if entity_size is not None:
+            self._half_w = max(self._half_w, int(entity_size.x) // 2 + 1)
+            self._height = max(self._height, int(entity_size.y) + 1)
+        self.max_radius = max(self.max_radius, float(getattr(entity, "radius", 0.0)))
+
+    def discard(self, entity) -> bool:
+        """Remove an entity added with :meth:`insert`; ``False`` if it was not indexed."""
+
+        size = self.cell_size
+        cell = (int(entity.pos.x) // size, int(entity.pos.y) // size)
+        bucket = self._cells.get(cell)
+        if not bucket or entity not in bucket:
+            return False
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[cell]
+        self._count -= 1
+        return True
+
+    # ------------------------------------------------------------------
+    def query_rect(self, rect: pygame.Rect) -> list:
+        """Live entities whose ``rect`` overlaps ``rect``."""
+
+        if not self._count:
+            return []
+        size = self.cell_size
+        # An overlapping entity's anchor lies within the query grown by its extents.
+        x0 = (rect.left - self._half_w) // size
+        x1 = (rect.right + self._half_w) // size
+        y0 = rect.top // size
+        y1 = (rect.bottom + self._height) // size
+        cells = self._cells
+        found = []
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    if getattr(entity, "alive", True) and rect.colliderect(entity.rect):
+                        found.append(entity)
+        return found
+
+    def nearest(
+        self,
+        pos: pygame.Vector2,
+        k: int = 1,
+        max_distance: float | None = None,
+    ) -> list:
+        """Up to ``k`` live entities closest to ``pos``, nearest first."""
+
+        if not self._count or k <= 0:
+            return []
+        size = self.cell_size
+        cx, cy = int(pos.x) // size, int(pos.y) // size
+        min_x, min_y, max_x, max_y = self._bounds
+        max_ring = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy, 0)
+        limit_sq = max_distance * max_distance if max_distance is not None else None
+        cells = self._cells
+        best: list[tuple[float, int, object]] = []
+        seq = 0
+        for ring in range(max_ring + 1):
+            for cell in _ring_cells(cx, cy, ring):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    if not getattr(entity, "alive", True):
+                        continue
+                    d2 = (entity.pos - pos).length_squared()
+                    if limit_sq is not None and d2 > limit_sq:
+                        continue
+                    best.append((d2, seq, entity))
+                    seq += 1
+            # Anything in later rings is at least ``ring`` cells away.
+            reach_sq = float(ring * size) ** 2
+            if limit_sq is not None and reach_sq > limit_sq:
+                break
+            if len(best) >= k:
+                best.sort()
+                del best[k:]
+                if best[-1][0] <= reach_sq:
+                    break
+        best.sort()
+        return [entity for _, _, entity in best[:k]]
+
+
+def _ring_cells(cx: int, cy: int, ring: int) -> Iterator[Cell]:
+    if ring == 0:
+        yield cx, cy
+        return
+    for x in range(cx - ring, cx + ring + 1):
+        yield x, cy - ring
+        yield x, cy + ring
+    for y in range(cy - ring + 1, cy + ring):
+        yield cx - ring, y
+        yield cx + ring, y
+
+
+def enemies_in_rect(enemies, rect: pygame.Rect) -> list:
+    """Enemies that may overlap ``rect`` from a spatial index or a plain iterable."""
+
+    if hasattr(enemies, "query_rect"):
+        return enemies.query_rect(rect)
+    return list(enemies)
@@ -2,7 +2,13 @@ import pygame
 
 
 WIDTH, HEIGHT = 1280, 720
-FPS = 60
+FPS = 60  # render cap
+
+# Fixed simulation step; rendering interpolates between the last two steps.
+SIM_HZ = 60
+SIM_DT = 1.0 / SIM_HZ
+MAX_SIM_STEPS = 5  # per rendered frame; time beyond this is dropped, not caught up
+SNAP_DISTANCE = 96.0  # moves longer than this in one step are teleports and are not smoothed
 
 PLAYER_SPEED = 150.0
 ATTACK_LOCK_MS = 220
@@ -34,6 +40,10 @@ PUNCH_RANGE = 28
 SWORD_RANGE = 60
 Q_BURST_RANGE = 70
 
+# Share of carried gold lost on defeat
+DEATH_GOLD_PENALTY = 0.15  # overworld
+GATE_FAIL_GOLD_PENALTY = 0.2  # dying inside a dungeon gate
+
 # Skills
 JIN_Q_COST = 12
 CHA_Q_COST = 10
@@ -65,3 +75,6 @@ class Keys:
     PAUSE = pygame.K_ESCAPE
     QUICK_SAVE = pygame.K_F5
     QUICK_LOAD = pygame.K_F9
+    DEBUG = pygame.K_F2
+    PROFILER = pygame.K_F3
+    PROFILER_EXPORT = pygame.K_F4
@@ -1,15 +1,113 @@
 """Enemy behaviours for overworld and dungeon scenes."""
 from __future__ import annotations
 
+import random
 from typing import Dict, List, Optional
 
 import pygame
 
-from .utils import clamp, load_desert_sheet
+from .collision import wall_candidates
+from .utils import clamp, interpolate, load_desert_sheet
+from .variants import variants
+
+
+# Animation tables are built once per scale and shared by every enemy; the
+# frames come from the shared frame atlas and must not be drawn onto.
+_animation_cache: Dict[float, Optional[Dict[str, Dict[str, List[pygame.Surface]]]]] = {}
+_placeholder_cache: Dict[tuple, pygame.Surface] = {}
+_size_cache: Dict[tuple[int, int], pygame.Vector2] = {}
+# Velocity of every enemy not being knocked back; take_damage assigns a fresh one.
+_NO_KNOCKBACK = pygame.Vector2()
+_UNSET = float("nan")
+
+# Multiplied into sprite frames (and the placeholder box) during the hurt flash.
+HURT_TINT = (255, 200, 200, 150)
+PLACEHOLDER_HURT_TINT = (255, 200, 200, 160)
+
+
+def _directional_animations(scale: float) -> Optional[Dict[str, Dict[str, List[pygame.Surface]]]]:
+    if scale in _animation_cache:
+        return _animation_cache[scale]
+    animations = None
+    try:
+        frames = load_desert_sheet("Enemies", scale=scale)
+    except FileNotFoundError:
+        frames = []
+    if len(frames) >= 16:
+        directions = ["down", "left", "right", "up"]
+        walk: Dict[str, List[pygame.Surface]] = {}
+        for idx, direction in enumerate(directions):
+            walk[direction] = frames[idx * 4 : (idx + 1) * 4]
+        idle = {direction: [frames[idx * 4]] for idx, direction in enumerate(directions)}
+        animations = {"idle": idle, "walk": walk}
+    _animation_cache[scale] = animations
+    return animations
+
+
+def overworld_enemy_stats(rng: random.Random) -> dict:
+    """Rolled ``hp``, ``speed`` and ``xp_reward`` for a wandering overworld enemy."""
+
+    return {
+        "hp": rng.randint(60, 110),
+        "speed": rng.uniform(85.0, 120.0),
+        "xp_reward": rng.randint(20, 55),
+    }
+
+
+def dungeon_enemy_stats(index: int) -> dict:
+    """Stats of the ``index``-th enemy guarding a dungeon gate."""
+
+    return {"hp": 90 + index * 10, "speed": 120.0, "xp_reward": 45}
+
+
+def _placeholder_image(size: pygame.Vector2, color: tuple[int, int, int]) -> pygame.Surface:
+    key = (int(size.x), int(size.y), tuple(color))
+    image = _placeholder_cache.get(key)
+    if image is None:
+        image = pygame.Surface(key[:2], pygame.SRCALPHA)
+        pygame.draw.rect(image, color, image.get_rect(), border_radius=6)
+        _placeholder_cache[key] = image
+    return image
 
 
 class Enemy(pygame.sprite.Sprite):
+    # Hordes run to thousands, so per-enemy state lives in slots; the Sprite base
+    # still brings a ``__dict__`` for ``size`` and anything set from outside.
+    __slots__ = (
+        "pos",
+        "prev_pos",
+        "hp",
+        "max_hp",
+        "speed",
+        "detection_radius",
+        "attack_range",
+        "attack_damage",
+        "knockback",
+        "xp_reward",
+        "state",
+        "alive",
+        "orientation",
+        "_use_directional_sprite",
+        "animations",
+        "_anim_timer",
+        "_frame_index",
+        "_cooldown_timer",
+        "_hurt_timer",
+        "_hurt_block",
+        "_knockback_velocity",
+        "_knockback_timer",
+        "color",
+        "image",
+        "base_image",
+        "_rect",
+        "_rect_x",
+        "_rect_y",
+        "_rect_size",
+    )
+
     size = pygame.Vector2(22, 26)
+    _attack_cooldown = 0.6
+    _hurt_cooldown = 0.1
 
     def __init__(
         self,
@@ -25,6 +123,10 @@ class Enemy(pygame.sprite.Sprite):
     ) -> None:
         super().__init__()
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = pygame.Vector2(pos)
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._rect_x = self._rect_y = _UNSET
+        self._rect_size = None
         self.hp = hp
         self.max_hp = hp
         self.speed = speed
@@ -42,20 +144,18 @@ class Enemy(pygame.sprite.Sprite):
         self._anim_timer: float = 0.0
         self._frame_index: int = 0
 
-        self._attack_cooldown = 0.6
         self._cooldown_timer = 0.0
         self._hurt_timer = 0.0
-        self._hurt_cooldown = 0.1
         self._hurt_block = 0.0
-        self._knockback_velocity = pygame.Vector2()
+        self._knockback_velocity = _NO_KNOCKBACK
         self._knockback_timer = 0.0
 
-        self.image = pygame.Surface((int(self.size.x), int(self.size.y)), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, color, self.image.get_rect(), border_radius=6)
-        self.base_image = self.image.copy()
         self.color = color
-
+        self.image: Optional[pygame.Surface] = None
         self._load_sprite()
+        if not self._use_directional_sprite:
+            self.image = _placeholder_image(self.size, color)
+        self.base_image = self.image
 
     # ------------------------------------------------------------------
     def update(
@@ -69,6 +169,7 @@ class Enemy(pygame.sprite.Sprite):
             return
 
         dt = float(dt)
+        self.prev_pos.update(self.pos)
         self._cooldown_timer = max(0.0, self._cooldown_timer - dt)
         self._hurt_timer = max(0.0, self._hurt_timer - dt)
         self._hurt_block = max(0.0, self._hurt_block - dt)
@@ -109,7 +210,7 @@ class Enemy(pygame.sprite.Sprite):
         self._move_axis(displacement.x, collision_sprites, axis="x")
         self._move_axis(displacement.y, collision_sprites, axis="y")
         if self._knockback_timer == 0.0:
-            self._knockback_velocity.xy = (0, 0)
+            self._knockback_velocity = _NO_KNOCKBACK
 
     def _move(self, direction: pygame.Vector2, dt: float, collision_sprites) -> None:
         velocity = direction * self.speed * dt
@@ -128,9 +229,8 @@ class Enemy(pygame.sprite.Sprite):
             return
 
         rect = self.rect
-        for sprite in collision_sprites:
-            target = getattr(sprite, "rect", None)
-            if not target or not rect.colliderect(target):
+        for target in wall_candidates(collision_sprites, rect, offset, axis):
+            if not rect.colliderect(target):
                 continue
             if axis == "x":
                 if offset > 0:
@@ -153,6 +253,12 @@ class Enemy(pygame.sprite.Sprite):
         )
         self._cooldown_timer = self._attack_cooldown
 
+    @property
+    def settled(self) -> bool:
+        """No knockback or hurt flash in progress, so coarse updates look the same."""
+
+        return self._knockback_timer <= 0.0 and self._hurt_timer <= 0.0
+
     # ------------------------------------------------------------------
     def take_damage(
         self,
@@ -181,11 +287,19 @@ class Enemy(pygame.sprite.Sprite):
                 self._knockback_timer = 0.2
 
     # ------------------------------------------------------------------
-    def draw(self, surface: pygame.Surface, offset: Optional[pygame.Vector2] = None) -> None:
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: Optional[pygame.Vector2] = None,
+        alpha: float = 1.0,
+    ) -> Optional[pygame.Rect]:
         if not self.alive:
-            return
+            return None
         offset = offset or pygame.Vector2(0, 0)
-        rect = self.rect.move(-offset.x, -offset.y)
+        pos = interpolate(self.prev_pos, self.pos, alpha)
+        rect = pygame.Rect(
+            int(pos.x - self.size.x / 2), int(pos.y - self.size.y), int(self.size.x), int(self.size.y)
+        ).move(-offset.x, -offset.y)
 
         if self._use_directional_sprite:
             frames = self.animations.get("idle", {})
@@ -193,13 +307,11 @@ class Enemy(pygame.sprite.Sprite):
             frame = fallback[self._frame_index % len(fallback)] if fallback else None
             image = self.image or frame
             if image is None:
-                return
+                return None
         else:
-            image = self.base_image.copy()
-            if self._hurt_timer > 0:
-                image.fill((255, 200, 200, 160), special_flags=pygame.BLEND_RGBA_MULT)
+            image = variants.get(self.base_image, tint=PLACEHOLDER_HURT_TINT if self._hurt_timer > 0 else None)
 
-        surface.blit(image, rect)
+        drawn = surface.blit(image, rect)
 
         pct = self.hp / self.max_hp if self.max_hp else 0
         bar_rect = pygame.Rect(rect.x, rect.y - 8, rect.width, 4)
@@ -209,6 +321,7 @@ class Enemy(pygame.sprite.Sprite):
         if fill.width > 0:
             pygame.draw.rect(surface, (120, 220, 120), fill)
         pygame.draw.rect(surface, (235, 235, 245), bar_rect, 1)
+        return drawn.union(bar_rect)
 
     @property
     def center(self) -> pygame.Vector2:
@@ -216,34 +329,34 @@ class Enemy(pygame.sprite.Sprite):
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(
-            int(self.pos.x - self.size.x / 2),
-            int(self.pos.y - self.size.y),
-            int(self.size.x),
-            int(self.size.y),
-        )
+        """Bounds anchored at ``pos`` (mid-bottom), rebuilt in place only after ``pos`` moved.
+
+        The Rect is shared between calls, so copy it to keep it and never mutate
+        it. ``size`` is replaced, never changed in place.
+        """
+
+        pos, size, rect = self.pos, self.size, self._rect
+        if pos.x != self._rect_x or pos.y != self._rect_y or size is not self._rect_size:
+            self._rect_x = pos.x
+            self._rect_y = pos.y
+            self._rect_size = size
+            rect.update(int(pos.x - size.x / 2), int(pos.y - size.y), int(size.x), int(size.y))
+        return rect
 
     # ------------------------------------------------------------------
     def _load_sprite(self) -> None:
-        try:
-            frames = load_desert_sheet("Enemies", scale=2.0)
-        except FileNotFoundError:
-            return
-        if len(frames) < 16:
+        animations = _directional_animations(2.0)
+        if animations is None:
             return
-
-        directions = ["down", "left", "right", "up"]
-        walk: Dict[str, List[pygame.Surface]] = {}
-        for idx, direction in enumerate(directions):
-            walk[direction] = frames[idx * 4 : (idx + 1) * 4]
-
-        idle = {direction: [frames[idx * 4]] for idx, direction in enumerate(directions)}
-
-        self.animations = {"idle": idle, "walk": walk}
+        self.animations = animations
         self._use_directional_sprite = True
-        sample = frames[0]
-        self.size = pygame.Vector2(sample.get_width(), sample.get_height())
-        self.image = idle["down"][0]
+        sample = animations["idle"]["down"][0]
+        # One read-only vector per frame size, shared like the frames themselves.
+        size = _size_cache.get(sample.get_size())
+        if size is None:
+            size = _size_cache[sample.get_size()] = pygame.Vector2(sample.get_size())
+        self.size = size
+        self.image = sample
         self._frame_index = 0
 
     def _set_orientation(self, vector: pygame.Vector2) -> None:
@@ -264,8 +377,4 @@ class Enemy(pygame.sprite.Sprite):
         fps = 6.0 if state == "walk" else 2.5
         self._anim_timer += dt * fps
         self._frame_index = int(self._anim_timer) % len(frames)
-        frame = frames[self._frame_index]
-        if self._hurt_timer > 0:
-            frame = frame.copy()
-            frame.fill((255, 200, 200, 150), special_flags=pygame.BLEND_RGBA_MULT)
-        self.image = frame
+        self.image = variants.get(frames[self._frame_index], tint=HURT_TINT if self._hurt_timer > 0 else None)
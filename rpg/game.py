@@ -1,52 +1,160 @@
 import sys, pygame
-from .constants import FPS, HEIGHT, WIDTH, Keys
+from .constants import FPS, HEIGHT, MAX_SIM_STEPS, SIM_DT, WIDTH, Keys
 from .scenes.menu import SceneMenu
+from .profiler import FrameProfiler
 from .state import GameState
-from .save import load_game, save_game
+from .save import SaveService, load_game
 
 class Game:
-    def __init__(self):
+    def __init__(self, dirty_rects: bool = False, record: str | None = None):
         pygame.init()
         pygame.display.set_caption("Desert Outpost — Top-Down Shooter")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
         self.state = GameState()
+        self.saver = SaveService()
+        # Held keys for the current tick; scenes read this instead of polling pygame.
+        self.keys = pygame.key.get_pressed()
+        self.debug = False
+        self.profiler = FrameProfiler()
+        # How far between the last two simulation steps the next draw falls.
+        self.alpha = 1.0
+        # Present only the rects scenes report as changed instead of flipping.
+        self.dirty_rects = dirty_rects
+        self._presented = None
+        # Simulation steps taken so far; recordings and replays index input by it.
+        self.tick = 0
+        self.recorder = None
+        if record:
+            from . import rng
+            from .replay import Recorder
+
+            self.recorder = Recorder({"scene": "menu"}, rng.provider.seed, SIM_DT, path=record)
         self.scene = SceneMenu(self)
 
     def change(self, scene, name=None, autosave=True):
         if name:
             self.state.scene_name = name
         self.scene = scene
+        if self.recorder is not None:
+            self.recorder.scene_changed(self.tick, name or type(scene).__name__)
         if autosave and self.state.player:
-            save_game(self.state)
+            self.save()
+
+    def save(self) -> None:
+        """Queue a save; the write happens off the main thread."""
+        if self.state.player:
+            self.saver.request(self.state)
+
+    def quit(self) -> None:
+        self.save()
+        self.saver.close()
+        if self.recorder is not None:
+            self.recorder.save()
+        pygame.quit(); sys.exit()
 
     def run(self):
+        """Simulate in fixed ``SIM_DT`` steps and draw once per displayed frame.
+
+        Frame time feeds an accumulator that is drained a step at a time, at
+        most ``MAX_SIM_STEPS`` per frame; time beyond that is dropped so a stall
+        slows the game down instead of spiralling. Events go to the first step
+        of a frame (or wait for the next frame that steps), and the leftover
+        fraction of a step becomes ``alpha`` for interpolated drawing.
+        """
+        acc = 0.0
+        events = []
+        prof = self.profiler
         while True:
             self.clock.tick(FPS)
-            dt = self.clock.get_time() / 1000.0
-            events = pygame.event.get()
-            for e in events:
-                if e.type == pygame.QUIT:
-                    if self.state.player:
-                        save_game(self.state)
-                    pygame.quit(); sys.exit()
-                if e.type == pygame.KEYDOWN:
-                    if e.mod & pygame.KMOD_CTRL and e.key == pygame.K_s and self.state.player:
-                        save_game(self.state)
-                        continue
-                    if e.key == Keys.QUICK_SAVE and self.state.player:
-                        save_game(self.state)
-                        continue
-                    if e.key == Keys.QUICK_LOAD:
-                        from .player import Player
-
-                        if load_game(self.state, lambda who: Player((WIDTH // 2, HEIGHT // 2), who=who)):
-                            self._load_scene_from_state()
-                        continue
-                self.scene.handle(e)
-            self.scene.update(dt)
-            self.scene.draw(self.screen)
+            prof.begin_frame()
+            acc += min(self.clock.get_time() / 1000.0, SIM_DT * MAX_SIM_STEPS)
+            events.extend(pygame.event.get())
+            keys = pygame.key.get_pressed()
+            steps = 0
+            while acc >= SIM_DT and steps < MAX_SIM_STEPS:
+                self.step(SIM_DT, events, keys)
+                events = []
+                acc -= SIM_DT
+                steps += 1
+            if steps == MAX_SIM_STEPS:
+                acc = min(acc, SIM_DT)
+            self.alpha = min(1.0, acc / SIM_DT)
+            self.draw_frame()
+            prof.lap("flip")
+            prof.end_frame(self.scene)
+
+    def draw_frame(self) -> None:
+        """Draw the scene, the profiler overlay when it is on, and present the result."""
+        rects = self.scene.draw(self.screen)
+        if self.profiler.enabled:
+            rects = self._draw_profiler(rects)
+        self.present(rects)
+
+    def _draw_profiler(self, rects):
+        panel = self.profiler.draw(self.screen)
+        self.profiler.skip()
+        return rects if rects is None else rects + [panel]
+
+    def present(self, rects=None) -> None:
+        """Show the frame: ``rects`` from ``scene.draw`` when dirty rects are on, else a flip.
+
+        A scene returning ``None`` (or a scene change) always gets a full flip;
+        an empty list means nothing on screen changed.
+        """
+        if not self.dirty_rects or rects is None or self._presented is not self.scene:
+            self._presented = self.scene
             pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def step(self, dt, events, keys) -> None:
+        """Advance one tick: dispatch ``events`` and update the scene with ``keys`` held."""
+        self.keys = keys
+        if self.recorder is not None:
+            self.recorder.step(self.tick, events, keys)
+        for e in events:
+            self.handle_event(e)
+        self.profiler.lap("events")
+        self.scene.update(dt)
+        self.profiler.lap("update")
+        if self.recorder is not None:
+            self.recorder.stepped(self.tick, self)
+        self.tick += 1
+
+    def handle_event(self, e) -> None:
+        if e.type == pygame.QUIT:
+            self.quit()
+            return
+        if e.type == pygame.WINDOWEXPOSED:
+            self._presented = None
+        if e.type == pygame.KEYDOWN:
+            if e.key == Keys.DEBUG:
+                self.debug = not self.debug
+                return
+            if e.key == Keys.PROFILER:
+                self.profiler.toggle()
+                # The panel sits on top of the scene's cached pixels; repaint them.
+                self.scene.invalidate()
+                self._presented = None
+                return
+            if e.key == Keys.PROFILER_EXPORT and self.profiler.frames:
+                print(f"[info] wrote frame profile to {self.profiler.export_csv()}")
+                return
+            if e.mod & pygame.KMOD_CTRL and e.key == pygame.K_s and self.state.player:
+                self.save()
+                return
+            if e.key == Keys.QUICK_SAVE and self.state.player:
+                self.save()
+                return
+            if e.key == Keys.QUICK_LOAD:
+                from .player import Player
+
+                self.saver.flush()
+                if load_game(self.state, lambda who: Player((WIDTH // 2, HEIGHT // 2), who=who)):
+                    self._load_scene_from_state()
+                return
+        self.scene.handle(e)
 
     def _load_scene_from_state(self) -> None:
         name = self.state.scene_name or "overworld"
@@ -2,6 +2,15 @@ import random
 
 import pygame
 
+from . import rng
+from .utils import get_font
+
+
+def roll_gate_level(rand: random.Random, player_level: int) -> int:
+    """Level of a freshly opened gate: one below to three above the player's."""
+
+    return max(1, player_level + rand.randint(-1, 3))
+
 
 class Gate:
     def __init__(self, rect, req_level=1, allow_under=False, label="Gate"):
@@ -16,26 +25,39 @@ class Gate:
         high = base + spread
         self._reward_range = (low, high)
         self._cached_reward: int | None = None
+        self._label_key: tuple | None = None
+        self._label_image: pygame.Surface | None = None
 
-    def draw(self, surf, offset: pygame.Vector2 | None = None) -> None:
+    def draw(self, surf, offset: pygame.Vector2 | None = None) -> pygame.Rect:
         offset = offset or pygame.Vector2(0, 0)
         rect = self.rect.move(-offset.x, -offset.y)
         color = (100, 70, 160) if not self.cleared else (70, 70, 90)
         pygame.draw.rect(surf, color, rect, 3)
-        f = pygame.font.SysFont(None, 22)
-        tag = "*" if self.allow_under else "+"
-        label = f"{self.label} (Lv.{self.req_level}{tag})"
-        if self.cleared:
-            label += " [Cleared]"
-        t = f.render(label, True, (210, 200, 230))
-        surf.blit(t, (rect.x, rect.y - 20))
+        return rect.union(surf.blit(self.label_surface(), (rect.x, rect.y - 20)))
+
+    def label_surface(self) -> pygame.Surface:
+        """Pre-rendered caption, re-rendered only when label, level or cleared change."""
+        key = (self.label, self.req_level, self.allow_under, self.cleared)
+        if key != self._label_key or self._label_image is None:
+            tag = "*" if self.allow_under else "+"
+            label = f"{self.label} (Lv.{self.req_level}{tag})"
+            if self.cleared:
+                label += " [Cleared]"
+            self._label_image = get_font(None, 22).render(label, True, (210, 200, 230))
+            self._label_key = key
+        return self._label_image
+
+    def draw_bounds(self) -> pygame.Rect:
+        """World-space area touched by :meth:`draw`, including the label above."""
+        label = self.label_surface()
+        return self.rect.union(pygame.Rect(self.rect.x, self.rect.y - 20, label.get_width(), label.get_height()))
 
     def contains(self, rect: pygame.Rect) -> bool:
         return self.rect.colliderect(rect)
 
     def reward_gold(self) -> int:
         if self._cached_reward is None:
-            self._cached_reward = random.randint(*self._reward_range)
+            self._cached_reward = rng.stream("gate_rewards").randint(*self._reward_range)
         return self._cached_reward
 
     def mark_cleared(self) -> None:
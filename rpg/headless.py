@@ -0,0 +1,244 @@
+"""Windowless fixed-step runner for soak tests and update throughput.
+
+Usage::
+
+    python -m rpg.headless --ticks 3600 --scene overworld [--draw]
+    python -m rpg.headless --record patrol.rpgr      # save the run's input for replays
+    python -m rpg.headless --replay patrol.rpgr --draw
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+import pygame
+
+from .constants import CHAR_CHA, CHAR_JINWOO, FPS, HEIGHT, WIDTH, Keys
+
+
+class KeySet:
+    """Stand-in for ``pygame.key.get_pressed()`` backed by a set of key codes."""
+
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        self._pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+
+
+class ScriptedInput:
+    """Per-tick held keys and KEYDOWN presses fed to :meth:`Game.step`."""
+
+    def __init__(
+        self,
+        hold: Optional[Dict[int, Iterable[int]]] = None,
+        presses: Optional[Dict[int, Iterable[int]]] = None,
+    ) -> None:
+        # ``hold`` maps the tick a hold starts at to the keys held from then on.
+        self._hold = sorted((tick, KeySet(keys)) for tick, keys in (hold or {}).items())
+        self._presses = {tick: list(keys) for tick, keys in (presses or {}).items()}
+
+    def keys(self, tick: int) -> KeySet:
+        current = KeySet()
+        for start, keys in self._hold:
+            if start > tick:
+                break
+            current = keys
+        return current
+
+    def events(self, tick: int) -> List[pygame.event.Event]:
+        return [
+            pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+            for key in self._presses.get(tick, ())
+        ]
+
+    @classmethod
+    def patrol(cls, ticks: int) -> "ScriptedInput":
+        """Walk a square, swinging and dashing on a fixed cadence."""
+
+        moves = (Keys.MOVE_RIGHT, Keys.MOVE_DOWN, Keys.MOVE_LEFT, Keys.MOVE_UP)
+        hold = {tick: (moves[(tick // 90) % len(moves)],) for tick in range(0, ticks, 90)}
+        presses: Dict[int, List[int]] = {}
+        for tick in range(15, ticks, 30):
+            presses.setdefault(tick, []).append(Keys.ATTACK)
+        for tick in range(75, ticks, 150):
+            presses.setdefault(tick, []).append(Keys.DASH)
+        return cls(hold, presses)
+
+
+def _make_game(autosave: bool, dirty_rects: bool = False):
+    from .game import Game
+
+    class HeadlessGame(Game):
+        def save(self) -> None:
+            if autosave:
+                super().save()
+
+    return HeadlessGame(dirty_rects=dirty_rects)
+
+
+def _enter_scene(game, scene: str, who: str, enemies: Optional[int] = None, swarm: bool = False) -> None:
+    from .player import Player
+
+    if scene == "menu":
+        return
+    game.state.player = Player((WIDTH // 2, HEIGHT // 2), who=who)
+    if scene == "overworld":
+        from .scenes.overworld import SceneOverworld
+
+        game.change(SceneOverworld(game, enemy_count=enemies, swarm=swarm), name="overworld", autosave=False)
+    else:
+        from .gate import Gate
+        from .scenes.dungeon import SceneDungeon
+
+        gate = Gate(pygame.Rect(0, 0, 120, 140), label="Headless Gate", allow_under=True)
+        game.change(SceneDungeon(game, game.state.player, gate), name="dungeon", autosave=False)
+
+
+def run_headless(game, ticks: int, dt: float, script: ScriptedInput, draw: bool = False) -> dict:
+    """Step ``game`` for ``ticks`` fixed steps as fast as possible and return timings.
+
+    ``script`` may also be a :class:`rpg.replay.Replay`, whose checkpoints are
+    verified after each step.
+    """
+
+    update_time = 0.0
+    draw_time = 0.0
+    present_time = 0.0
+    prof = game.profiler
+    check = getattr(script, "check", None)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        prof.begin_frame()
+        t0 = time.perf_counter()
+        game.step(dt, script.events(tick), script.keys(tick))
+        t1 = time.perf_counter()
+        update_time += t1 - t0
+        if check is not None:
+            check(tick, game)
+            t1 = time.perf_counter()
+        if draw:
+            rects = game.scene.draw(game.screen)
+            t2 = time.perf_counter()
+            game.present(rects)
+            prof.lap("flip")
+            draw_time += t2 - t1
+            present_time += time.perf_counter() - t2
+        prof.end_frame(game.scene)
+    elapsed = time.perf_counter() - start
+    return {
+        "ticks": ticks,
+        "elapsed": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed else float("inf"),
+        "update_ms": update_time * 1000.0 / max(1, ticks),
+        "draw_ms": draw_time * 1000.0 / max(1, ticks),
+        "present_ms": present_time * 1000.0 / max(1, ticks),
+        "scene": type(game.scene).__name__,
+    }
+
+
+def check_profiler_toggle(game, dt: float = 1.0 / FPS) -> bool:
+    """Press F3 twice over the current scene; True when the panel showed and then fully cleared.
+
+    Probes the pixel the overlay covers in the bottom-right corner. Scenes
+    that cache their frame must repaint it once the panel is switched off.
+    """
+
+    probe = (game.screen.get_width() - 20, game.screen.get_height() - 20)
+    press = [pygame.event.Event(pygame.KEYDOWN, key=Keys.PROFILER, mod=0, unicode="", scancode=0)]
+    game.draw_frame()
+    before = game.screen.get_at(probe)
+    seen = []
+    for _ in range(2):
+        game.step(dt, press, KeySet())
+        game.draw_frame()
+        seen.append(game.screen.get_at(probe))
+    shown, after = seen
+    if shown == before:
+        print(f"[warn] profiler overlay did not cover {probe}: {tuple(before)}")
+        return False
+    if after != before:
+        print(f"[warn] profiler overlay left {tuple(after)} at {probe} after F3, expected {tuple(before)}")
+        return False
+    print(f"[info] profiler overlay cleared from {type(game.scene).__name__} after F3")
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m rpg.headless", description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=600, help="number of simulation steps to run")
+    parser.add_argument("--scene", choices=("overworld", "dungeon", "menu"), default="overworld")
+    parser.add_argument("--who", choices=(CHAR_JINWOO, CHAR_CHA), default=CHAR_JINWOO)
+    parser.add_argument("--dt", type=float, default=1.0 / FPS, help="fixed step in seconds")
+    parser.add_argument("--draw", action="store_true", help="also call scene.draw and present every tick")
+    parser.add_argument("--dirty-rects", action="store_true", help="present only the rects scenes report as changed")
+    parser.add_argument("--idle", action="store_true", help="hold no keys instead of the patrol script")
+    parser.add_argument("--enemies", type=int, help="overworld enemy count instead of the level-based default")
+    parser.add_argument("--swarm", action="store_true", help="run overworld enemies as a vectorised EnemySwarm")
+    parser.add_argument("--profile", metavar="CSV", help="record per-phase frame timings and write them to CSV")
+    parser.add_argument("--autosave", action="store_true", help="keep writing the save slot on scene changes")
+    parser.add_argument("--seed", type=int, help="gameplay RNG seed (gates, rewards); random by default")
+    parser.add_argument("--record", metavar="FILE", help="save this run's input and seed for --replay")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recording; overrides the scene and input options")
+    parser.add_argument(
+        "--check-profiler", action="store_true", help="toggle the F3 overlay on and off over --scene and check it clears"
+    )
+    args = parser.parse_args(argv)
+
+    from . import rng
+    from .replay import Recorder, Replay, ReplayError
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    game = _make_game(args.autosave, args.dirty_rects)
+    if args.replay:
+        try:
+            script = Replay.load(args.replay)
+        except (OSError, ReplayError) as exc:
+            print(f"[warn] cannot replay {args.replay}: {exc}")
+            return 1
+        script.prepare()
+        start = script.start
+        args.ticks, args.dt = script.ticks, script.dt
+    else:
+        rng.reseed(args.seed)
+        start = {"scene": args.scene, "who": args.who, "enemies": args.enemies, "swarm": args.swarm}
+        script = ScriptedInput() if args.idle else ScriptedInput.patrol(args.ticks)
+    _enter_scene(game, start["scene"], start.get("who", CHAR_JINWOO), start.get("enemies"), start.get("swarm", False))
+    if args.check_profiler:
+        ok = check_profiler_toggle(game, args.dt)
+        game.saver.close()
+        pygame.quit()
+        return 0 if ok else 1
+    if args.record:
+        game.recorder = Recorder(start, rng.provider.seed, args.dt, path=args.record)
+    if args.profile:
+        game.profiler.frames = deque(maxlen=args.ticks)
+        game.profiler.toggle()
+
+    result = run_headless(game, args.ticks, args.dt, script, draw=args.draw)
+    game.saver.close()
+    if game.recorder is not None:
+        game.recorder.save()
+    print(
+        f"{result['ticks']} ticks in {result['elapsed']:.3f}s "
+        f"-> {result['ticks_per_sec']:.1f} ticks/s "
+        f"(update {result['update_ms']:.3f} ms, draw {result['draw_ms']:.3f} ms, "
+        f"present {result['present_ms']:.3f} ms, scene {result['scene']})"
+    )
+    if args.replay:
+        if script.diverged is None:
+            print(f"[info] replay matched the recording over {args.ticks} ticks")
+        else:
+            print(f"[warn] replay diverged from the recording by tick {script.diverged}")
+    if args.profile:
+        print(f"[info] wrote frame profile to {game.profiler.export_csv(args.profile)}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
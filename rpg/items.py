@@ -3,8 +3,15 @@ from .utils import clamp
 from .constants import CORPSE_TTL
 
 class GroundItem:
-    def __init__(self, pos, kind="dagger", ttl=None):
-        self.pos = pygame.Vector2(pos)
+    """A pickup or corpse on the floor. Keep them in a ``Pool(GroundItem, "ground_items")``."""
+
+    def __init__(self, pos=(0, 0), kind="dagger", ttl=None):
+        self.pos = pygame.Vector2()
+        self.pool_index = -1
+        self.reset(pos, kind, ttl)
+
+    def reset(self, pos, kind="dagger", ttl=None):
+        self.pos.update(pos)
         self.kind = kind   # "dagger", "sword", "corpse"
         self.radius = 12 if kind != "corpse" else 18
         self.pulse = 0
@@ -0,0 +1,124 @@
+"""Distance-based level of detail for enemy AI."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+from .collision import SpatialHash
+
+
+class AiScheduler:
+    """Decides which enemies run :meth:`Enemy.update` each tick, and with what ``dt``.
+
+    Enemies fall into three tiers by distance to the player:
+
+    * near (within their ``detection_radius`` plus ``near_margin``, or still
+      reeling from a hit) update every tick;
+    * mid-range ones are idle anyway, so they update every ``mid_interval``
+      ticks with the skipped time accumulated, staggered across ticks;
+    * beyond ``sleep_radius`` they fall asleep: they leave the awake set for a
+      static :class:`SpatialHash` and are not visited at all until the player
+      comes within ``wake_radius`` (smaller, so tiers do not flap at the edge).
+
+    Time spent asleep is dropped; timers resume where they stopped.
+    """
+
+    def __init__(
+        self,
+        near_margin: float = 160.0,
+        mid_interval: int = 4,
+        wake_radius: float = 900.0,
+        sleep_radius: float = 1100.0,
+        cell_size: int = 256,
+    ) -> None:
+        if wake_radius > sleep_radius:
+            raise ValueError("wake_radius must not exceed sleep_radius")
+        self.near_margin = near_margin
+        self.mid_interval = max(1, int(mid_interval))
+        self.wake_radius = wake_radius
+        self.sleep_radius = sleep_radius
+        self.sleeping = SpatialHash(cell_size)
+        # Awake enemies, in the order they were added, and the dt each has accumulated.
+        self._pending: Dict[object, float] = {}
+        self._order: Dict[object, int] = {}
+        self._added = 0
+        self._tick = 0
+        self.near = 0
+        self.mid = 0
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self.sleeping)
+
+    @property
+    def awake(self) -> Iterable:
+        return self._pending.keys()
+
+    def add(self, enemy) -> None:
+        self._order[enemy] = self._added
+        self._added += 1
+        self._pending[enemy] = 0.0
+
+    def remove(self, enemy) -> None:
+        if self._pending.pop(enemy, None) is None:
+            self.sleeping.discard(enemy)
+        self._order.pop(enemy, None)
+
+    # ------------------------------------------------------------------
+    def schedule(self, dt: float, target: pygame.Vector2) -> List[Tuple[object, float]]:
+        """Enemies due this tick around ``target`` (the player), each with the dt to apply."""
+
+        self._tick += 1
+        self._wake(target)
+        due: List[Tuple[object, float]] = []
+        drowsy = []
+        pending = self._pending
+        sleep_sq = self.sleep_radius * self.sleep_radius
+        near = mid = 0
+        for enemy, owed in pending.items():
+            if not enemy.alive:
+                # Hand the dead straight back so the scene reaps them this tick.
+                due.append((enemy, owed + dt))
+                continue
+            d2 = enemy.pos.distance_squared_to(target)
+            reach = enemy.detection_radius + self.near_margin
+            if d2 <= reach * reach or not enemy.settled:
+                # Idle time still owed from the mid tier is dropped: spent in one
+                # step it would become a lunge if the enemy starts chasing now.
+                near += 1
+                due.append((enemy, dt))
+                pending[enemy] = 0.0
+            elif d2 > sleep_sq:
+                drowsy.append(enemy)
+            else:
+                mid += 1
+                owed += dt
+                if (self._tick + self._order[enemy]) % self.mid_interval == 0:
+                    due.append((enemy, owed))
+                    owed = 0.0
+                pending[enemy] = owed
+        for enemy in drowsy:
+            del pending[enemy]
+            self.sleeping.insert(enemy)
+        self.near, self.mid = near, mid
+        return due
+
+    def _wake(self, target: pygame.Vector2) -> None:
+        if not len(self.sleeping):
+            return
+        radius = self.wake_radius
+        area = pygame.Rect(int(target.x - radius), int(target.y - radius), int(radius * 2), int(radius * 2))
+        radius_sq = radius * radius
+        woken = False
+        for enemy in self.sleeping.query_rect(area):
+            if enemy.pos.distance_squared_to(target) <= radius_sq:
+                self.sleeping.discard(enemy)
+                self._pending[enemy] = 0.0
+                woken = True
+        if woken:
+            # Keep updates in spawn order, as a plain loop over the group would run them.
+            order = self._order
+            self._pending = dict(sorted(self._pending.items(), key=lambda item: order[item[0]]))
+
+    def label(self) -> str:
+        return f"AI near {self.near} / mid {self.mid} / asleep {len(self.sleeping)}"
@@ -14,12 +14,16 @@ class Minion:
         if not self.alive: return
         if not self.target or not self.target.alive:
             self.target = None
-            best = 1e9
-            for en in enemies:
-                if en.alive:
-                    d = (en.pos - self.pos).length()
-                    if d < best:
-                        best, self.target = d, en
+            if hasattr(enemies, "nearest"):
+                found = enemies.nearest(self.pos, 1)
+                self.target = found[0] if found else None
+            else:
+                best = 1e9
+                for en in enemies:
+                    if en.alive:
+                        d = (en.pos - self.pos).length()
+                        if d < best:
+                            best, self.target = d, en
         # move & damage
         if self.target:
             dv = self.target.pos - self.pos
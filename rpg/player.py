@@ -7,6 +7,7 @@ from typing import Dict, Iterable, List, Literal, Optional
 import os
 import pygame
 
+from .collision import enemies_in_rect, wall_candidates
 from .constants import (
     ATTACK_HITBOX_MS,
     ATTACK_LOCK_MS,
@@ -18,8 +19,15 @@ from .constants import (
 )
 from .inventory import ITEM_LIBRARY, Inventory, Item
 from .leveling import Leveling
+from .pool import Pool
 from .stats import Stats
-from .utils import clamp, load_anim_folder, load_desert_sheet, vnorm
+from .utils import clamp, interpolate, load_anim_folder, load_desert_sheet, vnorm
+from .variants import variants
+
+ATTACK_HITBOX_SIZE = (32, 24)
+
+# Multiplied into the frame while the player is recovering from a hit.
+HURT_TINT = (255, 160, 160, 180)
 
 Facing = Literal["left", "right"]
 PlayerState = Literal["idle", "walk", "attack", "dash"]
@@ -27,13 +35,28 @@ PlayerState = Literal["idle", "walk", "attack", "dash"]
 
 @dataclass
 class Hitbox:
-    rect: pygame.Rect
-    ttl_ms: float
-    damage: int
-    knockback: float
-    size: pygame.Vector2
+    rect: pygame.Rect = field(default_factory=lambda: pygame.Rect(0, 0, 0, 0))
+    ttl_ms: float = 0.0
+    damage: int = 0
+    knockback: float = 0.0
+    size: pygame.Vector2 = field(default_factory=pygame.Vector2)
     follow_player: bool = True
     hits: set[int] = field(default_factory=set)
+    pool_index: int = -1
+
+    def reset(self, ttl_ms: float, damage: int, knockback: float, size, follow_player: bool = True) -> None:
+        self.ttl_ms = ttl_ms
+        self.damage = damage
+        self.knockback = knockback
+        self.size.update(size)
+        self.follow_player = follow_player
+        self.hits.clear()
+
+
+# Desert animations per character and sword sweeps per frame size, shared by every
+# Player. Frames are read-only: copy before drawing onto one.
+_desert_animation_cache: Dict[str, Dict[str, Dict[str, List[pygame.Surface]]]] = {}
+_overlay_cache: Dict[tuple[int, int], Dict[str, List[pygame.Surface]]] = {}
 
 
 def _dash_speed() -> float:
@@ -43,12 +66,50 @@ def _dash_speed() -> float:
 class Player(pygame.sprite.Sprite):
     """Main controllable hero character."""
 
+    # Fields touched every tick live in slots; the rest stay in the Sprite ``__dict__``.
+    __slots__ = (
+        "pos",
+        "prev_pos",
+        "vel",
+        "move_intent",
+        "facing",
+        "orientation",
+        "state",
+        "alive",
+        "hp",
+        "max_hp",
+        "stamina",
+        "max_stamina",
+        "intangible",
+        "image",
+        "anim_timer",
+        "frame_index",
+        "_attack_timer",
+        "_dash_timer",
+        "_dash_cooldown",
+        "_dash_vector",
+        "_hitboxes",
+        "_external_velocity",
+        "_external_timer",
+        "_invuln_timer",
+        "_hurt_timer",
+        "_rect",
+        "_rect_x",
+        "_rect_y",
+        "_rect_size",
+    )
+
     size = pygame.Vector2(20, 28)
 
     def __init__(self, pos: Iterable[float], who: str = "JINWOO") -> None:
         super().__init__()
         self.who = who
         self.pos = pygame.Vector2(pos)
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._rect_x = self._rect_y = float("nan")
+        self._rect_size = None
+        # Position at the start of the current sim step, for interpolated drawing.
+        self.prev_pos = pygame.Vector2(pos)
         self.vel = pygame.Vector2()
         self.move_intent = pygame.Vector2()
         self.facing: Facing = "right"
@@ -99,7 +160,7 @@ class Player(pygame.sprite.Sprite):
         self._attack_requested = False
         self._dash_requested = False
 
-        self._hitboxes: list[Hitbox] = []
+        self._hitboxes: Pool[Hitbox] = Pool(Hitbox, "hitboxes")
         self.intangible: bool = False
 
         self._external_velocity = pygame.Vector2()
@@ -119,6 +180,17 @@ class Player(pygame.sprite.Sprite):
         self._load_classic_animations()
 
     def _load_desert_animations(self) -> None:
+        cached = _desert_animation_cache.get(self.who)
+        if cached is None:
+            cached = self._build_desert_animations()
+            _desert_animation_cache[self.who] = cached
+        self.animations = cached
+        sample = cached["idle"]["down"][0]
+        self.size = pygame.Vector2(sample.get_width(), sample.get_height())
+        self._use_directional_animations = True
+        self._build_attack_overlays(sample.get_width(), sample.get_height())
+
+    def _build_desert_animations(self) -> Dict[str, Dict[str, List[pygame.Surface]]]:
         from .constants import CHAR_CHA, CHAR_JINWOO
 
         frames = load_desert_sheet("Players", scale=2.0)
@@ -165,11 +237,7 @@ class Player(pygame.sprite.Sprite):
                 tinted.append(surf)
             attack[direction] = tinted
 
-        self.animations = {"idle": idle, "walk": walk, "attack": attack}
-        sample = chosen[0]
-        self.size = pygame.Vector2(sample.get_width(), sample.get_height())
-        self._use_directional_animations = True
-        self._build_attack_overlays(sample.get_width(), sample.get_height())
+        return {"idle": idle, "walk": walk, "attack": attack}
 
     def _load_classic_animations(self) -> None:
         base_path = os.path.join("assets", "rpg", "player")
@@ -188,9 +256,12 @@ class Player(pygame.sprite.Sprite):
         self._build_attack_overlays(sample.get_width(), sample.get_height())
 
     def _build_attack_overlays(self, width: int, height: int) -> None:
-        overlays: Dict[str, List[pygame.Surface]] = {}
-        for orientation in ("right", "left", "up", "down"):
-            overlays[orientation] = self._make_sword_sweep(width, height, orientation)
+        overlays = _overlay_cache.get((width, height))
+        if overlays is None:
+            overlays = {}
+            for orientation in ("right", "left", "up", "down"):
+                overlays[orientation] = self._make_sword_sweep(width, height, orientation)
+            _overlay_cache[(width, height)] = overlays
         self._attack_overlays = overlays
 
     def _make_sword_sweep(self, width: int, height: int, orientation: str) -> List[pygame.Surface]:
@@ -301,6 +372,7 @@ class Player(pygame.sprite.Sprite):
         dt = float(dt)
         ms = dt * 1000.0
         prev_state = self.state
+        self.prev_pos.update(self.pos)
 
         if not self.alive:
             return
@@ -311,7 +383,10 @@ class Player(pygame.sprite.Sprite):
         self._update_dash(dt)
         self._update_attack(dt)
         self._update_movement(dt, world)
-        self._update_hitboxes(ms, getattr(world, "enemies", None))
+        enemies = getattr(world, "enemy_index", None)
+        if enemies is None:
+            enemies = getattr(world, "enemies", None)
+        self._update_hitboxes(ms, enemies)
         self._update_state()
 
         if self.state != prev_state:
@@ -368,7 +443,9 @@ class Player(pygame.sprite.Sprite):
         else:
             self.vel = self.move_intent * PLAYER_SPEED
 
-        collision_group = getattr(world, "collision_sprites", None)
+        collision_group = getattr(world, "solids", None)
+        if collision_group is None:
+            collision_group = getattr(world, "collision_sprites", None)
         if self.intangible or collision_group is None:
             total_velocity = self.vel + self._external_velocity
             self.pos += total_velocity * dt
@@ -391,9 +468,8 @@ class Player(pygame.sprite.Sprite):
             self.pos.y += offset
 
         rect = self.rect
-        for sprite in collision_group:
-            target = getattr(sprite, "rect", None)
-            if target and rect.colliderect(target):
+        for target in wall_candidates(collision_group, rect, offset, axis):
+            if rect.colliderect(target):
                 if axis == "x":
                     if offset > 0:
                         self.pos.x = target.left - self.size.x / 2
@@ -407,18 +483,18 @@ class Player(pygame.sprite.Sprite):
                 rect = self.rect
 
     def _spawn_attack_hitbox(self) -> None:
-        size = pygame.Vector2(32, 24)
-        rect = self._attack_rect_from_size(size)
-        damage = self.attack_damage
-        knockback = 180.0
-        self._hitboxes.append(
-            Hitbox(rect=rect, ttl_ms=ATTACK_HITBOX_MS, damage=damage, knockback=knockback, size=size)
-        )
+        hb = self._hitboxes.acquire(ATTACK_HITBOX_MS, self.attack_damage, 180.0, ATTACK_HITBOX_SIZE)
+        self._place_attack_rect(hb.rect, hb.size)
 
     def _attack_rect_from_size(self, size: pygame.Vector2) -> pygame.Rect:
+        return self._place_attack_rect(pygame.Rect(0, 0, 0, 0), size)
+
+    def _place_attack_rect(self, rect: pygame.Rect, size: pygame.Vector2) -> pygame.Rect:
+        """Size and position ``rect`` in front of the player; returns it."""
+
         base_rect = self.rect
         width, height = int(size.x), int(size.y)
-        rect = pygame.Rect(0, 0, width, height)
+        rect.size = (width, height)
         orientation: Literal["left", "right", "up", "down"]
         if self._use_directional_animations:
             orientation = self.orientation
@@ -438,15 +514,18 @@ class Player(pygame.sprite.Sprite):
         return rect
 
     def _update_hitboxes(self, ms: float, enemies) -> None:
-        for hb in list(self._hitboxes):
+        # Backwards, so releasing a hitbox only moves one that was already visited.
+        active = self._hitboxes.active
+        for i in range(len(active) - 1, -1, -1):
+            hb = active[i]
             if hb.follow_player:
-                hb.rect = self._attack_rect_from_size(hb.size)
+                self._place_attack_rect(hb.rect, hb.size)
             hb.ttl_ms -= ms
             if hb.ttl_ms <= 0:
-                self._hitboxes.remove(hb)
+                self._hitboxes.release(hb)
                 continue
             if enemies:
-                for enemy in list(enemies):
+                for enemy in enemies_in_rect(enemies, hb.rect):
                     if not getattr(enemy, "alive", True):
                         continue
                     rect = getattr(enemy, "rect", None)
@@ -494,38 +573,29 @@ class Player(pygame.sprite.Sprite):
             idx = int(self.anim_timer) % len(orient_frames)
             self.frame_index = idx
             frame = orient_frames[idx]
-            if self._hurt_timer > 0:
-                frame = frame.copy()
-                frame.fill((255, 160, 160, 180), special_flags=pygame.BLEND_RGBA_MULT)
-            frame_to_draw = frame
+            flip = False
             overlay_orientation = orientation
         elif frames:
             idx = int(self.anim_timer) % len(frames)
             self.frame_index = idx
             frame = frames[idx]
-            frame_to_draw = frame
-            if self.facing == "left":
-                frame_to_draw = pygame.transform.flip(frame, True, False)
-            if self._hurt_timer > 0:
-                frame_to_draw = frame_to_draw.copy()
-                frame_to_draw.fill((255, 160, 160, 180), special_flags=pygame.BLEND_RGBA_MULT)
+            flip = self.facing == "left"
             overlay_orientation = self.facing
         else:
             self.image = None
             return
 
+        overlay = None
         if self.state == "attack" and overlay_orientation:
             overlays = self._attack_overlays.get(overlay_orientation)
             if not overlays and overlay_orientation in {"left", "right"}:
                 fallback = "left" if overlay_orientation == "left" else "right"
                 overlays = self._attack_overlays.get(fallback)
             if overlays:
-                idx = int(self.anim_timer) % len(overlays)
-                overlay = overlays[idx]
-                frame_to_draw = frame_to_draw.copy()
-                frame_to_draw.blit(overlay, (0, 0))
+                overlay = overlays[int(self.anim_timer) % len(overlays)]
 
-        self.image = frame_to_draw
+        tint = HURT_TINT if self._hurt_timer > 0 else None
+        self.image = variants.get(frame, flip=flip, tint=tint, overlay=overlay)
 
     def _recover_resources(self, dt: float) -> None:
         """Passive HP/stamina regeneration."""
@@ -549,18 +619,27 @@ class Player(pygame.sprite.Sprite):
     # ------------------------------------------------------------------
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(
-            int(self.pos.x - self.size.x / 2),
-            int(self.pos.y - self.size.y),
-            int(self.size.x),
-            int(self.size.y),
-        )
+        """Bounds anchored at ``pos`` (mid-bottom), rebuilt in place only after ``pos`` moved.
+
+        The Rect is shared between calls, so copy it to keep it and never mutate
+        it. ``size`` is replaced, never changed in place.
+        """
+
+        pos, size, rect = self.pos, self.size, self._rect
+        if pos.x != self._rect_x or pos.y != self._rect_y or size is not self._rect_size:
+            self._rect_x = pos.x
+            self._rect_y = pos.y
+            self._rect_size = size
+            rect.update(int(pos.x - size.x / 2), int(pos.y - size.y), int(size.x), int(size.y))
+        return rect
 
     @property
     def dash_cooldown(self) -> float:
         return self._dash_cooldown
 
-    def draw(self, surface: pygame.Surface, offset: Optional[pygame.Vector2] = None) -> None:
+    def draw(self, surface: pygame.Surface, offset: Optional[pygame.Vector2] = None, alpha: float = 1.0) -> pygame.Rect:
+        """Blit the current frame, ``alpha`` of the way between the last two sim steps."""
+
         offset = offset or pygame.Vector2(0, 0)
         if self.image is None:
             frames = self.animations.get(self.state, [])
@@ -570,11 +649,12 @@ class Player(pygame.sprite.Sprite):
                 img = frame
             else:
                 frame = frames[int(self.frame_index) % len(frames)] if frames else pygame.Surface((32, 32))
-                img = pygame.transform.flip(frame, True, False) if self.facing == "left" else frame
+                img = variants.get(frame, flip=self.facing == "left")
         else:
             img = self.image
-        rect = self.rect.move(-offset.x + 40, -offset.y + 40)
-        surface.blit(img, rect)
+        pos = interpolate(self.prev_pos, self.pos, alpha)
+        rect = pygame.Rect(int(pos.x - self.size.x / 2), int(pos.y - self.size.y), int(self.size.x), int(self.size.y))
+        return surface.blit(img, rect.move(-offset.x + 40, -offset.y + 40))
 
     def _clamp_to_bounds(self, world) -> None:
         bounds = getattr(world, "bounds", None)
@@ -0,0 +1,89 @@
+"""Free-list pools for short-lived gameplay objects (hitboxes, projectiles, ground items).
+
+A :class:`Pool` owns its live objects in :attr:`Pool.active` and keeps the
+released ones on a free list. A later :meth:`Pool.acquire` hands a released
+object back out instead of allocating a new one. Both acquire and release are
+O(1): each object remembers its slot in ``active`` (``pool_index``), and
+releasing one moves the last active object into that slot. ``active`` is
+therefore unordered. To release while iterating, walk it backwards, as
+:meth:`Pool.release_where` does.
+
+Pooled classes construct with no arguments and implement ``reset(*args)``,
+which :meth:`Pool.acquire` calls with its own arguments. Every pool records
+its high-water mark; :func:`high_water_marks` gathers them by name for the
+profiler overlay.
+"""
+from __future__ import annotations
+
+import weakref
+from typing import Callable, Dict, Generic, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+_pools: "weakref.WeakSet[Pool]" = weakref.WeakSet()
+
+
+class Pool(Generic[T]):
+    """Reusable instances of ``factory()``; see the module docstring for the contract."""
+
+    def __init__(self, factory: Callable[[], T], name: str) -> None:
+        self.factory = factory
+        self.name = name
+        self.active: List[T] = []
+        self._free: List[T] = []
+        self.created = 0
+        self.high_water = 0
+        _pools.add(self)
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.active)
+
+    def acquire(self, *args, **kwargs) -> T:
+        if self._free:
+            obj = self._free.pop()
+        else:
+            obj = self.factory()
+            self.created += 1
+        obj.reset(*args, **kwargs)
+        obj.pool_index = len(self.active)
+        self.active.append(obj)
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return obj
+
+    def release(self, obj: T) -> None:
+        index = obj.pool_index
+        if index < 0:
+            return
+        last = self.active.pop()
+        if last is not obj:
+            self.active[index] = last
+            last.pool_index = index
+        obj.pool_index = -1
+        self._free.append(obj)
+
+    def release_where(self, predicate: Callable[[T], bool]) -> None:
+        """Release every active object for which ``predicate`` is true."""
+
+        active = self.active
+        for i in range(len(active) - 1, -1, -1):
+            if predicate(active[i]):
+                self.release(active[i])
+
+    def clear(self) -> None:
+        for obj in self.active:
+            obj.pool_index = -1
+        self._free.extend(self.active)
+        self.active.clear()
+
+
+def high_water_marks() -> Dict[str, int]:
+    """Largest number of objects ever live at once, per pool name, over every live pool."""
+
+    marks: Dict[str, int] = {}
+    for pool in list(_pools):
+        marks[pool.name] = max(marks.get(pool.name, 0), pool.high_water)
+    return marks
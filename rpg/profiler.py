@@ -0,0 +1,178 @@
+"""Per-phase frame timings with an F3 overlay and CSV export.
+
+``Game`` and the scenes call :meth:`FrameProfiler.lap` at phase boundaries;
+each lap charges the time since the previous one to the named phase. While
+the profiler is disabled every hook is a single attribute check.
+"""
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+from .pool import high_water_marks
+from .utils import asset_cache_bytes, load_pixel_font, surface_bytes
+
+# (key, label, graph colour) in the order the phases run within a frame.
+PHASES: Tuple[Tuple[str, str, Tuple[int, int, int]], ...] = (
+    ("events", "events", (150, 150, 160)),
+    ("player", "player.update", (90, 170, 255)),
+    ("enemies", "enemies", (235, 95, 85)),
+    ("hud_update", "hud.update", (250, 200, 80)),
+    ("update", "update (other)", (120, 110, 200)),
+    ("draw", "scene draw", (90, 205, 120)),
+    ("hud_draw", "hud draw", (245, 150, 60)),
+    ("minimap", "minimap", (80, 210, 210)),
+    ("flip", "display flip", (225, 120, 220)),
+)
+_KEYS = tuple(key for key, _, _ in PHASES)
+
+PROFILE_DIR = "profiles"
+
+
+class FrameProfiler:
+    """Rolling per-phase frame times, entity counts and surface memory.
+
+    Call :meth:`begin_frame` after the frame limiter wakes up, :meth:`lap` at
+    each phase boundary and :meth:`end_frame` once the frame is presented.
+    The last ``history`` frames are kept for the graph and for :meth:`export_csv`.
+    """
+
+    GRAPH_FRAMES = 180
+    GRAPH_MS = 33.3  # graph height in milliseconds; taller frames are clipped
+    TEXT_EVERY = 15  # frames between legend refreshes
+
+    def __init__(self, history: int = 600) -> None:
+        self.enabled = False
+        self.frames: Deque[Tuple[int, Tuple[float, ...], Dict[str, int]]] = deque(maxlen=history)
+        self.frame_no = 0
+        self._phase = dict.fromkeys(_KEYS, 0.0)
+        self._last = 0.0
+        self._counts: Dict[str, int] = {}
+        self._memory = 0
+        self._text: List[pygame.Surface] = []
+        self._font: Optional[pygame.font.Font] = None
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self._text = []
+        self._phase = dict.fromkeys(_KEYS, 0.0)
+        self._last = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the last lap to ``phase``."""
+
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._phase[phase] += now - self._last
+        self._last = now
+
+    def skip(self) -> None:
+        """Restart the lap clock without charging anything (the overlay's own cost)."""
+
+        if not self.enabled:
+            return
+        self._last = time.perf_counter()
+
+    def end_frame(self, scene=None) -> None:
+        if not self.enabled:
+            return
+        self.frame_no += 1
+        if scene is not None and (self.frame_no % self.TEXT_EVERY == 1 or not self._counts):
+            self._counts = dict(scene.stats())
+            self._memory = _surface_memory(self._counts.pop("surface_bytes", 0))
+            self._counts.update((f"{name}_peak", mark) for name, mark in high_water_marks().items())
+        counts = dict(self._counts, surface_kb=self._memory // 1024)
+        self.frames.append((self.frame_no, tuple(self._phase[key] * 1000.0 for key in _KEYS), counts))
+        self._phase = dict.fromkeys(_KEYS, 0.0)
+
+    # ------------------------------------------------------------------
+    def averages(self, frames: Optional[int] = None) -> Dict[str, float]:
+        """Mean milliseconds per phase over the last ``frames`` frames."""
+
+        rows = list(self.frames)[-frames:] if frames else list(self.frames)
+        if not rows:
+            return dict.fromkeys(_KEYS, 0.0)
+        return {key: sum(row[1][i] for row in rows) / len(rows) for i, key in enumerate(_KEYS)}
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """Write the retained frames as CSV (one row per frame) and return the path."""
+
+        import csv
+
+        if path is None:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, time.strftime("frames-%Y%m%d-%H%M%S.csv"))
+        count_keys: List[str] = []
+        for _, _, counts in self.frames:
+            count_keys.extend(key for key in counts if key not in count_keys)
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["frame", "total_ms", *(f"{key}_ms" for key in _KEYS), *count_keys])
+            for frame_no, times, counts in self.frames:
+                writer.writerow(
+                    [frame_no, f"{sum(times):.4f}", *(f"{ms:.4f}" for ms in times), *(counts.get(key, "") for key in count_keys)]
+                )
+        return path
+
+    # ------------------------------------------------------------------
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the stacked frame-time graph and legend; returns the panel rect."""
+
+        graph_w, graph_h = self.GRAPH_FRAMES, 100
+        if not self._text or self.frame_no % self.TEXT_EVERY == 0:
+            self._text = self._render_text()
+        text_h = sum(line.get_height() for line in self._text)
+        panel = pygame.Rect(0, 0, graph_w + 180, max(graph_h, text_h) + 16)
+        panel.bottomright = (surface.get_width() - 12, surface.get_height() - 12)
+        pygame.draw.rect(surface, (12, 14, 20), panel)
+        pygame.draw.rect(surface, (235, 235, 245), panel, 1)
+
+        base = panel.x + 8, panel.y + 8 + graph_h
+        scale = graph_h / self.GRAPH_MS
+        rows = list(self.frames)[-graph_w:]
+        x = base[0] + graph_w - len(rows)
+        for _, times, _ in rows:
+            y = base[1]
+            for (_, _, colour), ms in zip(PHASES, times):
+                height = ms * scale
+                top = max(base[1] - graph_h, int(y - height))
+                if y - top >= 1:
+                    pygame.draw.line(surface, colour, (x, top), (x, int(y) - 1))
+                y -= height
+            x += 1
+        # 16.7 ms budget line.
+        budget_y = base[1] - int(1000.0 / 60 * scale)
+        pygame.draw.line(surface, (235, 235, 245), (base[0], budget_y), (base[0] + graph_w, budget_y))
+
+        y = panel.y + 8
+        for line in self._text:
+            surface.blit(line, (base[0] + graph_w + 10, y))
+            y += line.get_height()
+        return panel
+
+    def _render_text(self) -> List[pygame.Surface]:
+        if self._font is None:
+            self._font = load_pixel_font(12)
+        averages = self.averages(self.GRAPH_FRAMES)
+        lines = [(f"frame {sum(averages.values()):.2f} ms", (235, 235, 245))]
+        lines += [(f"{label} {averages[key]:.2f}", colour) for key, label, colour in PHASES]
+        counts = self.frames[-1][2] if self.frames else {}
+        lines += [(f"{key} {value}", (200, 200, 210)) for key, value in counts.items()]
+        return [self._font.render(text, True, colour) for text, colour in lines]
+
+
+def _surface_memory(scene_bytes: int) -> int:
+    screen = pygame.display.get_surface()
+    return scene_bytes + asset_cache_bytes() + (surface_bytes([screen]) if screen else 0)
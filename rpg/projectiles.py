@@ -4,14 +4,26 @@ from .items import GroundItem
 from .constants import DAMAGE_DAGGER
 
 class DaggerProjectile:
+    """A thrown dagger. Keep them in a ``Pool(DaggerProjectile, "projectiles")``."""
+
     SPEED = 520
     MAX_DIST = 420
 
-    def __init__(self, pos, direction):
-        self.start = pygame.Vector2(pos)
-        self.pos = pygame.Vector2(pos)
-        self.dir = vnorm(direction) if direction.length_squared() else pygame.Vector2(1,0)
+    def __init__(self, pos=(0, 0), direction=None):
+        self.start = pygame.Vector2()
+        self.pos = pygame.Vector2()
+        self.dir = pygame.Vector2(1, 0)
         self.radius = 6
+        self.pool_index = -1
+        self.reset(pos, direction if direction is not None else self.dir)
+
+    def reset(self, pos, direction):
+        self.start.update(pos)
+        self.pos.update(pos)
+        if direction.length_squared():
+            self.dir.update(vnorm(direction))
+        else:
+            self.dir.update(1, 0)
         self.alive = True
         self.drop_spawned = False
 
@@ -22,6 +34,9 @@ class DaggerProjectile:
         next_pos = self.pos + step
 
         # enemy hit
+        if hasattr(enemies, "query_rect"):
+            reach = int(self.radius + enemies.max_radius) + 1
+            enemies = enemies.query_rect(pygame.Rect(next_pos.x - reach, next_pos.y - reach, reach * 2, reach * 2))
         for en in enemies:
             if en.alive and (next_pos - en.pos).length() <= (self.radius + en.radius):
                 en.take_damage(DAMAGE_DAGGER)
@@ -39,7 +54,10 @@ class DaggerProjectile:
     def _drop(self, items, where):
         self.alive = False
         if not self.drop_spawned:
-            items.append(GroundItem(where, "dagger"))
+            if hasattr(items, "acquire"):
+                items.acquire(where, "dagger")
+            else:
+                items.append(GroundItem(where, "dagger"))
             self.drop_spawned = True
 
     def draw(self, surf):
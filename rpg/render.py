@@ -0,0 +1,137 @@
+"""Draw-side helpers shared by the scenes."""
+from __future__ import annotations
+
+from typing import Callable, Iterable, List, Optional
+
+import pygame
+
+
+class ViewCuller:
+    """Filters world-space drawables down to those intersecting the camera view.
+
+    Call :meth:`begin` once per frame, then :meth:`visible` for each batch of
+    drawables. ``drawn``/``total`` accumulate across the batches of the frame
+    for the debug overlay.
+    """
+
+    def __init__(self, margin: int = 32) -> None:
+        self.margin = margin
+        self.view = pygame.Rect(0, 0, 0, 0)
+        self.drawn = 0
+        self.total = 0
+
+    def begin(self, camera: pygame.Vector2, size: tuple[int, int]) -> pygame.Rect:
+        self.view = pygame.Rect(int(camera.x), int(camera.y), *size).inflate(self.margin * 2, self.margin * 2)
+        self.drawn = 0
+        self.total = 0
+        return self.view
+
+    def visible(
+        self,
+        items: Iterable,
+        bounds: Optional[Callable[[object], pygame.Rect]] = None,
+    ) -> List:
+        """Items whose rect (or ``bounds(item)``) touches the view, in order."""
+
+        view = self.view
+        found = []
+        count = 0
+        for item in items:
+            count += 1
+            rect = bounds(item) if bounds else item.rect
+            if view.colliderect(rect):
+                found.append(item)
+        self.total += count
+        self.drawn += len(found)
+        return found
+
+    def visible_indexed(self, index, total: int, *more) -> List:
+        """Like :meth:`visible` but asks spatial indexes, sorted back-to-front by ``pos.y``."""
+
+        found = index.query_rect(self.view)
+        for extra in more:
+            found += extra.query_rect(self.view)
+        found.sort(key=lambda item: item.pos.y)
+        self.total += total
+        self.drawn += len(found)
+        return found
+
+    def tally(self, drawn: int, total: int) -> None:
+        """Count a batch culled elsewhere (e.g. by an :class:`~rpg.swarm.EnemySwarm`)."""
+
+        self.total += total
+        self.drawn += drawn
+
+    def label(self) -> str:
+        return f"Drawn {self.drawn}/{self.total}"
+
+
+class DirtyRegions:
+    """Screen areas touched by a frame, for ``pygame.display.update(rects)``.
+
+    Scenes :meth:`add` the rects they drew and return :meth:`collect` from
+    ``draw``. The result also covers last frame's rects so vacated areas are
+    presented. ``None`` asks for a full flip: after :meth:`invalidate`, when
+    the camera passed to :meth:`begin` moved, or when there are so many regions
+    or the changed area is large enough that a flip is no dearer.
+    """
+
+    def __init__(self, full_ratio: float = 0.5, max_rects: int = 128) -> None:
+        self.full_ratio = full_ratio
+        self.max_rects = max_rects
+        self.screen = pygame.Rect(0, 0, 0, 0)
+        self._rects: List[pygame.Rect] = []
+        self._previous: List[pygame.Rect] = []
+        self._camera: Optional[tuple[int, int]] = None
+        self._full = True
+
+    def invalidate(self) -> None:
+        self._full = True
+
+    def begin(self, surface: pygame.Surface, camera: Optional[pygame.Vector2] = None) -> None:
+        if surface.get_size() != self.screen.size:
+            self.screen = surface.get_rect()
+            self._full = True
+        key = (int(camera.x), int(camera.y)) if camera is not None else None
+        if key != self._camera:
+            self._camera = key
+            self._full = True
+        self._rects = []
+
+    def add(self, rect: Optional[pygame.Rect]) -> None:
+        if rect is None:
+            return
+        rect = self.screen.clip(rect)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def collect(self) -> Optional[List[pygame.Rect]]:
+        current = self._rects
+        rects = current + self._previous
+        self._previous = current
+        if self._full:
+            self._full = False
+            return None
+        # Past this many regions a flip is cheaper than merging and listing them.
+        if len(rects) > self.max_rects:
+            return None
+        rects = _merge_rects(rects)
+        area = sum(rect.width * rect.height for rect in rects)
+        if area > self.screen.width * self.screen.height * self.full_ratio:
+            return None
+        return rects
+
+
+def _merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Fold overlapping rects together when their union is no bigger than the pair."""
+
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        for i, other in enumerate(merged):
+            union = other.union(rect)
+            if union.width * union.height <= other.width * other.height + rect.width * rect.height:
+                merged[i] = union
+                break
+        else:
+            merged.append(rect)
+    return merged
@@ -0,0 +1,193 @@
+"""Record a session's per-tick input and replay it headlessly, tick for tick.
+
+A recording holds everything :meth:`Game.step` consumed. That is the held
+state of every :class:`Keys` binding (stored only when it changes) and each
+KEYDOWN event, plus the gameplay RNG seed and how the session started. Scene
+changes and a state fingerprint every ``CHECK_INTERVAL`` ticks are stored as
+well, so a replay can report the first tick where it diverged. The file is a
+small header followed by the zlib-compressed payload (:mod:`rpg.savefmt`
+encoding)::
+
+    magic "RPGR" | version u8 | reserved u8 x3 | payload length u32
+
+Record with ``python main.py --record FILE`` or ``python -m rpg.headless
+--record FILE``. Replay with ``python -m rpg.headless --replay FILE [--draw]``.
+Sessions that load a save slot replay only where that slot exists unchanged.
+"""
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from . import rng
+from .constants import Keys
+from .savefmt import pack, unpack
+
+MAGIC = b"RPGR"
+VERSION = 1
+HEADER = struct.Struct("<4sB3xI")
+CHECK_INTERVAL = 60
+
+# Bindings whose held state is recorded, one bit each.
+BINDINGS: Tuple[int, ...] = tuple(code for name, code in sorted(vars(Keys).items()) if name.isupper())
+
+
+class ReplayError(ValueError):
+    """The file is not a recording, or comes from a newer build."""
+
+
+def fingerprint(game) -> int:
+    """Checksum of the state a diverging replay would show first."""
+
+    player = game.state.player
+    scene = game.scene
+    parts = [type(scene).__name__, str(len(getattr(scene, "enemies", ())))]
+    if player is not None:
+        parts += [
+            f"{player.pos.x:.3f},{player.pos.y:.3f}",
+            f"{player.hp:.3f}",
+            str(player.leveling.level),
+            str(player.leveling.xp),
+            str(player.gold),
+        ]
+    return zlib.crc32("|".join(parts).encode("utf-8"))
+
+
+class Recorder:
+    """Collects what each :meth:`Game.step` sees; attach as ``game.recorder``."""
+
+    def __init__(self, start: Dict[str, object], seed: int, dt: float, path: Optional[str] = None) -> None:
+        self.path = path
+        self.start = dict(start)
+        self.seed = seed
+        self.dt = dt
+        self.ticks = 0
+        self._mask: Optional[int] = None
+        self._held: List[int] = []
+        self._presses: List[int] = []
+        self._scenes: List[list] = []
+        self._checks: List[int] = []
+
+    def step(self, tick: int, events, keys) -> None:
+        mask = 0
+        for bit, code in enumerate(BINDINGS):
+            if keys[code]:
+                mask |= 1 << bit
+        if mask != self._mask:
+            self._mask = mask
+            self._held += (tick, mask)
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self._presses += (tick, event.key, event.mod)
+        self.ticks = tick + 1
+
+    def stepped(self, tick: int, game) -> None:
+        if tick % CHECK_INTERVAL == 0:
+            self._checks += (tick, fingerprint(game))
+
+    def scene_changed(self, tick: int, name: str) -> None:
+        self._scenes.append([tick, name])
+
+    def dumps(self) -> bytes:
+        payload = zlib.compress(
+            pack(
+                {
+                    "seed": self.seed,
+                    "start": self.start,
+                    "dt": self.dt,
+                    "ticks": self.ticks,
+                    "bindings": list(BINDINGS),
+                    "held": self._held,
+                    "presses": self._presses,
+                    "scenes": self._scenes,
+                    "checks": self._checks,
+                }
+            ),
+            9,
+        )
+        return HEADER.pack(MAGIC, VERSION, len(payload)) + payload
+
+    def save(self, path: Optional[str] = None) -> None:
+        from .save import write_atomic
+
+        path = path or self.path
+        write_atomic(path, self.dumps())
+        print(f"[info] recorded {self.ticks} ticks to {path}")
+
+
+class Replay:
+    """A loaded recording; feeds :func:`rpg.headless.run_headless` like a ``ScriptedInput``."""
+
+    def __init__(self, data: Dict[str, object]) -> None:
+        from .headless import KeySet
+
+        self.seed = int(data["seed"])
+        self.start = data["start"]
+        self.dt = float(data["dt"])
+        self.ticks = int(data["ticks"])
+        self.scenes = [tuple(entry) for entry in data["scenes"]]
+        bindings = data["bindings"]
+        held = data["held"]
+        self._held: List[Tuple[int, KeySet]] = [
+            (held[i], KeySet(code for bit, code in enumerate(bindings) if held[i + 1] >> bit & 1))
+            for i in range(0, len(held), 2)
+        ]
+        presses = data["presses"]
+        self._presses: Dict[int, List[Tuple[int, int]]] = {}
+        for i in range(0, len(presses), 3):
+            self._presses.setdefault(presses[i], []).append((presses[i + 1], presses[i + 2]))
+        checks = data["checks"]
+        self._checks = {checks[i]: checks[i + 1] for i in range(0, len(checks), 2)}
+        self._cursor = 0
+        self._current = KeySet()
+        self.diverged: Optional[int] = None
+
+    @classmethod
+    def loads(cls, blob: bytes) -> "Replay":
+        if len(blob) < HEADER.size:
+            raise ReplayError("file too short")
+        magic, version, length = HEADER.unpack_from(blob)
+        if magic != MAGIC:
+            raise ReplayError("not a recording")
+        if version > VERSION:
+            raise ReplayError(f"recording version {version} is newer than this build ({VERSION})")
+        try:
+            data = unpack(zlib.decompress(blob[HEADER.size : HEADER.size + length]))
+        except (zlib.error, ValueError) as exc:
+            raise ReplayError(f"corrupt recording: {exc}") from exc
+        return cls(data)
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+    def keys(self, tick: int):
+        # Ticks only move forward during a replay, so walk the change list once.
+        held = self._held
+        while self._cursor < len(held) and held[self._cursor][0] <= tick:
+            self._current = held[self._cursor][1]
+            self._cursor += 1
+        return self._current
+
+    def events(self, tick: int) -> List[pygame.event.Event]:
+        return [
+            pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode="", scancode=0)
+            for key, mod in self._presses.get(tick, ())
+        ]
+
+    def prepare(self) -> None:
+        """Reseed the gameplay streams; call before the starting scene is built."""
+
+        rng.reseed(self.seed)
+
+    def check(self, tick: int, game) -> bool:
+        """Compare the state after ``tick`` with the recording; False from the first mismatch."""
+
+        expected = self._checks.get(tick)
+        if expected is not None and self.diverged is None and fingerprint(game) != expected:
+            self.diverged = tick
+        return self.diverged is None
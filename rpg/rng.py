@@ -0,0 +1,42 @@
+"""Seeded random streams for gameplay, so a recorded session replays the same world.
+
+Every consumer draws from its own named stream (``stream("gates")``), so a
+new draw in one system does not shift the numbers another one sees. All
+streams derive from a single session seed. :mod:`rpg.replay` stores that
+seed with a recording and calls :func:`reseed` with it before replaying.
+"""
+from __future__ import annotations
+
+import random
+from typing import Dict, Optional
+
+
+class RngProvider:
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed = 0
+        self._streams: Dict[str, random.Random] = {}
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """Start every stream over from ``seed`` (a fresh one when ``None``) and return it."""
+
+        self.seed = int(seed) if seed is not None else random.SystemRandom().randrange(1 << 32)
+        self._streams.clear()
+        return self.seed
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(f"{self.seed}:{name}")
+        return rng
+
+
+provider = RngProvider()
+
+
+def stream(name: str) -> random.Random:
+    return provider.stream(name)
+
+
+def reseed(seed: Optional[int] = None) -> int:
+    return provider.reseed(seed)
@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Callable
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 from pygame import Vector2
 
-from .inventory import Inventory
+from .savefmt import SaveFormatError, dumps, loads
 
 SAVE_DIR = os.path.join(os.getcwd(), "save")
-SAVE_PATH = os.path.join(SAVE_DIR, "slot1.json")
+SLOT_COUNT = 3
+# Per-slot headers, so listing saves never opens the saves themselves.
+INDEX_PATH = os.path.join(SAVE_DIR, "index.json")
+# Read (and upgraded) into slot 1 when no binary save exists yet.
+LEGACY_SAVE_PATHS = (
+    os.path.join(SAVE_DIR, "slot1.json"),
+    os.path.join(os.getcwd(), "saves", "slot1.json"),
+)
+
+Header = Dict[str, object]
 
 
 def ensure_dir() -> None:
@@ -17,50 +29,315 @@ def ensure_dir() -> None:
         os.makedirs(SAVE_DIR, exist_ok=True)
 
 
-def save_game(state) -> None:
+def slot_path(slot: int) -> str:
+    return os.path.join(SAVE_DIR, f"slot{int(slot)}.sav")
+
+
+def snapshot_game(state) -> Optional[dict]:
+    """Plain-data copy of what gets saved; cheap enough to take on the main thread."""
+
     if not state.player:
-        return
-    ensure_dir()
+        return None
     player = state.player
     state.gold = int(getattr(player, "gold", 0))
-    data = {
+    return {
         "map": state.scene_name or "overworld",
         "pos": [float(player.pos.x), float(player.pos.y)],
         "hp": int(player.hp),
         "stamina": float(player.stamina),
+        "base_max_hp": float(player.base_max_hp),
+        "base_max_stamina": float(player.base_max_stamina),
+        "stats": player.stats.data(),
+        "mp": float(player.mp),
+        "max_mp": float(player.max_mp),
+        "hp_pots": int(player.hp_pots),
+        "mp_pots": int(player.mp_pots),
         "who": getattr(player, "who", "JINWOO"),
         "level": player.leveling.level,
         "xp": player.leveling.xp,
         "xp_to_next": player.leveling.xp_to_next,
+        "stat_points": player.leveling.stat_points,
+        "skill_points": player.leveling.skill_points,
         "gold": state.gold,
         "inventory": player.inventory.data(),
+        "unlocked": dict(state.unlocked),
+    }
+
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """Replace ``path`` with ``payload`` so readers see the old file or the new one, never half."""
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # A unique temp file per call: the index can be rewritten by the main thread
+    # and the save worker at once.
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files private to the owner
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself; not available (or needed) on Windows.
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def encode_save(data: dict) -> bytes:
+    return dumps(data)
+
+
+def slot_header(data: dict, saved_at: Optional[float] = None) -> Header:
+    """The few fields the slot list shows, taken from a save dict."""
+
+    return {
+        "who": data.get("who", "JINWOO"),
+        "level": int(data.get("level", 1)),
+        "gold": int(data.get("gold", 0)),
+        "scene": data.get("map", "overworld"),
+        "saved_at": float(saved_at if saved_at is not None else time.time()),
     }
-    with open(SAVE_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
 
 
-def load_game(state, player_factory: Callable[[str], object]) -> bool:
-    if not os.path.isfile(SAVE_PATH):
-        print("[info] no save found to load")
+def read_index() -> Dict[int, Header]:
+    """Slot headers from the index file, rebuilt from the slot files if it is missing or unreadable."""
+
+    try:
+        with open(INDEX_PATH, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        return {int(slot): dict(header) for slot, header in raw.get("slots", {}).items()}
+    except (OSError, ValueError, AttributeError, TypeError):
+        pass
+    headers: Dict[int, Header] = {}
+    for slot in range(1, SLOT_COUNT + 1):
+        path = find_save(slot)
+        if path is None:
+            continue
+        try:
+            headers[slot] = slot_header(read_save(path), os.path.getmtime(path))
+        except (OSError, SaveFormatError):
+            continue
+    if headers:
+        try:
+            write_index(headers)
+        except OSError:
+            pass
+    return headers
+
+
+def write_index(headers: Dict[int, Header]) -> None:
+    payload = {"version": 1, "slots": {str(slot): header for slot, header in sorted(headers.items())}}
+    write_atomic(INDEX_PATH, json.dumps(payload, indent=2).encode("utf-8"))
+
+
+def list_slots(headers: Optional[Dict[int, Header]] = None) -> List[Tuple[int, Optional[Header]]]:
+    """``(slot, header or None)`` for every slot, in slot order."""
+
+    headers = read_index() if headers is None else headers
+    return [(slot, headers.get(slot)) for slot in range(1, SLOT_COUNT + 1)]
+
+
+def latest_slot(headers: Dict[int, Header]) -> Optional[int]:
+    if not headers:
+        return None
+    return max(headers, key=lambda slot: headers[slot].get("saved_at", 0.0))
+
+
+def free_slot(headers: Dict[int, Header]) -> int:
+    """First empty slot, else the one saved longest ago."""
+
+    for slot in range(1, SLOT_COUNT + 1):
+        if slot not in headers:
+            return slot
+    return min(headers, key=lambda slot: headers[slot].get("saved_at", 0.0))
+
+
+def save_game(state, slot: Optional[int] = None) -> None:
+    data = snapshot_game(state)
+    if data is None:
+        return
+    slot = slot or state.save_slot
+    ensure_dir()
+    write_atomic(slot_path(slot), encode_save(data))
+    headers = read_index()
+    headers[slot] = slot_header(data)
+    write_index(headers)
+
+
+class SaveService:
+    """Writes saves on a background thread.
+
+    :meth:`request` snapshots the state on the caller's thread and hands it to
+    the worker, which encodes and writes it atomically. Requests for a slot
+    arriving while a write is in flight collapse into one: only the newest
+    snapshot is written. Call :meth:`flush` before reading a save back and
+    :meth:`close` on exit.
+
+    The service also keeps the slot headers in memory, updated as saves are
+    requested, so :meth:`headers` is current without waiting for the disk.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending: Dict[int, dict] = {}
+        self._headers: Optional[Dict[int, Header]] = None
+        self.revision = 0
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.requested = 0
+        self.written = 0
+        self.coalesced = 0
+        self.last_error: Optional[BaseException] = None
+
+    def request(self, state, slot: Optional[int] = None) -> bool:
+        data = snapshot_game(state)
+        if data is None:
+            return False
+        slot = slot or state.save_slot
+        headers = self.headers()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SaveService is closed")
+            if slot in self._pending:
+                self.coalesced += 1
+            self._pending[slot] = data
+            headers[slot] = slot_header(data)
+            self.revision += 1
+            self.requested += 1
+            self._ensure_worker()
+            self._cond.notify_all()
+        return True
+
+    def headers(self) -> Dict[int, Header]:
+        """Slot headers including saves still queued; read from disk once."""
+
+        if self._headers is None:
+            self._headers = read_index()
+        return self._headers
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every requested save is on disk; False if ``timeout`` ran out."""
+
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                pending, self._pending = self._pending, {}
+                headers = dict(self._headers or {})
+                self._busy = True
+            try:
+                ensure_dir()
+                for slot, data in pending.items():
+                    write_atomic(slot_path(slot), encode_save(data))
+                write_index(headers)
+            except (OSError, TypeError, ValueError) as exc:
+                self.last_error = exc
+                print(f"[warn] save failed: {exc}")
+            else:
+                self.written += 1
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+def find_save(slot: int = 1) -> Optional[str]:
+    candidates = (slot_path(slot), *LEGACY_SAVE_PATHS) if slot == 1 else (slot_path(slot),)
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def read_save(path: str) -> dict:
+    """Decode and migrate the save at ``path``; raises SaveFormatError if it is corrupt."""
+
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_game(state, player_factory: Callable[[str], object], slot: Optional[int] = None) -> bool:
+    """Load ``slot`` (default: the state's current slot), reading only that slot's file."""
+
+    slot = slot or state.save_slot
+    path = find_save(slot)
+    if path is None:
+        print(f"[info] no save found in slot {slot}")
         return False
-    with open(SAVE_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    try:
+        # Decoding checks every field's type, so nothing below can fail half way.
+        data = read_save(path)
+    except (OSError, SaveFormatError) as exc:
+        # Nothing has been applied yet, so the running game is untouched.
+        print(f"[warn] cannot load {path}: {exc}")
+        return False
+    from .inventory import Inventory
+    from .stats import Stats
+
     who = data.get("who", "JINWOO")
-    player = state.player or player_factory(who)
-    if getattr(player, "who", who) != who:
+    player = state.player
+    if player is None or getattr(player, "who", who) != who or "stats" not in data:
         player = player_factory(who)
+    leveling = player.leveling
+    leveling.level = data.get("level", leveling.level)
+    if "stats" in data:
+        player.stats = Stats.from_data(data["stats"])
+        player.base_max_hp = data.get("base_max_hp", player.base_max_hp)
+        player.base_max_stamina = data.get("base_max_stamina", player.base_max_stamina)
+    else:
+        # Written before stats were saved: replay the gains of each level-up.
+        for _ in range(leveling.level - 1):
+            player.on_level_up()
     pos = data.get("pos", [0, 0])
     player.pos = Vector2(pos[0], pos[1])
-    player.hp = max(0, min(player.max_hp, int(data.get("hp", player.hp))))
-    player.stamina = max(0.0, min(player.max_stamina, float(data.get("stamina", player.stamina))))
-    player.leveling.level = int(data.get("level", player.leveling.level))
-    player.leveling.xp = int(data.get("xp", player.leveling.xp))
-    player.leveling.xp_to_next = int(data.get("xp_to_next", player.leveling.xp_to_next))
-    player.gold = int(data.get("gold", getattr(player, "gold", 0)))
+    leveling.xp = data.get("xp", leveling.xp)
+    leveling.xp_to_next = data.get("xp_to_next", leveling.xp_to_next)
+    leveling.stat_points = data.get("stat_points", leveling.stat_points)
+    leveling.skill_points = data.get("skill_points", leveling.skill_points)
+    player.gold = data.get("gold", getattr(player, "gold", 0))
+    player.mp = data.get("mp", player.mp)
+    player.max_mp = data.get("max_mp", player.max_mp)
+    player.hp_pots = data.get("hp_pots", player.hp_pots)
+    player.mp_pots = data.get("mp_pots", player.mp_pots)
     player.inventory = Inventory.from_data(data.get("inventory"))
     player.recalculate_stats(full_heal=False)
+    player.hp = max(0, min(player.max_hp, int(data.get("hp", player.hp))))
+    player.stamina = max(0.0, min(player.max_stamina, data.get("stamina", player.stamina)))
 
     state.player = player
+    state.save_slot = slot
     state.gold = player.gold
+    state.unlocked = dict(data.get("unlocked") or {})
     state.scene_name = data.get("map", "overworld")
     return True
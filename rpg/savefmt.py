@@ -0,0 +1,391 @@
+"""Versioned binary save encoding with a checksum and schema migrations.
+
+A save file is a fixed header followed by the payload::
+
+    magic "RPGS" | schema version u8 | flags u8 | reserved u16 | crc32 u32 | length u32
+
+The payload is a msgpack-style encoding of a plain dict, zlib-compressed
+when ``FLAG_ZLIB`` is set. The CRC covers the header fields before it and the
+stored payload, so truncated or corrupt files raise :class:`SaveFormatError`
+before anything is applied. Legacy JSON has no checksum; every decoded save
+is also checked field by field against ``FIELDS``, so a wrongly typed value
+is rejected before it is applied too.
+
+Older layouts (the nested ``saves/slot1.json`` and the flat JSON written by
+earlier builds) are read through :func:`loads` and upgraded step by step by
+the functions in ``MIGRATIONS``.
+"""
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from typing import Any, Callable, Dict, Tuple
+
+MAGIC = b"RPGS"
+CURRENT_VERSION = 3
+FLAG_ZLIB = 0x01
+
+HEADER = struct.Struct("<4sBBHII")
+_CRC_OFFSET = 8  # bytes of header (magic, version, flags, reserved) under the checksum
+
+# Payloads this small are not worth a zlib round trip.
+_COMPRESS_MIN = 256
+
+
+class SaveFormatError(ValueError):
+    """The file is not a save, is corrupt, or comes from a newer build."""
+
+
+# ----------------------------------------------------------------------
+# Value encoding (a msgpack subset: nil, bool, int64, float64, str, list, map)
+_NIL, _FALSE, _TRUE = 0xC0, 0xC2, 0xC3
+_FLOAT64, _INT64 = 0xCB, 0xD3
+_STR32, _ARRAY32, _MAP32 = 0xDB, 0xDD, 0xDF
+
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+def pack(value: Any) -> bytes:
+    out = bytearray()
+    _pack(value, out)
+    return bytes(out)
+
+
+def _pack(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(_NIL)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(value)
+        elif -(1 << 63) <= value < (1 << 63):
+            out.append(_INT64)
+            out += _I64.pack(value)
+        else:
+            raise ValueError(f"integer out of range for a save: {value}")
+    elif isinstance(value, float):
+        out.append(_FLOAT64)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        if len(raw) < 32:
+            out.append(0xA0 | len(raw))
+        else:
+            out.append(_STR32)
+            out += _U32.pack(len(raw))
+        out += raw
+    elif isinstance(value, (list, tuple)):
+        if len(value) < 16:
+            out.append(0x90 | len(value))
+        else:
+            out.append(_ARRAY32)
+            out += _U32.pack(len(value))
+        for item in value:
+            _pack(item, out)
+    elif isinstance(value, dict):
+        if len(value) < 16:
+            out.append(0x80 | len(value))
+        else:
+            out.append(_MAP32)
+            out += _U32.pack(len(value))
+        for key, item in value.items():
+            _pack(key, out)
+            _pack(item, out)
+    else:
+        raise TypeError(f"cannot save values of type {type(value).__name__}")
+
+
+def unpack(data: bytes) -> Any:
+    try:
+        value, offset = _unpack(bytes(data), 0)
+    except (IndexError, struct.error, UnicodeDecodeError) as exc:
+        raise SaveFormatError(f"truncated or malformed payload: {exc}") from exc
+    if offset != len(data):
+        raise SaveFormatError(f"{len(data) - offset} trailing bytes after payload")
+    return value
+
+
+def _unpack(buf: bytes, offset: int) -> Tuple[Any, int]:
+    tag = buf[offset]
+    offset += 1
+    if tag < 0x80:
+        return tag, offset
+    if tag == _NIL:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT64:
+        return _I64.unpack_from(buf, offset)[0], offset + 8
+    if tag == _FLOAT64:
+        return _F64.unpack_from(buf, offset)[0], offset + 8
+    if 0xA0 <= tag <= 0xBF or tag == _STR32:
+        if tag == _STR32:
+            size = _U32.unpack_from(buf, offset)[0]
+            offset += 4
+        else:
+            size = tag & 0x1F
+        end = offset + size
+        if end > len(buf):
+            raise IndexError("string runs past the end of the payload")
+        return buf[offset:end].decode("utf-8"), end
+    if 0x90 <= tag <= 0x9F or tag == _ARRAY32:
+        if tag == _ARRAY32:
+            size = _U32.unpack_from(buf, offset)[0]
+            offset += 4
+        else:
+            size = tag & 0x0F
+        items = []
+        for _ in range(size):
+            item, offset = _unpack(buf, offset)
+            items.append(item)
+        return items, offset
+    if 0x80 <= tag <= 0x8F or tag == _MAP32:
+        if tag == _MAP32:
+            size = _U32.unpack_from(buf, offset)[0]
+            offset += 4
+        else:
+            size = tag & 0x0F
+        mapping = {}
+        for _ in range(size):
+            key, offset = _unpack(buf, offset)
+            mapping[key], offset = _unpack(buf, offset)
+        return mapping, offset
+    raise SaveFormatError(f"unknown type tag 0x{tag:02x}")
+
+
+# ----------------------------------------------------------------------
+# Files
+def dumps(data: Dict[str, Any], *, compress: bool = True) -> bytes:
+    """Encode a current-version save dict into file bytes."""
+
+    payload = pack(data)
+    flags = 0
+    if compress and len(payload) >= _COMPRESS_MIN:
+        payload = zlib.compress(payload, 6)
+        flags |= FLAG_ZLIB
+    prefix = HEADER.pack(MAGIC, CURRENT_VERSION, flags, 0, 0, 0)[:_CRC_OFFSET]
+    return HEADER.pack(MAGIC, CURRENT_VERSION, flags, 0, _checksum(prefix, payload), len(payload)) + payload
+
+
+def _checksum(prefix: bytes, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(prefix))
+
+
+def loads(blob: bytes) -> Dict[str, Any]:
+    """Decode file bytes (binary or legacy JSON) into a current-version save dict."""
+
+    if blob[:4] == MAGIC:
+        data, version = _decode_binary(blob)
+    elif blob.lstrip()[:1] == b"{":
+        try:
+            data = json.loads(blob.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as exc:
+            raise SaveFormatError(f"unreadable JSON save: {exc}") from exc
+        version = _json_version(data)
+    else:
+        raise SaveFormatError("not a save file")
+    if not isinstance(data, dict):
+        raise SaveFormatError("save payload is not a mapping")
+    return validate(migrate(data, version))
+
+
+def _decode_binary(blob: bytes) -> Tuple[Any, int]:
+    if len(blob) < HEADER.size:
+        raise SaveFormatError("truncated header")
+    _, version, flags, _, crc, length = HEADER.unpack_from(blob)
+    payload = blob[HEADER.size:]
+    if len(payload) != length:
+        raise SaveFormatError(f"payload is {len(payload)} bytes, header says {length}")
+    if _checksum(blob[:_CRC_OFFSET], payload) != crc:
+        raise SaveFormatError("checksum mismatch")
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as exc:
+            raise SaveFormatError(f"bad compressed payload: {exc}") from exc
+    return unpack(payload), version
+
+
+def _json_version(data: Any) -> int:
+    if not isinstance(data, dict):
+        return 0
+    if "version" in data:
+        try:
+            return int(data["version"])
+        except (TypeError, ValueError) as exc:
+            raise SaveFormatError(f"bad version field: {data['version']!r}") from exc
+    # Pre-versioned layouts: the nested one keeps everything under "player".
+    return 1 if isinstance(data.get("player"), dict) else 2
+
+
+# ----------------------------------------------------------------------
+# Schema migrations: MIGRATIONS[n] upgrades a version-n dict to version n + 1.
+_LEGACY_WEAPONS = {"dagger": "shadow_dagger", "sword": "training_sword"}
+
+
+def _v1_to_v2(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the nested ``{"scene", "unlocked", "player": {...}}`` layout.
+
+    The dagger/sword flags become inventory items and ``max_hp`` becomes the
+    base maximum before equipment bonuses.
+    """
+
+    player = data.get("player") or {}
+    owned = []
+    if player.get("has_dagger"):
+        owned.append("shadow_dagger")
+    if player.get("has_sword"):
+        owned.append("training_sword")
+    equipped = {}
+    weapon = _LEGACY_WEAPONS.get(player.get("equipped", ""))
+    if weapon in owned:
+        equipped["weapon"] = weapon
+    migrated = {
+        "map": data.get("scene", "overworld"),
+        "pos": list(player.get("pos", [0.0, 0.0])),
+        "who": player.get("who", "JINWOO"),
+        "level": player.get("level", 1),
+        "xp": player.get("xp", 0),
+        "xp_to_next": player.get("xp_to_next", 100),
+        "gold": player.get("gold", 0),
+        "inventory": {"owned": owned, "equipped": equipped},
+        # Not part of v2, carried for the next step.
+        "stat_points": player.get("stat_points", 0),
+        "skill_points": player.get("skill_points", 0),
+        "unlocked": data.get("unlocked", {}),
+    }
+    for key in ("hp", "stats", "mp", "max_mp", "hp_pots", "mp_pots"):
+        if key in player:
+            migrated[key] = player[key]
+    if "max_hp" in player:
+        migrated["base_max_hp"] = player["max_hp"]
+    return migrated
+
+
+def _v2_to_v3(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Persist unspent level-up points and unlocks, which v2 lost on reload.
+
+    v3 also keeps stats, base maxima, mana and potions. Saves without them
+    get the level-up gains replayed on load (see :func:`rpg.save.load_game`).
+    """
+
+    migrated = dict(data)
+    migrated.setdefault("stat_points", 0)
+    migrated.setdefault("skill_points", 0)
+    migrated.setdefault("unlocked", {})
+    return migrated
+
+
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    1: _v1_to_v2,
+    2: _v2_to_v3,
+}
+
+
+# ----------------------------------------------------------------------
+# Field checks for the current schema. Each converter returns the value in
+# the type the loader expects or raises; optional fields may be absent.
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"expected a number, got {value!r}")
+    return float(value)
+
+
+def _integer(value: Any) -> int:
+    number = _number(value)
+    if number != int(number):
+        raise ValueError(f"expected a whole number, got {value!r}")
+    return int(number)
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"expected a string, got {value!r}")
+    return value
+
+
+def _mapping(value: Any) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise TypeError(f"expected a mapping, got {value!r}")
+    return dict(value)
+
+
+def _pos(value: Any) -> list:
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise TypeError(f"expected [x, y], got {value!r}")
+    return [_number(value[0]), _number(value[1])]
+
+
+def _stats(value: Any) -> Dict[str, float]:
+    # Whole-number stats stay ints; crit rate and damage are fractions.
+    return {_text(key): item if type(item) is int else _number(item) for key, item in _mapping(value).items()}
+
+
+def _inventory(value: Any) -> Dict[str, Any]:
+    value = _mapping(value)
+    owned = value.get("owned") or []
+    if not isinstance(owned, (list, tuple)):
+        raise TypeError(f"expected a list of items, got {owned!r}")
+    equipped = _mapping(value.get("equipped") or {})
+    return {
+        "owned": [_text(item) for item in owned],
+        "equipped": {_text(slot): _text(item) for slot, item in equipped.items()},
+    }
+
+
+FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "map": _text,
+    "who": _text,
+    "pos": _pos,
+    "hp": _number,
+    "stamina": _number,
+    "base_max_hp": _number,
+    "base_max_stamina": _number,
+    "level": _integer,
+    "xp": _integer,
+    "xp_to_next": _integer,
+    "stat_points": _integer,
+    "skill_points": _integer,
+    "gold": _integer,
+    "stats": _stats,
+    "mp": _number,
+    "max_mp": _number,
+    "hp_pots": _integer,
+    "mp_pots": _integer,
+    "inventory": _inventory,
+    "unlocked": _mapping,
+}
+
+
+def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert every known field of a current-version save; SaveFormatError on the first bad one."""
+
+    checked = dict(data)
+    for key, convert in FIELDS.items():
+        if key not in checked:
+            continue
+        try:
+            checked[key] = convert(checked[key])
+        except (TypeError, ValueError, OverflowError) as exc:
+            raise SaveFormatError(f"bad {key!r} field: {exc}") from exc
+    return checked
+
+
+def migrate(data: Dict[str, Any], version: int) -> Dict[str, Any]:
+    if version > CURRENT_VERSION:
+        raise SaveFormatError(f"save version {version} is newer than this build ({CURRENT_VERSION})")
+    if version < 1:
+        raise SaveFormatError(f"unknown save version {version}")
+    while version < CURRENT_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+    data.pop("version", None)
+    return data
@@ -1,4 +1,17 @@
+"""Game scenes. Each is imported on first access, so loading the menu does not pull in the world."""
 
-from .menu import SceneMenu
-from .overworld import SceneOverworld
-from .dungeon import SceneDungeon
+_SCENES = {
+    "SceneMenu": ".menu",
+    "SceneOverworld": ".overworld",
+    "SceneDungeon": ".dungeon",
+}
+
+__all__ = list(_SCENES)
+
+
+def __getattr__(name):
+    if name in _SCENES:
+        from importlib import import_module
+
+        return getattr(import_module(_SCENES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,3 +3,6 @@ class SceneBase:
     def handle(self, e): pass
     def update(self, dt): pass
     def draw(self, surf): pass
+    # Forget any cached frame so the next draw repaints the whole surface.
+    def invalidate(self): pass
+    def stats(self): return {}
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
-from typing import Optional
+from typing import List, Optional
 
 import random
 import pygame
 
 from .base import SceneBase
-from ..constants import COL_BG, Keys
-from ..enemy import Enemy
+from ..collision import SolidGrid, SpatialHash
+from ..constants import COL_BG, GATE_FAIL_GOLD_PENALTY, Keys
+from ..enemy import Enemy, dungeon_enemy_stats
 from ..gate import Gate
+from ..render import DirtyRegions, ViewCuller
 from ..ui import HudRenderer, InventoryOverlay
-from ..utils import load_desert_tile, load_pixel_font
+from ..utils import load_desert_tile, load_pixel_font, surface_bytes
 
 
 class SceneDungeon(SceneBase):
@@ -33,11 +35,14 @@ class SceneDungeon(SceneBase):
         self._build_bounds()
 
         self.enemies = pygame.sprite.Group()
+        self.enemy_index = SpatialHash()
         self._spawn_enemies()
 
         self.world = SimpleNamespace(
             collision_sprites=self.collision_sprites,
+            solids=self.solids,
             enemies=self.enemies,
+            enemy_index=self.enemy_index,
             bounds=self.bounds,
         )
 
@@ -55,6 +60,8 @@ class SceneDungeon(SceneBase):
         self._status_timer = 0.0
         self._reward_granted = False
         self._background = self._build_background()
+        self._culler = ViewCuller()
+        self._dirty = DirtyRegions()
 
     # ------------------------------------------------------------------
     def _build_bounds(self) -> None:
@@ -69,6 +76,7 @@ class SceneDungeon(SceneBase):
             sprite = pygame.sprite.Sprite()
             sprite.rect = rect
             self.collision_sprites.add(sprite)
+        self.solids = SolidGrid.from_rects(rects)
 
     def _spawn_enemies(self) -> None:
         positions = [
@@ -78,7 +86,7 @@ class SceneDungeon(SceneBase):
             (self.bounds.centerx + 180, self.bounds.centery + 40),
         ]
         for idx, pos in enumerate(positions):
-            enemy = Enemy(pos, hp=90 + idx * 10, speed=120.0, xp_reward=45)
+            enemy = Enemy(pos, **dungeon_enemy_stats(idx))
             enemy.detection_radius = 420.0
             self.enemies.add(enemy)
 
@@ -109,7 +117,7 @@ class SceneDungeon(SceneBase):
                 from .overworld import SceneOverworld
 
                 self.player.pos = self._entry_return.copy()
-                self.game.change(SceneOverworld(self.game), name="overworld")
+                self.game.change(SceneOverworld.resume(self.game), name="overworld")
             elif event.key == Keys.INTERACT and self._at_exit():
                 self._leave_to_overworld()
 
@@ -118,20 +126,24 @@ class SceneDungeon(SceneBase):
 
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+        keys = self.game.keys
+        prof = self.game.profiler
         if not self.inventory_open:
             self.player.handle_input(keys, self._frame_events)
+        self.enemy_index.rebuild(self.enemies)
         self.player.update(dt, self.world)
         self._frame_events.clear()
+        prof.lap("player")
 
         for enemy in list(self.enemies):
-            enemy.update(dt, self.player, self.collision_sprites, self.bounds)
+            enemy.update(dt, self.player, self.solids, self.bounds)
             if not enemy.alive:
                 self.enemies.remove(enemy)
                 leveled = self.player.leveling.gain_xp(enemy.xp_reward)
                 if leveled:
                     self.player.on_level_up()
                     self.hud.notify_level_up(self.player.leveling.level)
+        prof.lap("enemies")
 
         if not self.enemies and self._cleared_timer == 0.0:
             self._cleared_timer = 1.0
@@ -146,32 +158,56 @@ class SceneDungeon(SceneBase):
 
         self.hud.update(dt)
         self.inventory_overlay.update(dt)
+        prof.lap("hud_update")
         self._tick_status(dt)
 
     # ------------------------------------------------------------------
-    def draw(self, surf: pygame.Surface) -> None:
+    def draw(self, surf: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Draw the frame; returns the changed screen rects, or ``None`` for a full flip."""
+
         surf.fill(COL_BG)
         offset = pygame.Vector2(0, 0)
+        alpha = self.game.alpha
+        dirty = self._dirty
+        dirty.begin(surf, offset)
         if self._background:
             surf.blit(self._background, (self.bounds.x, self.bounds.y))
         pygame.draw.rect(surf, (70, 62, 54), self.bounds, 6, border_radius=12)
         pygame.draw.rect(surf, (245, 224, 180), self.bounds.inflate(-40, -40), 2, border_radius=8)
 
-        for enemy in self.enemies:
-            enemy.draw(surf, offset)
-        self.player.draw(surf, offset)
+        self._culler.begin(offset, surf.get_size())
+        for enemy in self._culler.visible(self.enemies):
+            dirty.add(enemy.draw(surf, offset, alpha))
+        dirty.add(self.player.draw(surf, offset, alpha))
 
-        self.exit_gate.draw(surf, offset)
+        dirty.add(self.exit_gate.draw(surf, offset))
         if self._at_exit():
             prompt = self._ui_font.render("[E] Leave Gate", True, (235, 235, 245))
-            surf.blit(prompt, (surf.get_width() // 2 - prompt.get_width() // 2, surf.get_height() - 72))
+            dirty.add(surf.blit(prompt, (surf.get_width() // 2 - prompt.get_width() // 2, surf.get_height() - 72)))
+        prof = self.game.profiler
+        prof.lap("draw")
 
-        self.hud.draw(surf, self.player, self.player.dash_cooldown)
+        dirty.add(self.hud.draw(surf, self.player, self.player.dash_cooldown))
+        prof.lap("hud_draw")
         if self.inventory_open:
-            self.inventory_overlay.draw(surf, self.player.inventory, self.player.gold)
+            dirty.add(self.inventory_overlay.draw(surf, self.player.inventory, self.player.gold))
         if self._status_message:
             msg = self._ui_font.render(self._status_message, True, (255, 210, 140))
-            surf.blit(msg, (surf.get_width() // 2 - msg.get_width() // 2, 40))
+            dirty.add(surf.blit(msg, (surf.get_width() // 2 - msg.get_width() // 2, 40)))
+        if self.game.debug:
+            dirty.add(surf.blit(self._ui_font.render(self._culler.label(), True, (235, 235, 245)), (12, 12)))
+        rects = dirty.collect()
+        prof.lap("draw")
+        return rects
+
+    def invalidate(self) -> None:
+        self._dirty.invalidate()
+
+    def stats(self) -> dict:
+        return {
+            "enemies": len(self.enemies),
+            "surface_bytes": surface_bytes([self._background]) if self._background else 0,
+        }
 
     def _build_background(self) -> Optional[pygame.Surface]:
         try:
@@ -194,7 +230,7 @@ class SceneDungeon(SceneBase):
         from .overworld import SceneOverworld
 
         self.player.pos = self._entry_return.copy()
-        self.game.change(SceneOverworld(self.game), name="overworld")
+        self.game.change(SceneOverworld.resume(self.game), name="overworld")
 
     def _complete_gate(self) -> None:
         if self._reward_granted:
@@ -208,7 +244,7 @@ class SceneDungeon(SceneBase):
             self.game.state.pending_status = f"Gate cleared! +{reward}G"
 
     def _fail_gate(self) -> None:
-        penalty = int(self.player.gold * 0.2)
+        penalty = int(self.player.gold * GATE_FAIL_GOLD_PENALTY)
         if penalty:
             self.player.gold = max(0, self.player.gold - penalty)
         self.player.revive(self._entry_return, full_heal=True)
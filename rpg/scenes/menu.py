@@ -1,26 +1,26 @@
-import sys
+import time
+
 import pygame
 
 from .base import SceneBase
 from ..constants import CHAR_JINWOO, CHAR_CHA
-from .overworld import SceneOverworld
-from ..player import Player
-from ..save import load_game
+from ..save import free_slot, latest_slot, list_slots, load_game
+from ..utils import get_font
 
 
 class SceneMenu(SceneBase):
     def __init__(self, game):
         super().__init__(game)
 
-        self.f_title = pygame.font.Font(None, 48)  
-        self.f_text  = pygame.font.Font(None, 28)
+        self.f_title = get_font(None, 48)
+        self.f_text  = get_font(None, 28)
 
-        self.items = [
-            ("SUNG", self._start_as_jinwoo),
-            ("HAE", self._start_as_chae),
-            ("Load last session",                 self._load_last_patrol),
-        ]
+        self.items = []
+        self._slots_revision = None
+        self._refresh_items()
         self.sel = 0
+        # What the surface last showed; the menu only changes on input or a new save.
+        self._drawn = None
 
         # Colors for black UI
         self.col = {
@@ -50,9 +50,39 @@ class SceneMenu(SceneBase):
             elif e.key == pygame.K_l:
                 self.sel = 2; self._activate()
             elif e.key == pygame.K_ESCAPE:
-                pygame.quit(); sys.exit()
+                self.game.quit()
+
+    def _refresh_items(self):
+        """Rebuild the entries from the save service's slot headers (no save files are read)."""
+
+        saver = self.game.saver
+        if self._slots_revision == saver.revision and self.items:
+            return
+        self._slots_revision = saver.revision
+        self.items = [
+            ("SUNG", self._start_as_jinwoo),
+            ("HAE", self._start_as_chae),
+            ("Load last session",                 self._load_last_patrol),
+        ]
+        for slot, header in list_slots(saver.headers()):
+            if header:
+                stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(header["saved_at"]))
+                label = f"Slot {slot}  •  {header['who']} Lv {header['level']}  •  {header['gold']}G  •  {header['scene']}  •  {stamp}"
+            else:
+                label = f"Slot {slot}  •  empty"
+            action = (lambda slot=slot: self._load_slot(slot)) if header else (lambda: None)
+            self.items.append((label, action))
+
+    def invalidate(self):
+        self._drawn = None
 
     def draw(self, surf):
+        self._refresh_items()
+        key = (self.sel, surf.get_size(), self._slots_revision)
+        if key == self._drawn:
+            return []
+        self._drawn = key
+
         surf.fill(self.col["bg"])
         W, H = surf.get_size()
 
@@ -84,7 +114,7 @@ class SceneMenu(SceneBase):
                 underline = pygame.Rect(x, y + tex.get_height() + 6, tex.get_width(), 2)
                 pygame.draw.rect(surf, self.col["accent"], underline)
 
-        help_line = "[L] Load last save  •  Esc: Quit"
+        help_line = "[L] Load last save  •  Enter on a slot to load it  •  Esc: Quit"
         h = self.f_text.render(help_line, True, self.col["dim"])
         surf.blit(h, (W//2 - h.get_width()//2, top + len(self.items)*gap + 70))
 
@@ -93,18 +123,35 @@ class SceneMenu(SceneBase):
         action()
 
     def _spawn_player(self, who):
+        from ..player import Player
+
         p = Player((self.game.screen.get_width()//2, self.game.screen.get_height()//2), who=who)
         self.game.state.player = p
+        self.game.state.save_slot = free_slot(self.game.saver.headers())
 
     def _start_as_jinwoo(self):
         self._spawn_player(CHAR_JINWOO)
-        self.game.change(SceneOverworld(self.game), name="overworld")
+        self._enter_overworld()
 
     def _start_as_chae(self):
         self._spawn_player(CHAR_CHA)
-        self.game.change(SceneOverworld(self.game), name="overworld")
+        self._enter_overworld()
+
+    def _enter_overworld(self, autosave=True):
+        # The world, its sprites and the HUD are imported on first use so the menu comes up quickly.
+        from .overworld import SceneOverworld
+
+        self.game.change(SceneOverworld(self.game), name="overworld", autosave=autosave)
 
     def _load_last_patrol(self):
-        ok = load_game(self.game.state, lambda who: Player((0, 0), who=who))
+        slot = latest_slot(self.game.saver.headers())
+        if slot is not None:
+            self._load_slot(slot)
+
+    def _load_slot(self, slot):
+        from ..player import Player
+
+        self.game.saver.flush()
+        ok = load_game(self.game.state, lambda who: Player((0, 0), who=who), slot=slot)
         if ok:
-            self.game.change(SceneOverworld(self.game), name="overworld", autosave=False)
+            self._enter_overworld(autosave=False)
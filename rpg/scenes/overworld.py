@@ -7,12 +7,32 @@ from typing import List, Optional
 import pygame
 
 from .base import SceneBase
-from ..constants import COL_BG, Keys, WIDTH, HEIGHT
-from ..enemy import Enemy
-from ..gate import Gate
+from ..collision import SolidGrid, SpatialHash
+from ..constants import COL_BG, DEATH_GOLD_PENALTY, Keys, WIDTH, HEIGHT
+from ..enemy import Enemy, overworld_enemy_stats
+from ..gate import Gate, roll_gate_level
+from ..lod import AiScheduler
 from ..player import Player
+from ..render import DirtyRegions, ViewCuller
+from ..rng import stream
+from ..swarm import EnemySwarm
+from ..terrain import ChunkedTerrain
 from ..ui import HudRenderer, InventoryOverlay
-from ..utils import clamp, load_desert_tile, load_pixel_font
+from ..utils import clamp, interpolate, load_desert_tile, load_pixel_font
+
+
+_minimap_dots: dict = {}
+
+
+def _minimap_dot(color: tuple[int, int, int], radius: int) -> pygame.Surface:
+    """A pre-drawn minimap marker, for blitting many at once."""
+
+    dot = _minimap_dots.get((color, radius))
+    if dot is None:
+        dot = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(dot, color, (radius, radius), radius)
+        _minimap_dots[(color, radius)] = dot
+    return dot
 
 
 class SceneOverworld(SceneBase):
@@ -20,49 +40,89 @@ class SceneOverworld(SceneBase):
 
     WORLD_SIZE = pygame.Vector2(3200, 2200)
 
-    def __init__(self, game):
+    def __init__(self, game, enemy_count: Optional[int] = None, swarm: bool = False):
+        """``enemy_count`` overrides the level-based spawn count; ``swarm`` keeps the
+        enemies in a vectorised :class:`EnemySwarm` instead of ``Enemy`` sprites."""
         super().__init__(game)
         if not self.game.state.player:
             self.game.state.player = Player((WIDTH // 2, HEIGHT // 2))
         self.player = self.game.state.player
-        self.player.state = "idle"
 
         self.collision_sprites = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.swarm: Optional[EnemySwarm] = EnemySwarm() if swarm else None
+        # Sprite enemies only; the swarm updates everyone in one vectorised pass.
+        self.ai: Optional[AiScheduler] = None
+        if self.swarm is not None:
+            # The swarm is its own spatial index.
+            self.enemies = self.enemy_index = self.swarm
+        else:
+            self.enemies = pygame.sprite.Group()
+            # Holds awake enemies only; sleepers sit in ``self.ai.sleeping``.
+            self.enemy_index = SpatialHash()
+            self.ai = AiScheduler()
         inner_bounds = self._build_bounds()
 
         self.gates: List[Gate] = []
         self._build_gates()
-        self._spawn_enemies()
+        self._spawn_enemies(enemy_count)
 
         self.world = SimpleNamespace(
             collision_sprites=self.collision_sprites,
+            solids=self.solids,
             enemies=self.enemies,
+            enemy_index=self.enemy_index,
             bounds=inner_bounds,
         )
 
         self.camera = pygame.Vector2(0, 0)
+        # Camera at the start of the current step, for interpolated drawing.
+        self._prev_camera = pygame.Vector2(0, 0)
+        self._culler = ViewCuller()
+        self._dirty = DirtyRegions()
         self.hud = HudRenderer()
         self.inventory_overlay = InventoryOverlay()
         self._ui_font = load_pixel_font(16)
         self._frame_events: list[pygame.event.Event] = []
         self.inventory_open = False
         self.spawn_point = pygame.Vector2(self.WORLD_SIZE.x * 0.2, self.WORLD_SIZE.y * 0.7)
-        self._terrain_surface: Optional[pygame.Surface] = None
+        self._terrain: Optional[ChunkedTerrain] = None
         self._tile_size = 48
         self._build_terrain()
+        self._status_message = ""
+        self._status_timer = 0.0
+        # Dungeons come back to this instance instead of rebuilding the world.
+        self.game.state.overworld = self
+        self.on_enter()
+
+    @classmethod
+    def resume(cls, game) -> "SceneOverworld":
+        """Return the live overworld for the current player, building it if needed."""
+
+        scene = getattr(game.state, "overworld", None)
+        if scene is None or scene.player is not game.state.player:
+            return cls(game)
+        scene.on_enter()
+        return scene
+
+    def on_enter(self) -> None:
+        """Reset per-visit state; runs on construction and on every resume."""
+
+        self._dirty.invalidate()
+        self.player.state = "idle"
+        self.inventory_open = False
+        self._frame_events.clear()
         if not self.player.alive:
             self.player.revive(self.spawn_point, full_heal=True)
         self.player.pos = pygame.Vector2(
             clamp(self.player.pos.x, self.world.bounds.left + self.player.size.x, self.world.bounds.right - self.player.size.x),
             clamp(self.player.pos.y, self.world.bounds.top + self.player.size.y, self.world.bounds.bottom - self.player.size.y),
         )
-        self._status_message = ""
-        self._status_timer = 0.0
         pending = getattr(self.game.state, "pending_status", "")
         if pending:
             self._set_status(pending)
             self.game.state.pending_status = ""
+        self._update_camera()
+        self._prev_camera.update(self.camera)
 
     # ------------------------------------------------------------------
     def _build_bounds(self) -> pygame.Rect:
@@ -78,6 +138,7 @@ class SceneOverworld(SceneBase):
             sprite = pygame.sprite.Sprite()
             sprite.rect = rect
             self.collision_sprites.add(sprite)
+        self.solids = SolidGrid.from_rects(rects)
 
         inner_rect = pygame.Rect(
             margin,
@@ -87,31 +148,33 @@ class SceneOverworld(SceneBase):
         )
         return inner_rect
 
-    def _spawn_enemies(self) -> None:
+    def _spawn_enemies(self, count: Optional[int] = None) -> None:
         rng = random.Random(42)
         base_count = 12
         player_level = self.player.leveling.level
         danger_bonus = sum(max(0, gate.req_level - player_level) for gate in self.gates)
-        spawn_total = base_count + danger_bonus * 2
+        spawn_total = base_count + danger_bonus * 2 if count is None else count
         for _ in range(spawn_total):
             pos = (
                 rng.uniform(self.WORLD_SIZE.x * 0.15, self.WORLD_SIZE.x * 0.85),
                 rng.uniform(self.WORLD_SIZE.y * 0.15, self.WORLD_SIZE.y * 0.85),
             )
-            hp = rng.randint(60, 110)
-            speed = rng.uniform(85.0, 120.0)
-            xp_reward = rng.randint(20, 55)
-            enemy = Enemy(pos, hp=hp, speed=speed, detection_radius=360.0, xp_reward=xp_reward)
+            stats = overworld_enemy_stats(rng)
+            if self.swarm is not None:
+                self.swarm.spawn(pos, detection_radius=360.0, **stats)
+                continue
+            enemy = Enemy(pos, detection_radius=360.0, **stats)
             self.enemies.add(enemy)
+            self.ai.add(enemy)
 
     def _build_gates(self) -> None:
-        rng = random.Random()
+        rng = stream("gates")
         player_level = self.player.leveling.level
         min_gates = 2
         max_gates = 5 + max(0, player_level // 3)
         gate_count = rng.randint(min_gates, max_gates)
         for _ in range(gate_count):
-            gate_level = max(1, player_level + rng.randint(-1, 3))
+            gate_level = roll_gate_level(rng, player_level)
             width, height = 140, 160
             x = rng.uniform(self.WORLD_SIZE.x * 0.2, self.WORLD_SIZE.x * 0.9 - width)
             y = rng.uniform(self.WORLD_SIZE.y * 0.2, self.WORLD_SIZE.y * 0.9 - height)
@@ -155,29 +218,44 @@ class SceneOverworld(SceneBase):
 
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+        keys = self.game.keys
+        prof = self.game.profiler
+        self._prev_camera.update(self.camera)
         if not self.inventory_open:
             self.player.handle_input(keys, self._frame_events)
+        if self.swarm is None:
+            self.enemy_index.rebuild(self.ai.awake)
         self.player.update(dt, self.world)
         self._frame_events.clear()
-
-        for enemy in list(self.enemies):
-            enemy.update(dt, self.player, self.collision_sprites, self.world.bounds)
-            if not enemy.alive:
-                self.enemies.remove(enemy)
-                leveled = self.player.leveling.gain_xp(enemy.xp_reward)
-                if leveled:
-                    self.player.on_level_up()
-                    self.hud.notify_level_up(self.player.leveling.level)
+        prof.lap("player")
+
+        if self.swarm is not None:
+            self.swarm.update(dt, self.player, self.solids, self.world.bounds)
+            for xp_reward in self.swarm.reap():
+                self._gain_xp(xp_reward)
+        else:
+            for enemy, step in self.ai.schedule(dt, self.player.pos):
+                enemy.update(step, self.player, self.solids, self.world.bounds)
+                if not enemy.alive:
+                    self.enemies.remove(enemy)
+                    self.ai.remove(enemy)
+                    self._gain_xp(enemy.xp_reward)
+        prof.lap("enemies")
 
         if not self.player.alive:
             self._handle_player_death()
 
         self.hud.update(dt)
         self.inventory_overlay.update(dt)
+        prof.lap("hud_update")
         self._update_camera()
         self._tick_status(dt)
 
+    def _gain_xp(self, amount: int) -> None:
+        if self.player.leveling.gain_xp(amount):
+            self.player.on_level_up()
+            self.hud.notify_level_up(self.player.leveling.level)
+
     def _update_camera(self) -> None:
         view_w, view_h = self.game.screen.get_size()
         target = self.player.rect
@@ -185,32 +263,66 @@ class SceneOverworld(SceneBase):
         self.camera.y = clamp(target.centery - view_h / 2, 0, max(0, self.WORLD_SIZE.y - view_h))
 
     # ------------------------------------------------------------------
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(COL_BG)
-        offset = self.camera
-        if self._terrain_surface:
-            surface.blit(self._terrain_surface, (-int(offset.x), -int(offset.y)))
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Draw the frame; returns the changed screen rects, or ``None`` for a full flip."""
 
-        for gate in self.gates:
-            gate.draw(surface, offset)
-
-        for enemy in self.enemies:
-            enemy.draw(surface, offset)
-
-        self.player.draw(surface, offset)
-
-        self.hud.draw(surface, self.player, self.player.dash_cooldown)
+        surface.fill(COL_BG)
+        alpha = self.game.alpha
+        offset = interpolate(self._prev_camera, self.camera, alpha)
+        dirty = self._dirty
+        dirty.begin(surface, offset)
+        if self._terrain is not None:
+            self._terrain.draw(surface, offset)
+
+        self._culler.begin(offset, surface.get_size())
+        for gate in self._culler.visible(self.gates, Gate.draw_bounds):
+            dirty.add(gate.draw(surface, offset))
+
+        if self.swarm is not None:
+            drawn = self.swarm.draw(surface, offset, self._culler.view, alpha=alpha)
+            self._culler.tally(len(drawn), len(self.swarm))
+            for rect in drawn:
+                dirty.add(rect)
+        else:
+            for enemy in self._culler.visible_indexed(self.enemy_index, len(self.enemies), self.ai.sleeping):
+                dirty.add(enemy.draw(surface, offset, alpha))
+
+        dirty.add(self.player.draw(surface, offset, alpha))
+        prof = self.game.profiler
+        prof.lap("draw")
+
+        dirty.add(self.hud.draw(surface, self.player, self.player.dash_cooldown))
+        prof.lap("hud_draw")
         gate = self._current_gate()
         if gate:
             prompt = self._ui_font.render("[E] Enter Gate", True, (235, 235, 245))
-            surface.blit(prompt, (surface.get_width() // 2 - prompt.get_width() // 2, surface.get_height() - 72))
+            dirty.add(surface.blit(prompt, (surface.get_width() // 2 - prompt.get_width() // 2, surface.get_height() - 72)))
 
-        self._draw_minimap(surface)
+        dirty.add(self._draw_minimap(surface))
+        prof.lap("minimap")
         if self.inventory_open:
-            self.inventory_overlay.draw(surface, self.player.inventory, self.player.gold)
+            dirty.add(self.inventory_overlay.draw(surface, self.player.inventory, self.player.gold))
         if self._status_message:
             msg = self._ui_font.render(self._status_message, True, (255, 210, 110))
-            surface.blit(msg, (surface.get_width() // 2 - msg.get_width() // 2, 32))
+            dirty.add(surface.blit(msg, (surface.get_width() // 2 - msg.get_width() // 2, 32)))
+        if self.game.debug:
+            label = self._culler.label() if self.ai is None else f"{self._culler.label()}  {self.ai.label()}"
+            dirty.add(surface.blit(self._ui_font.render(label, True, (235, 235, 245)), (12, 12)))
+        rects = dirty.collect()
+        prof.lap("draw")
+        return rects
+
+    def invalidate(self) -> None:
+        self._dirty.invalidate()
+
+    def stats(self) -> dict:
+        return {
+            "enemies": len(self.enemies),
+            "asleep": len(self.ai.sleeping) if self.ai is not None else 0,
+            "gates": len(self.gates),
+            "chunks": len(self._terrain) if self._terrain is not None else 0,
+            "surface_bytes": self._terrain.memory_bytes() if self._terrain is not None else 0,
+        }
 
     # ------------------------------------------------------------------
     def _current_gate(self) -> Optional[Gate]:
@@ -227,7 +339,7 @@ class SceneOverworld(SceneBase):
         self.game.change(dungeon, name="dungeon")
 
     def _handle_player_death(self) -> None:
-        penalty = int(self.player.gold * 0.15)
+        penalty = int(self.player.gold * DEATH_GOLD_PENALTY)
         if penalty:
             self.player.gold = max(0, self.player.gold - penalty)
         self.player.revive(self.spawn_point, full_heal=True)
@@ -243,7 +355,7 @@ class SceneOverworld(SceneBase):
             if self._status_timer == 0.0:
                 self._status_message = ""
 
-    def _draw_minimap(self, surface: pygame.Surface) -> None:
+    def _draw_minimap(self, surface: pygame.Surface) -> pygame.Rect:
         width, height = 220, 220
         margin = 24
         rect = pygame.Rect(surface.get_width() - width - margin, margin, width, height)
@@ -263,29 +375,28 @@ class SceneOverworld(SceneBase):
             gx, gy = world_to_map(pygame.Vector2(gate.rect.center))
             pygame.draw.circle(surface, color, (gx, gy), 6)
 
-        for enemy in self.enemies:
-            ex, ey = world_to_map(enemy.pos)
-            pygame.draw.circle(surface, (200, 90, 90), (ex, ey), 3)
+        if self.swarm is not None:
+            dot = _minimap_dot((200, 90, 90), 3)
+            corner = (rect.x - 3, rect.y - 3)
+            positions = (self.swarm.positions() * (scale_x, scale_y)).astype(int) + corner
+            surface.blits([(dot, xy) for xy in positions.tolist()], doreturn=False)
+        else:
+            for enemy in self.enemies:
+                ex, ey = world_to_map(enemy.pos)
+                pygame.draw.circle(surface, (200, 90, 90), (ex, ey), 3)
 
         px, py = world_to_map(self.player.pos)
         pygame.draw.circle(surface, (120, 220, 220), (px, py), 5)
+        # Markers on the border spill out by up to their radius.
+        return rect.inflate(12, 12)
 
     def _build_terrain(self) -> None:
-        world_w, world_h = int(self.WORLD_SIZE.x), int(self.WORLD_SIZE.y)
-        surface = pygame.Surface((world_w, world_h), pygame.SRCALPHA)
         try:
             floor_ids = [64, 65, 73, 155, 172, 173, 190, 191, 194]
             floor_tiles = [load_desert_tile("Tiles", idx, scale=2.0) for idx in floor_ids]
         except FileNotFoundError:
-            self._terrain_surface = None
+            self._terrain = None
             return
-        tile_w = floor_tiles[0].get_width()
-        tile_h = floor_tiles[0].get_height()
-        rng = random.Random(1337)
-        for y in range(0, world_h, tile_h):
-            for x in range(0, world_w, tile_w):
-                tile = rng.choice(floor_tiles)
-                surface.blit(tile, (x, y))
 
         decoration_ids = [63, 75, 82, 123, 184, 195, 226, 227, 228]
         decorations: list[pygame.Surface] = []
@@ -294,13 +405,11 @@ class SceneOverworld(SceneBase):
                 decorations.append(load_desert_tile("Tiles", idx, scale=2.0))
             except FileNotFoundError:
                 continue
-        for _ in range(180):
-            if not decorations:
-                break
-            deco = rng.choice(decorations)
-            x = rng.randint(0, max(0, world_w - deco.get_width()))
-            y = rng.randint(0, max(0, world_h - deco.get_height()))
-            surface.blit(deco, (x, y))
-
-        self._terrain_surface = surface.convert_alpha()
-        self._tile_size = tile_w
+
+        self._terrain = ChunkedTerrain(
+            (int(self.WORLD_SIZE.x), int(self.WORLD_SIZE.y)),
+            floor_tiles,
+            decorations,
+            background=COL_BG,
+        )
+        self._tile_size = floor_tiles[0].get_width()
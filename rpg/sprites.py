@@ -4,7 +4,8 @@ import math
 from typing import Dict, Iterable, List
 
 import pygame
-from PIL import Image, ImageSequence
+
+from . import bake
 
 
 DIRS = ["E","SE","S","SW","W","NW","N","NE"]
@@ -18,6 +19,15 @@ def _pil_to_surface(frame, scale=1.0):
     return surf
 
 def load_gif_frames(path, scale=1.0):
+    baked = bake.lookup(bake.gif_key(path, scale))
+    if baked is not None:
+        return baked
+    return _decode_gif(path, scale)
+
+def _decode_gif(path, scale=1.0):
+    # PIL is only needed when there is no baked copy of the GIF.
+    from PIL import Image, ImageSequence
+
     im = Image.open(path)
     return [_pil_to_surface(f, scale) for f in ImageSequence.Iterator(im)]
 
@@ -4,4 +4,6 @@ class GameState:
         self.gold = 0
         self.unlocked = {}
         self.scene_name = "menu"
+        self.save_slot = 1
         self.pending_status = ""
+        self.overworld = None  # live SceneOverworld, resumed when leaving a gate
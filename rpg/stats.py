@@ -8,3 +8,12 @@ class Stats:
         self.precision    = precision
         self.crit_rate    = crit_rate
         self.crit_damage  = crit_damage
+
+    FIELDS = ("strength", "agility", "endurance", "defense", "intelligence", "precision", "crit_rate", "crit_damage")
+
+    def data(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(**{name: data[name] for name in cls.FIELDS if name in (data or {})})
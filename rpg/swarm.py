@@ -0,0 +1,447 @@
+"""Structure-of-arrays enemy horde updated with NumPy.
+
+:class:`EnemySwarm` runs the same chase / attack / knockback rules as
+:class:`rpg.enemy.Enemy`, but for every member at once. Members are rows in
+parallel arrays; code that expects enemy objects (hitboxes, projectiles,
+minions, the minimap) gets :class:`SwarmMember` views instead.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pygame
+
+from .constants import SNAP_DISTANCE
+from .enemy import HURT_TINT, PLACEHOLDER_HURT_TINT, Enemy, _directional_animations, _placeholder_image
+from .utils import iter_sprites_rects
+from .variants import variants
+
+# Orientation codes, in the order the enemy sheet stores them.
+ORIENTATIONS = ("down", "left", "right", "up")
+_DOWN, _LEFT, _RIGHT, _UP = range(4)
+
+
+class SwarmMember:
+    """View of one swarm row, shaped like :class:`Enemy` for code that works per enemy.
+
+    Views are stable: the same object follows its row through compaction, and
+    once the member is reaped it reports ``alive = False``. ``pos`` returns a
+    copy; assign to it to move the member.
+    """
+
+    __slots__ = ("swarm", "_i", "_last_pos")
+
+    def __init__(self, swarm: "EnemySwarm", index: int) -> None:
+        self.swarm = swarm
+        self._i = index
+        self._last_pos: Optional[pygame.Vector2] = None
+
+    @property
+    def alive(self) -> bool:
+        return self._i >= 0 and bool(self.swarm.alive[self._i])
+
+    @property
+    def pos(self) -> pygame.Vector2:
+        if self._i < 0:
+            return pygame.Vector2(self._last_pos)
+        x, y = self.swarm.pos[self._i]
+        return pygame.Vector2(float(x), float(y))
+
+    @pos.setter
+    def pos(self, value) -> None:
+        if self._i >= 0:
+            self.swarm.pos[self._i] = (value[0], value[1])
+
+    @property
+    def size(self) -> pygame.Vector2:
+        return self.swarm.size
+
+    @property
+    def rect(self) -> pygame.Rect:
+        pos = self.pos
+        size = self.swarm.size
+        return pygame.Rect(int(pos.x - size.x / 2), int(pos.y - size.y), int(size.x), int(size.y))
+
+    @property
+    def center(self) -> pygame.Vector2:
+        pos = self.pos
+        return pygame.Vector2(pos.x, pos.y - self.swarm.size.y / 2)
+
+    @property
+    def hp(self) -> int:
+        return int(self.swarm.hp[self._i]) if self._i >= 0 else 0
+
+    @property
+    def max_hp(self) -> int:
+        return int(self.swarm.max_hp[self._i]) if self._i >= 0 else 0
+
+    @property
+    def xp_reward(self) -> int:
+        return int(self.swarm.xp_reward[self._i]) if self._i >= 0 else 0
+
+    @property
+    def orientation(self) -> str:
+        return ORIENTATIONS[int(self.swarm.orientation[self._i])] if self._i >= 0 else "down"
+
+    def take_damage(self, amount: int, source=None, knockback: float = 0.0, direction=None) -> None:
+        if self._i >= 0:
+            self.swarm.take_damage(self._i, amount, source=source, knockback=knockback, direction=direction)
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: Optional[pygame.Vector2] = None,
+        alpha: float = 1.0,
+    ) -> Optional[pygame.Rect]:
+        if not self.alive:
+            return None
+        return self.swarm.draw(surface, offset or pygame.Vector2(0, 0), rows=np.array([self._i]), alpha=alpha)[0]
+
+
+class EnemySwarm:
+    """Many enemies as parallel NumPy arrays, stepped with vectorised :class:`Enemy` rules.
+
+    Also answers the spatial-index queries of :class:`~rpg.collision.SpatialHash`
+    (``query_rect``/``nearest``), so it can stand in for ``world.enemy_index``.
+    Dead members stay in place until :meth:`reap` compacts the arrays.
+    """
+
+    _FLOAT_FIELDS = (
+        "hp", "max_hp", "speed", "detection_radius", "attack_range", "attack_damage", "knockback",
+        "xp_reward", "cooldown_timer", "hurt_timer", "hurt_block", "kb_timer", "anim_timer",
+    )
+    ATTACK_COOLDOWN = 0.6
+    HURT_COOLDOWN = 0.1
+    max_radius = 0.0
+
+    def __init__(self, capacity: int = 64, color: tuple[int, int, int] = (200, 80, 90)) -> None:
+        self.count = 0
+        self.capacity = 0
+        self.pos = np.zeros((0, 2))
+        self.prev_pos = np.zeros((0, 2))
+        self.kb_vel = np.zeros((0, 2))
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0))
+        self.alive = np.zeros(0, dtype=bool)
+        self.walking = np.zeros(0, dtype=bool)
+        self.orientation = np.zeros(0, dtype=np.int8)
+        self._members: List[SwarmMember] = []
+        self._bars: Dict[int, pygame.Surface] = {}
+        self._grow(max(1, capacity))
+
+        self.animations = _directional_animations(2.0)
+        if self.animations:
+            sample = self.animations["idle"]["down"][0]
+            self.size = pygame.Vector2(sample.get_size())
+            self._base_image = None
+        else:
+            self.size = pygame.Vector2(Enemy.size)
+            self._base_image = _placeholder_image(self.size, color)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive[: self.count]))
+
+    def __iter__(self) -> Iterator[SwarmMember]:
+        alive = self.alive
+        return (member for member in self._members[: self.count] if alive[member._i])
+
+    # ------------------------------------------------------------------
+    def _arrays(self) -> List[str]:
+        return ["pos", "prev_pos", "kb_vel", "alive", "walking", "orientation", *self._FLOAT_FIELDS]
+
+    def _grow(self, capacity: int) -> None:
+        for name in self._arrays():
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def spawn(
+        self,
+        pos: Sequence[float],
+        hp: int = 60,
+        speed: float = 110.0,
+        detection_radius: float = 240.0,
+        attack_range: float = 36.0,
+        attack_damage: int = 8,
+        knockback: float = 160.0,
+        xp_reward: int = 25,
+    ) -> SwarmMember:
+        """Add a member with :class:`Enemy`'s defaults and return its view."""
+
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        i = self.count
+        self.count += 1
+        self.pos[i] = self.prev_pos[i] = pos
+        self.kb_vel[i] = 0.0
+        self.alive[i] = True
+        self.walking[i] = False
+        self.orientation[i] = _DOWN
+        for name in self._FLOAT_FIELDS:
+            getattr(self, name)[i] = 0.0
+        self.hp[i] = self.max_hp[i] = hp
+        self.speed[i] = speed
+        self.detection_radius[i] = detection_radius
+        self.attack_range[i] = attack_range
+        self.attack_damage[i] = attack_damage
+        self.knockback[i] = knockback
+        self.xp_reward[i] = xp_reward
+        member = SwarmMember(self, i)
+        self._members.append(member)
+        return member
+
+    def reap(self) -> List[int]:
+        """Drop dead members, returning their XP rewards in member order."""
+
+        n = self.count
+        alive = self.alive[:n].copy()
+        if alive.all():
+            return []
+        rewards = [int(xp) for xp in self.xp_reward[:n][~alive]]
+        members = []
+        for member in self._members:
+            if alive[member._i]:
+                members.append(member)
+            else:
+                member._last_pos = member.pos
+                member._i = -1
+        keep = np.flatnonzero(alive)
+        for name in self._arrays():
+            array = getattr(self, name)
+            array[: len(keep)] = array[keep]
+        for i, member in enumerate(members):
+            member._i = i
+        self._members = members
+        self.count = len(keep)
+        self.alive[self.count : n] = False
+        return rewards
+
+    # ------------------------------------------------------------------
+    def update(self, dt: float, player, collision=None, bounds: Optional[pygame.Rect] = None) -> None:
+        """One :meth:`Enemy.update` step for every live member."""
+
+        n = self.count
+        if not n:
+            return
+        dt = float(dt)
+        alive = self.alive[:n]
+        pos = self.pos[:n]
+        self.prev_pos[:n] = pos
+        walls = self._walls(collision)
+
+        for timer in (self.cooldown_timer, self.hurt_timer, self.hurt_block):
+            np.maximum(timer[:n] - dt, 0.0, out=timer[:n])
+
+        # Knockback slides members that were hit, against walls, before they act.
+        kb_timer = self.kb_timer[:n]
+        pushed = np.flatnonzero(alive & (kb_timer > 0.0))
+        if len(pushed):
+            kb_timer[pushed] = np.maximum(kb_timer[pushed] - dt, 0.0)
+            displacement = self.kb_vel[pushed] * dt
+            self._move(pushed, displacement, walls)
+            self.kb_vel[pushed[kb_timer[pushed] == 0.0]] = 0.0
+
+        to_player = np.array((player.pos.x, player.pos.y)) - pos
+        distance = np.hypot(to_player[:, 0], to_player[:, 1])
+        in_range = alive & (distance <= self.attack_range[:n])
+        chasing = alive & ~in_range & (distance <= self.detection_radius[:n])
+        idle = alive & ~in_range & ~chasing
+
+        swinging = np.flatnonzero(in_range & (self.cooldown_timer[:n] == 0.0))
+        for i in swinging:
+            member = self._members[i]
+            player.take_damage(
+                int(self.attack_damage[i]),
+                source=member,
+                knockback=float(self.knockback[i]),
+                direction=pygame.Vector2(float(to_player[i, 0]), float(to_player[i, 1])),
+            )
+        self.cooldown_timer[swinging] = self.ATTACK_COOLDOWN
+
+        movers = np.flatnonzero(chasing & (distance > 0.0))
+        if len(movers):
+            direction = to_player[movers] / distance[movers, None]
+            self._move(movers, direction * self.speed[movers, None] * dt, walls)
+            self._orient(movers, direction)
+        turners = np.flatnonzero(idle)
+        if len(turners):
+            self._orient(turners, to_player[turners])
+
+        if bounds:
+            live = np.flatnonzero(alive)
+            half_w = self.size.x / 2
+            pos[live, 0] = np.clip(pos[live, 0], bounds.left + half_w, bounds.right - half_w)
+            pos[live, 1] = np.clip(pos[live, 1], bounds.top + self.size.y, bounds.bottom)
+
+        self.walking[:n] = chasing
+        if self.animations:
+            fps = np.where(chasing, 6.0, 2.5)
+            self.anim_timer[:n] += np.where(alive, dt * fps, 0.0)
+
+    def _walls(self, collision) -> List[pygame.Rect]:
+        if not collision:
+            return []
+        return list(collision) if not isinstance(collision, pygame.sprite.AbstractGroup) else list(iter_sprites_rects(collision))
+
+    def _move(self, rows: np.ndarray, step: np.ndarray, walls: List[pygame.Rect]) -> None:
+        """Move ``rows`` by ``step`` one axis at a time, pushed out of ``walls`` like Enemy._move_axis."""
+
+        w, h = self.size.x, self.size.y
+        for axis in (0, 1):
+            offset = step[:, axis]
+            moving = offset != 0.0
+            if not moving.any():
+                continue
+            self.pos[rows[moving], axis] += offset[moving]
+            for wall in walls:
+                x, y = self.pos[rows, 0], self.pos[rows, 1]
+                left = np.trunc(x - w / 2)
+                top = np.trunc(y - h)
+                hit = (
+                    moving
+                    & (left < wall.right) & (left + int(w) > wall.left)
+                    & (top < wall.bottom) & (top + int(h) > wall.top)
+                )
+                if not hit.any():
+                    continue
+                forward, back = rows[hit & (offset > 0)], rows[hit & (offset < 0)]
+                if axis == 0:
+                    self.pos[forward, 0] = wall.left - w / 2
+                    self.pos[back, 0] = wall.right + w / 2
+                else:
+                    self.pos[forward, 1] = wall.top + h
+                    self.pos[back, 1] = wall.bottom
+
+    def _orient(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        vx, vy = vectors[:, 0], vectors[:, 1]
+        nonzero = (vx != 0.0) | (vy != 0.0)
+        horizontal = np.abs(vx) >= np.abs(vy)
+        codes = np.where(
+            horizontal,
+            np.where(vx > 0, _RIGHT, _LEFT),
+            np.where(vy > 0, _DOWN, _UP),
+        )
+        self.orientation[rows[nonzero]] = codes[nonzero]
+
+    # ------------------------------------------------------------------
+    def take_damage(self, i: int, amount: int, source=None, knockback: float = 0.0, direction=None) -> None:
+        if not self.alive[i] or self.hurt_block[i] > 0.0:
+            return
+        self.hp[i] = max(0, self.hp[i] - int(max(1, amount)))
+        self.hurt_timer[i] = 0.18
+        self.hurt_block[i] = self.HURT_COOLDOWN
+        if self.hp[i] <= 0:
+            self.alive[i] = False
+            return
+        if knockback > 0:
+            pos = pygame.Vector2(float(self.pos[i, 0]), float(self.pos[i, 1]))
+            if direction is None and source is not None:
+                if isinstance(source, pygame.Vector2):
+                    direction = pos - source
+                elif hasattr(source, "pos"):
+                    direction = pos - pygame.Vector2(getattr(source, "pos"))
+            direction = direction or pygame.Vector2(0, 0)
+            if direction.length_squared():
+                self.kb_vel[i] = direction.normalize() * knockback
+                self.kb_timer[i] = 0.2
+
+    # ------------------------------------------------------------------
+    def _overlapping(self, rect: pygame.Rect) -> np.ndarray:
+        n = self.count
+        w, h = int(self.size.x), int(self.size.y)
+        left = np.trunc(self.pos[:n, 0] - self.size.x / 2)
+        top = np.trunc(self.pos[:n, 1] - self.size.y)
+        hit = (
+            self.alive[:n]
+            & (left < rect.right) & (left + w > rect.left)
+            & (top < rect.bottom) & (top + h > rect.top)
+        )
+        return np.flatnonzero(hit)
+
+    def query_rect(self, rect: pygame.Rect) -> List[SwarmMember]:
+        """Live members whose rect overlaps ``rect``, in member order."""
+
+        members = self._members
+        return [members[i] for i in self._overlapping(rect)]
+
+    def nearest(self, pos: pygame.Vector2, k: int = 1, max_distance: Optional[float] = None) -> List[SwarmMember]:
+        n = self.count
+        if not n or k <= 0:
+            return []
+        d2 = ((self.pos[:n] - (pos.x, pos.y)) ** 2).sum(axis=1)
+        candidates = self.alive[:n].copy()
+        if max_distance is not None:
+            candidates &= d2 <= max_distance * max_distance
+        rows = np.flatnonzero(candidates)
+        order = rows[np.argsort(d2[rows], kind="stable")[:k]]
+        return [self._members[i] for i in order]
+
+    def positions(self) -> np.ndarray:
+        """``(n, 2)`` positions of the live members (a copy)."""
+
+        return self.pos[: self.count][self.alive[: self.count]]
+
+    # ------------------------------------------------------------------
+    def _image(self, i: int) -> pygame.Surface:
+        if self.animations:
+            state = "walk" if self.walking[i] else "idle"
+            frames = self.animations[state][ORIENTATIONS[self.orientation[i]]]
+            image = frames[int(self.anim_timer[i]) % len(frames)]
+            return variants.get(image, tint=HURT_TINT) if self.hurt_timer[i] > 0 else image
+        return variants.get(self._base_image, tint=PLACEHOLDER_HURT_TINT) if self.hurt_timer[i] > 0 else self._base_image
+
+    def _hp_bar(self, fill: int) -> pygame.Surface:
+        """Pre-drawn health bar ``fill`` pixels full, identical to drawing it in place."""
+
+        bar = self._bars.get(fill)
+        if bar is None:
+            bar = pygame.Surface((int(self.size.x), 4))
+            bar.fill((30, 30, 40))
+            if fill > 0:
+                bar.fill((120, 220, 120), (0, 0, fill, 4))
+            pygame.draw.rect(bar, (235, 235, 245), bar.get_rect(), 1)
+            self._bars[fill] = bar
+        return bar
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: pygame.Vector2,
+        view: Optional[pygame.Rect] = None,
+        rows: Optional[np.ndarray] = None,
+        alpha: float = 1.0,
+    ) -> List[pygame.Rect]:
+        """Draw members overlapping world-space ``view`` (or ``rows``) back to front.
+
+        Each sprite and its health bar go out in one ``blits`` call, in the
+        order :meth:`Enemy.draw` would paint them, interpolated ``alpha`` of the
+        way from the previous step. Returns the screen rects touched.
+        """
+
+        if rows is None:
+            rows = self._overlapping(view if view is not None else pygame.Rect(offset, surface.get_size()))
+            rows = rows[np.argsort(self.pos[rows, 1], kind="stable")]
+        w, h = int(self.size.x), int(self.size.y)
+        pos = self.pos[rows]
+        if alpha < 1.0:
+            prev = self.prev_pos[rows]
+            jumped = ((pos - prev) ** 2).sum(axis=1) > SNAP_DISTANCE * SNAP_DISTANCE
+            pos = np.where(jumped[:, None], pos, prev + (pos - prev) * max(0.0, alpha))
+        # Same rounding as Enemy.rect followed by Rect.move(-offset).
+        lefts = (np.trunc(pos[:, 0] - self.size.x / 2) + int(-offset.x)).astype(int).tolist()
+        tops = (np.trunc(pos[:, 1] - self.size.y) + int(-offset.y)).astype(int).tolist()
+        max_hp = self.max_hp[rows]
+        pct = np.divide(self.hp[rows], max_hp, out=np.zeros(len(rows)), where=max_hp != 0)
+        fills = (w * pct).astype(int).tolist()
+
+        blits = []
+        touched = []
+        for i, left, top, fill in zip(rows.tolist(), lefts, tops, fills):
+            blits.append((self._image(i), (left, top)))
+            blits.append((self._hp_bar(fill), (left, top - 8)))
+            touched.append(pygame.Rect(left, top - 8, w, h + 8))
+        surface.blits(blits, doreturn=False)
+        return touched
@@ -0,0 +1,164 @@
+"""Chunked overworld terrain built lazily around the camera."""
+from __future__ import annotations
+
+import random
+from collections import OrderedDict
+from typing import Iterator, List, Sequence, Tuple
+
+import pygame
+
+Chunk = Tuple[int, int]
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(*values: int) -> int:
+    """Stable 64-bit hash of integers (splitmix64 finaliser)."""
+
+    h = 0x9E3779B97F4A7C15
+    for value in values:
+        h = (h ^ (value & _MASK)) * 0xBF58476D1CE4E5B9 & _MASK
+        h = (h ^ (h >> 31)) * 0x94D049BB133111EB & _MASK
+        h ^= h >> 29
+    return h
+
+
+class ChunkedTerrain:
+    """Floor tiles and decorations baked into fixed-size chunks on demand.
+
+    Chunks are a pure function of their coordinates and ``seed``, so evicted
+    chunks rebuild identically. Only chunks intersecting the view are blitted,
+    and an LRU keeps at most ``max_chunks`` of them alive, so memory and frame
+    time depend on the screen size rather than the world size.
+    """
+
+    def __init__(
+        self,
+        world_size: Tuple[int, int],
+        floor_tiles: Sequence[pygame.Surface],
+        decorations: Sequence[pygame.Surface] = (),
+        *,
+        background: Tuple[int, int, int] = (0, 0, 0),
+        chunk_size: int = 512,
+        max_chunks: int = 32,
+        decoration_density: float = 180 / (3200 * 2200),
+        seed: int = 1337,
+    ) -> None:
+        if not floor_tiles:
+            raise ValueError("ChunkedTerrain needs at least one floor tile")
+        self.world_w, self.world_h = int(world_size[0]), int(world_size[1])
+        self.floor_tiles = list(floor_tiles)
+        self.decorations = list(decorations)
+        self.background = background
+        self.tile_w, self.tile_h = self.floor_tiles[0].get_size()
+        # Chunks hold whole tiles so the floor grid lines up across borders.
+        self.chunk_w = self.tile_w * max(1, round(chunk_size / self.tile_w))
+        self.chunk_h = self.tile_h * max(1, round(chunk_size / self.tile_h))
+        self.max_chunks = max_chunks
+        self.decorations_per_chunk = decoration_density * self.chunk_w * self.chunk_h
+        self.seed = seed
+        self._chunks: "OrderedDict[Chunk, pygame.Surface]" = OrderedDict()
+        self.built = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------------
+    def draw(self, surface: pygame.Surface, camera: pygame.Vector2) -> None:
+        view = pygame.Rect(int(camera.x), int(camera.y), *surface.get_size())
+        visible = list(self._chunks_in(view))
+        # Never evict what is on screen this frame.
+        self.max_chunks = max(self.max_chunks, len(visible) * 2)
+        blits = []
+        for chunk in visible:
+            image = self._get(chunk)
+            blits.append((image, (chunk[0] * self.chunk_w - view.x, chunk[1] * self.chunk_h - view.y)))
+        surface.blits(blits, doreturn=False)
+        self.prefetch(view)
+
+    def prefetch(self, view: pygame.Rect, budget: int = 1) -> None:
+        """Build up to ``budget`` missing chunks in a one-chunk ring around ``view``."""
+
+        ring = view.inflate(self.chunk_w * 2, self.chunk_h * 2)
+        for chunk in self._chunks_in(ring):
+            if budget <= 0:
+                return
+            if chunk not in self._chunks:
+                self._get(chunk)
+                budget -= 1
+
+    def memory_bytes(self) -> int:
+        return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self._chunks.values())
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    # ------------------------------------------------------------------
+    def _chunks_in(self, rect: pygame.Rect) -> Iterator[Chunk]:
+        world = pygame.Rect(0, 0, self.world_w, self.world_h)
+        area = rect.clip(world)
+        if not area.width or not area.height:
+            return
+        x0, x1 = area.left // self.chunk_w, (area.right - 1) // self.chunk_w
+        y0, y1 = area.top // self.chunk_h, (area.bottom - 1) // self.chunk_h
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def _get(self, chunk: Chunk) -> pygame.Surface:
+        image = self._chunks.get(chunk)
+        if image is not None:
+            self._chunks.move_to_end(chunk)
+            return image
+        image = self._build(chunk)
+        self._chunks[chunk] = image
+        self.built += 1
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evicted += 1
+        return image
+
+    def _build(self, chunk: Chunk) -> pygame.Surface:
+        origin_x, origin_y = chunk[0] * self.chunk_w, chunk[1] * self.chunk_h
+        width = min(self.chunk_w, self.world_w - origin_x)
+        height = min(self.chunk_h, self.world_h - origin_y)
+        surface = pygame.Surface((width, height))
+        surface.fill(self.background)
+
+        tiles = self.floor_tiles
+        blits = []
+        for y in range(0, height, self.tile_h):
+            for x in range(0, width, self.tile_w):
+                tx, ty = (origin_x + x) // self.tile_w, (origin_y + y) // self.tile_h
+                blits.append((tiles[_mix(self.seed, tx, ty) % len(tiles)], (x, y)))
+
+        # Decorations may straddle chunk borders, so neighbours contribute too.
+        bounds = surface.get_rect(topleft=(origin_x, origin_y))
+        for ny in range(chunk[1] - 1, chunk[1] + 2):
+            for nx in range(chunk[0] - 1, chunk[0] + 2):
+                for deco, pos in self._decorations_for((nx, ny)):
+                    if bounds.colliderect(deco.get_rect(topleft=pos)):
+                        blits.append((deco, (pos[0] - origin_x, pos[1] - origin_y)))
+        surface.blits(blits, doreturn=False)
+        return surface.convert() if pygame.display.get_surface() else surface
+
+    def _decorations_for(self, chunk: Chunk) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        if not self.decorations or chunk[0] < 0 or chunk[1] < 0:
+            return []
+        origin_x, origin_y = chunk[0] * self.chunk_w, chunk[1] * self.chunk_h
+        if origin_x >= self.world_w or origin_y >= self.world_h:
+            return []
+        # Chunks on the right and bottom edges are clipped to the world; sample
+        # only inside the clipped part, with the density of a full chunk.
+        width = min(self.chunk_w, self.world_w - origin_x)
+        height = min(self.chunk_h, self.world_h - origin_y)
+        expected = self.decorations_per_chunk * (width * height) / (self.chunk_w * self.chunk_h)
+        rng = random.Random(_mix(self.seed, 0xDEC0, chunk[0], chunk[1]))
+        count = int(expected) + (rng.random() < expected % 1.0)
+        placed = []
+        for _ in range(count):
+            deco = rng.choice(self.decorations)
+            x = origin_x + rng.randrange(width)
+            y = origin_y + rng.randrange(height)
+            x = min(x, max(0, self.world_w - deco.get_width()))
+            y = min(y, max(0, self.world_h - deco.get_height()))
+            placed.append((deco, (x, y)))
+        return placed
@@ -47,8 +47,75 @@ class HudPalette:
     state_dash: tuple[int, int, int] = (214, 198, 255)
 
 
+def _premultiplied(surface: pygame.Surface) -> pygame.Surface:
+    # convert_alpha() first: premul_alpha() mishandles padded rows, which font.render produces.
+    return surface.convert_alpha().premul_alpha()
+
+
+class TextWidget:
+    """A shadowed text label that re-renders only when its text changes.
+
+    The cached image is premultiplied so it composites exactly onto both the
+    screen and partially transparent layers; blit it with
+    ``BLEND_PREMULTIPLIED`` (as :meth:`blit` does).
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        color: tuple[int, int, int],
+        *,
+        shadow_offset: tuple[int, int] = (1, 1),
+        shadow_color: tuple[int, int, int] = (0, 0, 0),
+    ) -> None:
+        self.font = font
+        self.color = color
+        self.shadow_offset = shadow_offset
+        self.shadow_color = shadow_color
+        self._text: Optional[str] = None
+        self._image: Optional[pygame.Surface] = None
+
+    def render(self, text: str) -> pygame.Surface:
+        """Text and shadow baked into one premultiplied surface."""
+
+        if text != self._text or self._image is None:
+            text_surface = self.font.render(text, True, self.color)
+            dx, dy = self.shadow_offset
+            image = pygame.Surface(
+                (text_surface.get_width() + abs(dx), text_surface.get_height() + abs(dy)),
+                pygame.SRCALPHA,
+            )
+            if (dx, dy) != (0, 0):
+                shadow = self.font.render(text, True, self.shadow_color)
+                image.blit(_premultiplied(shadow), (max(0, dx), max(0, dy)), special_flags=pygame.BLEND_PREMULTIPLIED)
+            image.blit(_premultiplied(text_surface), (max(0, -dx), max(0, -dy)), special_flags=pygame.BLEND_PREMULTIPLIED)
+            self._text = text
+            self._image = image
+        return self._image
+
+    def blit(self, surface: pygame.Surface, text: str, pos: tuple[int, int]) -> pygame.Rect:
+        dx, dy = self.shadow_offset
+        return surface.blit(
+            self.render(text),
+            (pos[0] - max(0, -dx), pos[1] - max(0, -dy)),
+            special_flags=pygame.BLEND_PREMULTIPLIED,
+        )
+
+
 class HudRenderer:
-    """Draws core player stats."""
+    """Draws core player stats.
+
+    The panel is composed into a cached layer: a static background (shadow,
+    textured panel, frames) baked once, plus widgets redrawn only when the
+    values they display change. A frame with unchanged values is one blit.
+    Layers hold premultiplied colour so translucent edges composite exactly.
+    """
+
+    PANEL_SIZE = (260, 176)
+    MARGIN = 24
+    # The facing widget sits above the panel; the layer starts there.
+    FACING_RISE = 80
+    SHADOW = (6, 8)
 
     def __init__(self, palette: Optional[HudPalette] = None) -> None:
         self.palette = palette or HudPalette()
@@ -59,6 +126,23 @@ class HudRenderer:
         self._level_up_text = ""
         self._panel_texture = self._load_panel_texture()
 
+        outline = self.palette.outline
+        self._hp_label = TextWidget(self.font, outline)
+        self._stamina_label = TextWidget(self.small, outline)
+        self._dash_label = TextWidget(self.small, outline)
+        self._weapon_label = TextWidget(self.small, outline)
+        self._level_label = TextWidget(self.small, outline, shadow_offset=(0, 0))
+        self._state_label = TextWidget(self.font, self.palette.panel_bg, shadow_offset=(0, 0))
+        self._level_up_label = TextWidget(self.big, outline, shadow_offset=(0, 2))
+
+        width, height = self.PANEL_SIZE
+        self._panel = pygame.Rect(0, self.FACING_RISE, width, height)
+        self._layer_size = (width + self.SHADOW[0], self.FACING_RISE + height + self.SHADOW[1])
+        self._background: Optional[pygame.Surface] = None
+        self._layer: Optional[pygame.Surface] = None
+        self._layer_values: Optional[tuple] = None
+        self.recomposed = 0
+
     def notify_level_up(self, level: int) -> None:
         self._level_up_timer = 2.0
         self._level_up_text = f"LEVEL UP! Lv {level}"
@@ -73,89 +157,121 @@ class HudRenderer:
         if self._level_up_timer > 0.0:
             self._level_up_timer = max(0.0, self._level_up_timer - dt)
 
-    def draw(self, surface: pygame.Surface, player, dash_cooldown: float) -> None:
-        margin = 24
-        panel_height = 176
-        panel_width = 260
-        panel_top = surface.get_height() - margin - panel_height
-        panel = pygame.Rect(margin, panel_top, panel_width, panel_height)
-        self._draw_panel(surface, panel)
+    # ------------------------------------------------------------------
+    def screen_rect(self, surface: pygame.Surface) -> pygame.Rect:
+        """Area of ``surface`` covered by the cached panel layer."""
 
-        bar_left = panel.x + 16
-        rect_hp = pygame.Rect(bar_left, panel.y + 24, panel.width - 32, 20)
-        rect_stamina = pygame.Rect(bar_left, rect_hp.bottom + 18, panel.width - 32, 14)
-        self._draw_bar(surface, rect_hp, player.hp / max(1.0, player.max_hp), self.palette.hp_color)
-        self._draw_bar(
-            surface,
-            rect_stamina,
-            player.stamina / max(1.0, player.max_stamina),
-            self.palette.stamina_color,
-        )
+        top = surface.get_height() - self.MARGIN - self.PANEL_SIZE[1] - self.FACING_RISE
+        return pygame.Rect((self.MARGIN, top), self._layer_size)
 
-        draw_text_with_shadow(
-            surface,
-            self.font,
+    def draw(self, surface: pygame.Surface, player, dash_cooldown: float) -> pygame.Rect:
+        """Draw the panel and return the screen area it covered."""
+
+        values = self._values(player, dash_cooldown)
+        if self._layer is None or values != self._layer_values:
+            self._compose(values)
+        area = self.screen_rect(surface)
+        surface.blit(self._layer, area, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+        if self._level_up_timer > 0.0:
+            width, _ = self.big.size(self._level_up_text)
+            pos = (surface.get_width() // 2 - width // 2, area.y + self.FACING_RISE - 40)
+            return area.union(self._level_up_label.blit(surface, self._level_up_text, pos))
+        return area
+
+    def _values(self, player, dash_cooldown: float) -> tuple:
+        """Everything the panel displays, quantised to what actually shows on screen."""
+
+        bar_width = self.PANEL_SIZE[0] - 32
+        hp_pct = max(0.0, min(1.0, player.hp / max(1.0, player.max_hp)))
+        stamina_pct = max(0.0, min(1.0, player.stamina / max(1.0, player.max_stamina)))
+        dash_pct = 1.0 - min(1.0, dash_cooldown / DASH_COOLDOWN) if DASH_COOLDOWN > 0 else 1.0
+        dash_ready = dash_pct >= 0.999
+        if player.state == "attack":
+            state = "ATTACKING"
+        elif player.state == "dash":
+            state = "DASHING"
+        elif player.move_intent.length_squared() > 0:
+            state = "MOVING"
+        else:
+            state = "IDLE"
+        return (
             f"HP {int(player.hp)}/{int(player.max_hp)}",
-            self.palette.outline,
-            (bar_left, rect_hp.y - 20),
-        )
-        draw_text_with_shadow(
-            surface,
-            self.small,
+            int(bar_width * hp_pct),
             f"STM {player.stamina:05.1f}",
-            self.palette.outline,
-            (bar_left, rect_stamina.y - 18),
+            int(bar_width * stamina_pct),
+            "Dash Ready" if dash_ready else f"Dash {dash_cooldown:.1f}s",
+            int(bar_width * max(0.0, min(1.0, dash_pct))),
+            dash_ready,
+            getattr(player, "orientation", "right" if player.facing == "right" else "left"),
+            state,
+            str(player.leveling.level),
+            f"Weapon: {player.weapon_item.name}",
         )
 
+    def _compose(self, values: tuple) -> None:
+        (hp_text, hp_fill, stamina_text, stamina_fill, dash_text, dash_fill,
+         dash_ready, orientation, state, level, weapon) = values
+        if self._background is None:
+            self._background = self._build_background()
+        if self._layer is None:
+            self._layer = pygame.Surface(self._layer_size, pygame.SRCALPHA)
+        layer = self._layer
+        layer.fill((0, 0, 0, 0))
+        layer.blit(self._background, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+        panel = self._panel
+        bar_left = panel.x + 16
+        rect_hp = pygame.Rect(bar_left, panel.y + 24, panel.width - 32, 20)
+        rect_stamina = pygame.Rect(bar_left, rect_hp.bottom + 18, panel.width - 32, 14)
         dash_rect = pygame.Rect(bar_left, rect_stamina.bottom + 24, panel.width - 32, 14)
-        pct = 1.0 - min(1.0, dash_cooldown / DASH_COOLDOWN) if DASH_COOLDOWN > 0 else 1.0
-        dash_color = self.palette.dash_ready if pct >= 0.999 else self.palette.dash_wait
-        self._draw_bar(surface, dash_rect, pct, dash_color)
-        dash_label = "Dash Ready" if pct >= 0.999 else f"Dash {dash_cooldown:.1f}s"
-        draw_text_with_shadow(surface, self.small, dash_label, self.palette.outline, (bar_left, dash_rect.y - 16))
+        self._draw_bar(layer, rect_hp, hp_fill, self.palette.hp_color)
+        self._draw_bar(layer, rect_stamina, stamina_fill, self.palette.stamina_color)
+        dash_color = self.palette.dash_ready if dash_ready else self.palette.dash_wait
+        self._draw_bar(layer, dash_rect, dash_fill, dash_color)
+
+        self._hp_label.blit(layer, hp_text, (bar_left, rect_hp.y - 20))
+        self._stamina_label.blit(layer, stamina_text, (bar_left, rect_stamina.y - 18))
+        self._dash_label.blit(layer, dash_text, (bar_left, dash_rect.y - 16))
 
-        self._draw_facing(surface, panel, player)
-        self._draw_state(surface, panel, player)
+        self._draw_facing(layer, panel, orientation)
+        self._draw_state(layer, panel, state)
 
-        level = player.leveling.level
         xp_y = dash_rect.bottom + 16
         level_radius = self.small.get_height() // 2 + 4
         level_center = (bar_left + level_radius, xp_y + self.small.get_height() // 2)
-        pygame.draw.circle(surface, self.palette.bar_bg, level_center, level_radius)
-        pygame.draw.circle(surface, self.palette.outline, level_center, level_radius, 2)
-        level_surface = self.small.render(str(level), True, self.palette.outline)
-        level_rect = level_surface.get_rect(center=level_center)
-        surface.blit(level_surface, level_rect)
+        pygame.draw.circle(layer, self.palette.bar_bg, level_center, level_radius)
+        pygame.draw.circle(layer, self.palette.outline, level_center, level_radius, 2)
+        level_surface = self._level_label.render(level)
+        layer.blit(level_surface, level_surface.get_rect(center=level_center), special_flags=pygame.BLEND_PREMULTIPLIED)
 
+        weapon_width, _ = self.small.size(weapon)
+        self._weapon_label.blit(layer, weapon, (panel.right - 60 - weapon_width, panel.y + 24))
 
-        weapon_label = f"Weapon: {player.weapon_item.name}"
-        weapon_width, _ = self.small.size(weapon_label)
-        weapon_pos = (panel.right - 60 - weapon_width, panel.y + 24)
-        draw_text_with_shadow(surface, self.small, weapon_label, self.palette.outline, weapon_pos)
+        self._layer_values = values
+        self.recomposed += 1
 
-        if self._level_up_timer > 0.0:
-            width, _ = self.big.size(self._level_up_text)
-            pos = (surface.get_width() // 2 - width // 2, panel.y - 40)
-            draw_text_with_shadow(
-                surface,
-                self.big,
-                self._level_up_text,
-                self.palette.outline,
-                pos,
-                shadow_offset=(0, 2),
-            )
+    def _build_background(self) -> pygame.Surface:
+        """Static parts of the panel: shadow, texture, glow, frames and captions."""
 
-    def _draw_bar(self, surface: pygame.Surface, rect: pygame.Rect, pct: float, color: tuple[int, int, int]) -> None:
-        pct = max(0.0, min(1.0, pct))
+        layer = pygame.Surface(self._layer_size, pygame.SRCALPHA)
+        self._draw_panel(layer, self._panel)
+        area = self._facing_area(self._panel)
+        pygame.draw.rect(layer, self.palette.bar_bg, area, border_radius=8)
+        pygame.draw.rect(layer, self.palette.outline, area, 1, border_radius=8)
+        TextWidget(self.small, self.palette.outline).blit(layer, "Direction", (area.x, area.bottom + 4))
+        return layer
+
+    def _draw_bar(self, surface: pygame.Surface, rect: pygame.Rect, fill_width: int, color: tuple[int, int, int]) -> None:
         pygame.draw.rect(surface, self.palette.bar_bg, rect, border_radius=6)
         fill = rect.copy()
-        fill.width = int(rect.width * pct)
+        fill.width = fill_width
         if fill.width > 0:
             pygame.draw.rect(surface, color, fill, border_radius=6)
         pygame.draw.rect(surface, self.palette.outline, rect, 1, border_radius=6)
 
     def _draw_panel(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
-        shadow = rect.move(6, 8)
+        shadow = rect.move(*self.SHADOW)
         pygame.draw.rect(surface, self.palette.panel_shadow, shadow, border_radius=14)
 
         panel_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
@@ -169,16 +285,15 @@ class HudRenderer:
         glow = pygame.Surface(rect.size, pygame.SRCALPHA)
         pygame.draw.rect(glow, (*self.palette.panel_highlight, 48), glow.get_rect(), border_radius=12)
         panel_surface.blit(glow, (0, 0))
-        surface.blit(panel_surface, rect)
+        surface.blit(_premultiplied(panel_surface), rect, special_flags=pygame.BLEND_PREMULTIPLIED)
         pygame.draw.rect(surface, self.palette.outline, rect, 2, border_radius=12)
 
-    def _draw_facing(self, surface: pygame.Surface, panel: pygame.Rect, player) -> None:
-        area = pygame.Rect(panel.x + panel.width - (260), panel.y + (-80), 48, 48)
-        pygame.draw.rect(surface, self.palette.bar_bg, area, border_radius=8)
-        pygame.draw.rect(surface, self.palette.outline, area, 1, border_radius=8)
-        arrow_center = area.center
+    def _facing_area(self, panel: pygame.Rect) -> pygame.Rect:
+        return pygame.Rect(panel.x + panel.width - (260), panel.y + (-80), 48, 48)
+
+    def _draw_facing(self, surface: pygame.Surface, panel: pygame.Rect, orientation: str) -> None:
+        arrow_center = self._facing_area(panel).center
         size = 18
-        orientation = getattr(player, "orientation", "right" if player.facing == "right" else "left")
         if orientation == "right":
             points = [
                 (arrow_center[0] + size // 2, arrow_center[1]),
@@ -204,27 +319,19 @@ class HudRenderer:
                 (arrow_center[0] + size // 2, arrow_center[1] - size // 2),
             ]
         pygame.draw.polygon(surface, self.palette.outline, points)
-        draw_text_with_shadow(surface, self.small, "Direction", self.palette.outline, (area.x, area.bottom + 4))
 
-    def _draw_state(self, surface: pygame.Surface, panel: pygame.Rect, player) -> None:
+    def _draw_state(self, surface: pygame.Surface, panel: pygame.Rect, state: str) -> None:
         base = pygame.Rect(panel.x + 16, panel.bottom - 36, panel.width - 32, 20)
-        if player.state == "attack":
+        if state == "ATTACKING":
             color = self.palette.state_attack
-            text = "ATTACKING"
-        elif player.state == "dash":
+        elif state == "DASHING":
             color = self.palette.state_dash
-            text = "DASHING"
-        elif player.move_intent.length_squared() > 0:
-            color = self.palette.state_idle
-            text = "MOVING"
         else:
             color = self.palette.state_idle
-            text = "IDLE"
         pygame.draw.rect(surface, color, base, border_radius=6)
         pygame.draw.rect(surface, self.palette.outline, base, 1, border_radius=6)
-        label = self.font.render(text, True, self.palette.panel_bg)
-        label_rect = label.get_rect(center=base.center)
-        surface.blit(label, label_rect)
+        label = self._state_label.render(state)
+        surface.blit(label, label.get_rect(center=base.center), special_flags=pygame.BLEND_PREMULTIPLIED)
 
 
 class InventoryOverlay:
@@ -267,7 +374,7 @@ class InventoryOverlay:
         except ValueError:
             return None
 
-    def draw(self, surface: pygame.Surface, inventory: Inventory, gold: int) -> None:
+    def draw(self, surface: pygame.Surface, inventory: Inventory, gold: int) -> pygame.Rect:
         width = 440
         height = 420
         panel = pygame.Rect(36, surface.get_height() - height - 36, width, height)
@@ -329,6 +436,8 @@ class InventoryOverlay:
         )
         if self._message:
             draw_text_with_shadow(surface, self.small, self._message, (255, 226, 176), (panel.x + 18, panel.bottom - 28))
+        # The drop shadow in _draw_panel reaches past the panel itself.
+        return panel.union(panel.move(8, 10))
 
     def _load_panel_texture(self) -> Optional[pygame.Surface]:
         try:
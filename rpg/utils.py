@@ -8,11 +8,27 @@ from typing import Iterable, List, Tuple
 
 import pygame
 
+from . import bake
+from .constants import SNAP_DISTANCE
+
 
 def clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
 
+def interpolate(
+    prev: pygame.Vector2,
+    current: pygame.Vector2,
+    alpha: float,
+    snap: float = SNAP_DISTANCE,
+) -> pygame.Vector2:
+    """Draw position ``alpha`` of the way from the previous sim step to the current one."""
+
+    if alpha >= 1.0 or prev.distance_squared_to(current) > snap * snap:
+        return pygame.Vector2(current)
+    return prev.lerp(current, max(0.0, alpha))
+
+
 def vnorm(vec: pygame.Vector2) -> pygame.Vector2:
     if vec.length_squared():
         vec = vec.normalize()
@@ -56,21 +72,44 @@ def load_anim_folder(
 
 _warned_fonts: set[int] = set()
 
+# Every Font in the game comes from here. Creating fonts (SysFont especially) is
+# slow, so draw paths must only ever look one up.
+_font_registry: dict[tuple[str | None, int], pygame.font.Font] = {}
+
+
+def get_font(name: str | None, size: int) -> pygame.font.Font:
+    """Shared font by system name (``None`` for pygame's default font)."""
+
+    key = (name, size)
+    font = _font_registry.get(key)
+    if font is None:
+        font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+        _font_registry[key] = font
+    return font
+
 
 def load_pixel_font(size: int) -> pygame.font.Font:
     """Load a pixel font with graceful fallback."""
 
+    key = ("<pixel>", size)
+    font = _font_registry.get(key)
+    if font is not None:
+        return font
+
     path = os.path.join("assets", "fonts", "pixel.ttf")
     if os.path.isfile(path):
         try:
-            return pygame.font.Font(path, size)
+            font = pygame.font.Font(path, size)
         except pygame.error:
             print(f"[warn] failed to load pixel font at {path}, falling back")
 
-    if size not in _warned_fonts:
-        print(f"[warn] pixel font missing, using default at size {size}")
-        _warned_fonts.add(size)
-    return pygame.font.SysFont("Courier New", size)
+    if font is None:
+        if size not in _warned_fonts:
+            print(f"[warn] pixel font missing, using default at size {size}")
+            _warned_fonts.add(size)
+        font = get_font("Courier New", size)
+    _font_registry[key] = font
+    return font
 
 
 def iter_sprites_rects(group: Iterable[pygame.sprite.Sprite]) -> Iterable[pygame.Rect]:
@@ -83,7 +122,10 @@ def iter_sprites_rects(group: Iterable[pygame.sprite.Sprite]) -> Iterable[pygame
 # ---------------------------------------------------------------------------
 # Asset helpers --------------------------------------------------------------
 
-_sheet_cache: dict[tuple[str, float], list[pygame.Surface]] = {}
+# Process-wide frame atlas: every (sheet, slicing, scale) is decoded once and the
+# resulting frames are shared by all callers. Treat them as read-only and copy a
+# frame before drawing onto it.
+_frame_atlas: dict[tuple, tuple[pygame.Surface, ...]] = {}
 _tile_cache: dict[tuple[str, float], pygame.Surface] = {}
 
 
@@ -117,6 +159,77 @@ def _slice_sheet(
     return frames
 
 
+def _atlas_frames(
+    image: pygame.Surface,
+    tile_size: Tuple[int, int],
+    *,
+    scale: float = 1.0,
+    spacing: int = 0,
+    margin: int = 0,
+) -> tuple[pygame.Surface, ...]:
+    """Scale the sheet once and hand out subsurfaces of it.
+
+    Falls back to :func:`_slice_sheet` when the scale does not map tiles onto
+    whole pixels, where scaling the sheet would not match per-frame scaling.
+    """
+
+    tile_w, tile_h = tile_size
+    width, height = image.get_size()
+    exact = all(float(v * scale).is_integer() for v in (tile_w, tile_h, spacing, margin, width, height))
+    if not exact:
+        return tuple(_slice_sheet(image, tile_size, scale=scale, spacing=spacing, margin=margin))
+
+    sheet = image
+    if scale != 1.0:
+        sheet = pygame.transform.scale(image, (int(width * scale), int(height * scale)))
+    bounds = sheet.get_rect()
+    rects: List[pygame.Rect] = []
+    y = margin
+    while y + tile_h <= height - margin + spacing:
+        x = margin
+        while x + tile_w <= width - margin + spacing:
+            rects.append(pygame.Rect(int(x * scale), int(y * scale), int(tile_w * scale), int(tile_h * scale)))
+            x += tile_w + spacing
+        y += tile_h + spacing
+    if not all(bounds.contains(rect) for rect in rects):
+        return tuple(_slice_sheet(image, tile_size, scale=scale, spacing=spacing, margin=margin))
+    return tuple(sheet.subsurface(rect) for rect in rects)
+
+
+def sheet_frames(
+    path: str | os.PathLike[str],
+    tile_size: Tuple[int, int],
+    *,
+    scale: float = 1.0,
+    spacing: int = 0,
+    margin: int = 0,
+) -> tuple[pygame.Surface, ...]:
+    """Shared, read-only frames of a sprite sheet from the frame atlas."""
+
+    key = (os.fspath(path), tuple(tile_size), scale, spacing, margin)
+    frames = _frame_atlas.get(key)
+    if frames is None:
+        baked = bake.lookup(bake.sheet_key(path, tile_size, scale, spacing, margin))
+        if baked is not None:
+            frames = tuple(baked)
+        else:
+            frames = _decode_sheet(path, tile_size, scale=scale, spacing=spacing, margin=margin)
+        _frame_atlas[key] = frames
+    return frames
+
+
+def _decode_sheet(
+    path: str | os.PathLike[str],
+    tile_size: Tuple[int, int],
+    *,
+    scale: float = 1.0,
+    spacing: int = 0,
+    margin: int = 0,
+) -> tuple[pygame.Surface, ...]:
+    surface = pygame.image.load(os.fspath(path)).convert_alpha()
+    return _atlas_frames(surface, tile_size, scale=scale, spacing=spacing, margin=margin)
+
+
 def load_sheet(
     path: str | os.PathLike[str],
     tile_size: Tuple[int, int],
@@ -125,34 +238,59 @@ def load_sheet(
     spacing: int = 0,
     margin: int = 0,
 ) -> List[pygame.Surface]:
-    """Load and split a sprite sheet, caching the result."""
+    """Load and split a sprite sheet via the shared frame atlas.
 
-    key = (os.fspath(path), scale)
-    if key in _sheet_cache:
-        return [frame.copy() for frame in _sheet_cache[key]]
+    The list is fresh but the frames are shared; copy one before mutating it.
+    """
 
-    surface = pygame.image.load(os.fspath(path)).convert_alpha()
-    frames = _slice_sheet(surface, tile_size, scale=scale, spacing=spacing, margin=margin)
-    _sheet_cache[key] = [frame.copy() for frame in frames]
-    return [frame.copy() for frame in frames]
+    return list(sheet_frames(path, tile_size, scale=scale, spacing=spacing, margin=margin))
+
+
+def surface_bytes(surfaces: Iterable[pygame.Surface]) -> int:
+    """Pixel memory behind ``surfaces``, counting shared atlas sheets once."""
+
+    seen = set()
+    total = 0
+    for surface in surfaces:
+        owner = surface.get_abs_parent()
+        if id(owner) in seen:
+            continue
+        seen.add(id(owner))
+        total += owner.get_width() * owner.get_height() * owner.get_bytesize()
+    return total
+
+
+def asset_cache_bytes() -> int:
+    """Pixel memory held by the frame atlas, the tile cache and the sprite variant cache."""
+
+    from .variants import variants
+
+    frames = [frame for frames in _frame_atlas.values() for frame in frames]
+    return surface_bytes(frames + list(_tile_cache.values()) + list(variants.surfaces()))
 
 
 def load_desert_tile(category: str, index: int, *, scale: float = 1.0) -> pygame.Surface:
-    """Load a single tile from the desert shooter asset pack."""
+    """Load a single tile from the desert shooter asset pack (shared, read-only)."""
 
     base = Path("assets") / "desert-shooter" / "PNG" / category / "Tiles" / f"tile_{index:04d}.png"
     key = (str(base), scale)
     if key in _tile_cache:
-        return _tile_cache[key].copy()
-    if not base.is_file():
-        raise FileNotFoundError(f"Missing desert shooter tile: {base}")
-    surface = pygame.image.load(str(base)).convert_alpha()
+        return _tile_cache[key]
+    baked = bake.lookup(bake.tile_key(base, scale))
+    surface = baked[0] if baked else _decode_tile(base, scale)
+    _tile_cache[key] = surface
+    return surface
+
+
+def _decode_tile(path: Path, scale: float) -> pygame.Surface:
+    if not path.is_file():
+        raise FileNotFoundError(f"Missing desert shooter tile: {path}")
+    surface = pygame.image.load(str(path)).convert_alpha()
     if scale != 1.0:
         w = max(1, int(surface.get_width() * scale))
         h = max(1, int(surface.get_height() * scale))
         surface = pygame.transform.scale(surface, (w, h))
-    _tile_cache[key] = surface
-    return surface.copy()
+    return surface
 
 
 def load_desert_sheet(category: str, *, scale: float = 1.0) -> List[pygame.Surface]:
@@ -0,0 +1,74 @@
+"""Shared cache of derived sprite frames: mirrored, hurt-tinted and with an overlay."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+Tint = Tuple[int, int, int, int]
+
+# Enough for every player, enemy and swarm frame in all their variants at once.
+MAX_VARIANTS = 1024
+
+
+class VariantCache:
+    """Least-recently-used cache of ``frame`` variants, keyed by (frame, flip, tint, overlay).
+
+    Frames are keyed by identity, so the source surfaces must not be drawn
+    on after their variants are made. A variant is built from the frame in a
+    fixed order: mirrored, then multiplied by ``tint``, then ``overlay`` is
+    blitted on top. Returned surfaces are shared and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_entries: int = MAX_VARIANTS) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        frame: pygame.Surface,
+        *,
+        flip: bool = False,
+        tint: Optional[Tint] = None,
+        overlay: Optional[pygame.Surface] = None,
+    ) -> pygame.Surface:
+        if not flip and tint is None and overlay is None:
+            return frame
+        key = (frame, flip, tint, overlay)
+        entries = self._entries
+        variant = entries.get(key)
+        if variant is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return variant
+        self.misses += 1
+        if overlay is not None:
+            variant = self.get(frame, flip=flip, tint=tint).copy()
+            variant.blit(overlay, (0, 0))
+        elif tint is not None:
+            variant = self.get(frame, flip=flip).copy()
+            variant.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+        else:
+            variant = pygame.transform.flip(frame, True, False)
+        entries[key] = variant
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return variant
+
+    def surfaces(self):
+        return self._entries.values()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+variants = VariantCache()